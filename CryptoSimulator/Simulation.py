@@ -1,13 +1,17 @@
-import argparse
+import importlib
 import inspect
 import os
-from importlib.machinery import SourceFileLoader
-from pathlib import Path
+from itertools import chain
 
 from CryptoSimulator.library_built_in.sim_ops import leave
+from CryptoSimulator.scheduler import Scheduler, EventQueue
+from CryptoSimulator.streams import RandomStreams, activate
 from interpreter import SimulationInterpreter
 from interpreter.tree_interpreter import TrowableReturnContainer
 
+# Simulation.interpreter of every cache_dir
+_interpreters: dict = dict()
+
 
 class Simulation:
     def __init__(self):
@@ -19,9 +23,17 @@ class Simulation:
         self.end_time = 1
         self.step_size = 10
         self.verbose = True
+        self.log_trades = True  # every reset turns verbose back to this
         self.repetitions = 1
+        self.vectorized = False
+        self.event_driven = False
+        self.scheduler = Scheduler()
+        self.baseline: list | None = None
+        self.seed = None
+        self.rngs: dict = dict()
 
-    def set_params(self, coins, traders, *, init_time=1, endtime, step_size=10, repetitions=1):
+    def set_params(self, coins, traders, *, init_time=1, endtime, step_size=10, repetitions=1, vectorized=0,
+                   event_driven=0, seed=None):
         self.wallet: list = coins
         self.traders: list = traders
         self.leaved: set = set()
@@ -30,6 +42,10 @@ class Simulation:
         self.end_time = endtime
         self.step_size = step_size
         self.repetitions = repetitions
+        self.vectorized = bool(vectorized)
+        self.event_driven = bool(event_driven)
+        self.seed = seed
+        self.scheduler.set_grid(init_time, step_size)
 
     @staticmethod
     def _plot(names, values, graph_name=""):
@@ -57,13 +73,17 @@ class Simulation:
                 fig.savefig(pp, format='pdf')
             pp.close()
 
+    @staticmethod
+    def _module_files(path) -> list:
+        folder = os.path.join(os.path.dirname(__file__), path)
+        return sorted(os.path.join(folder, name) for name in os.listdir(folder) if name.endswith(".py"))
+
     @staticmethod
     def _reflected_load(path, predicate) -> dict:
-        currentdir = os.path.dirname(__file__)
-        agents = Path(os.path.join(currentdir, path)).glob("*.py")
         loaded = dict()
-        for file in agents:
-            module = SourceFileLoader(str(file), str(file)).load_module()
+        for file in Simulation._module_files(path):
+            # the same module objects the rest of the code imports, executed once per process
+            module = importlib.import_module(f"CryptoSimulator.{path}.{os.path.basename(file)[:-3]}")
             for name, class_ in inspect.getmembers(module, predicate):
                 name: str
                 if not name.startswith("_"):
@@ -71,35 +91,168 @@ class Simulation:
         return loaded
 
     @staticmethod
-    def load(simulation_file):
+    def interpreter(cache_dir=None) -> SimulationInterpreter:
+        '''
+        one interpreter per cache_dir and process, so loading an edited simulation again only reprocesses what changed
+        with a cache_dir (or the SIM_CACHE_DIR environment variable) the checked simulations are kept on disk, they are
+        reused while this file, the simulation and the agents and built ins modules stay the same
+        '''
+        if (res := _interpreters.get(cache_dir, None)) is None:
+            res = _interpreters[cache_dir] = Simulation._new_interpreter(cache_dir)
+        return res
+
+    @staticmethod
+    def _new_interpreter(cache_dir=None) -> SimulationInterpreter:
         agent_templates = Simulation._reflected_load("agents", inspect.isclass)
         builtins = Simulation._reflected_load("library_built_in", inspect.isfunction)
-        code = simulation_file.read()
-        simulation_file.close()
         sim_opts = filter(lambda p: p.kind == inspect.Parameter.KEYWORD_ONLY,
                           inspect.signature(Simulation.set_params).parameters.values())
         sim_opts = set(map(lambda p: p.name, sim_opts))
-        interpr = SimulationInterpreter(builtins, agent_templates, sim_opts)
+        dependencies = []
+        for file in chain([__file__], Simulation._module_files("agents"), Simulation._module_files("library_built_in")):
+            with open(file, "rb") as source:
+                dependencies.append(source.read())
+        interpr = SimulationInterpreter(builtins, agent_templates, sim_opts, dependencies, cache_dir)
+        return interpr
+
+    @staticmethod
+    def load(simulation_file, cache_dir=None, incremental=False):
+        '''
+        simulation ready to run from a CryptoLang file, by default the lexer reads the file in chunks while parsing
+        the caches are keyed by the text so with a cache_dir the file is read whole to look it up on disk, and with
+        incremental it is read whole to go through the declarations cache of the interpreter, then loading an edited
+        file again in this process only reprocesses the declarations the edit affects
+        '''
+        interpr = Simulation.interpreter(cache_dir)
         sim = Simulation()
-        coins, traders, opts = interpr.interpret_simulation(code, sim)
+        with simulation_file:
+            coins, traders, opts = interpr.interpret_simulation(
+                simulation_file.read() if incremental else simulation_file, sim)
         sim.set_params(coins, traders, **opts)
         return sim
 
+    def wake_at(self, agent, time):
+        self.scheduler.wake_at(agent, time)
+
+    def wake_on_price(self, agent, coin, threshold):
+        self.scheduler.wake_on_price(agent, coin, threshold)
+
+    @staticmethod
+    def _copy_state(state: dict) -> dict:
+        # one level structural copy, behaviors mutate the containers in place (wallets, registered params...)
+        return {attr: value.copy() if isinstance(value, (dict, list, set)) else value for attr, value in state.items()}
+
+    def snapshot(self) -> list:
+        '''
+        complete state of every agent, custom attributes included
+        '''
+        res = [(agent, self._copy_state(vars(agent))) for agent in chain(self.wallet, self.traders)]
+        return res
+
+    def restore(self, snapshot: list):
+        for agent, state in snapshot:
+            agent_state = vars(agent)
+            agent_state.clear()
+            agent_state.update(self._copy_state(state))
+
     def reset(self):
         self.time = self.init_time
-        self.verbose = True
+        self.verbose = self.log_trades
         self.leaved.clear()
+        self.scheduler.clear()
+        if self.baseline is not None:
+            self.restore(self.baseline)
+            return
+        # no baseline while initializing, just the known state
         for coin in self.wallet:
             coin.value = coin.base_value
         for trader in self.traders:
             trader.money = trader.initial_money
             trader.wallet.clear()
 
-    def run(self):
+    def _record(self, present, crowds, coins_values, traders_values):
+        coins_values.append((self.time, [coin.value for coin in self.wallet]))
+        t_v = [trader.money for trader in present]
+        for population in crowds:
+            t_v.extend(population.active_money())
+        traders_values.append((self.time, t_v))
+
+    def _run_steps(self, traders, crowds, coins_values, traders_values):
+        scheduler = self.scheduler
+        while self.time < self.end_time:
+            for coin in self.wallet:
+                if scheduler.awake(coin, self.time):
+                    activate(self.rngs[coin])
+                    coin.update_parameters()
+                    scheduler.fire(coin, self.time)
+            present = [trader for trader in traders if trader not in self.leaved]
+            for trader in present:
+                if scheduler.awake(trader, self.time):
+                    activate(self.rngs[trader])
+                    trader.trade()
+            for population in crowds:
+                activate(self.rngs[population])
+                population.trade()
+            self._record(present, crowds, coins_values, traders_values)
+            self.time += self.step_size
+
+    def _run_events(self, traders, crowds, coins_values, traders_values):
+        '''
+        discrete event loop, only the agents with something to do at a time are woken
+        agents that do not sleep or wait for prices act at the same times and order of the step loop
+        '''
+        scheduler = self.scheduler
+        queue = EventQueue()
+        phases = {coin: (0, i) for i, coin in enumerate(self.wallet)}
+        phases.update({trader: (1, i) for i, trader in enumerate(chain(traders, crowds))})
+        for agent, (phase, index) in phases.items():
+            queue.push(self.time, phase, index, agent)
+        last_time = self.time
+        while (time := queue.peek_time()) < self.end_time:
+            self.time = last_time = time
+            present = [trader for trader in traders if trader not in self.leaved]
+            while queue.peek_time() == time:
+                _, agent = queue.pop()
+                if agent in self.leaved:
+                    continue
+                scheduler.forget(agent)
+                activate(self.rngs[agent])
+                phase, index = phases[agent]
+                if phase == 0:
+                    agent.update_parameters()
+                    for woken in scheduler.fire(agent, time):
+                        queue.push(time, *phases[woken], woken)
+                else:
+                    agent.trade()
+                if agent not in self.leaved and (nxt := scheduler.next_wake(agent, time, self.step_size)) is not None:
+                    queue.push(nxt, phase, index, agent)
+            self._record(present, crowds, coins_values, traders_values)
+        self.time = last_time
+        while self.time < self.end_time:  # land where the step loop would have finished
+            self.time += self.step_size
+
+    def run(self, plot=True) -> dict:
+        '''
+        returns the average money of every trader over the repetitions, plot=False skips the figures
+        with a seed the runs are reproducible, each agent draws from a stream of its own, but a vectorized population
+        draws the numbers of all its lanes at once from the stream of its first member, so the same seed gives other
+        (equally distributed) results with vectorized than trader by trader
+        '''
         traders = list(self.traders)
         print("Initializing Traders")
-        for trader in traders:
+        self.baseline = None
+        random_streams = RandomStreams(self.seed)
+        for i, trader in enumerate(traders):
+            activate(random_streams.initialization(i))
             trader.initialize()
+        self.reset()
+        self.baseline = self.snapshot()  # repetitions start exactly from the initialized agents
+        populations = []
+        from CryptoSimulator.vectorized import group_populations, TraderPopulation  # numpy is only needed to run
+        if self.vectorized:
+            # homogeneous traders run together, keep them contiguous so the values follow the names order
+            traders, populations = group_populations(traders)
+            traders.extend(chain.from_iterable(populations))
         coins_values = []
         traders_values = []
         traders_average = [0] * len(traders)
@@ -112,20 +265,17 @@ class Simulation:
             self.reset()
             coins_values.clear()
             traders_values.clear()
-            while self.time < self.end_time:
-                c_v = []
-                for coin in self.wallet:
-                    coin.update_parameters()
-                    c_v.append(coin.value)
-                coins_values.append((self.time, c_v))
-
-                t_v = []
-                for trader in traders:
-                    if trader not in self.leaved:
-                        trader.trade()
-                        t_v.append(trader.money)
-                traders_values.append((self.time, t_v))
-                self.time += self.step_size
+            scalar_traders = traders[:len(traders) - sum(map(len, populations))]
+            crowds = [TraderPopulation(members, self) for members in populations]
+            self.rngs = random_streams.repetition(index, list(chain(self.wallet, self.traders)))
+            for population in crowds:  # a population draws from the stream of its first member, see above
+                self.rngs[population] = self.rngs[population.members[0]]
+            if self.event_driven:
+                self._run_events(scalar_traders, crowds, coins_values, traders_values)
+            else:
+                self._run_steps(scalar_traders, crowds, coins_values, traders_values)
+            for population in crowds:
+                population.scatter()
             t_v = []
             for i, trader in enumerate(traders):
                 try:
@@ -135,19 +285,27 @@ class Simulation:
                 traders_average[i] += trader.money
                 t_v.append(trader.money)
             traders_values.append((self.time, t_v))
-            Simulation._plot(coins_name, coins_values, f"Coins Sim:{index}")
-            Simulation._plot(traders_name, traders_values, f"Traders Sim:{index}")
+            if plot:
+                Simulation._plot(coins_name, coins_values, f"Coins Sim:{index}")
+                Simulation._plot(traders_name, traders_values, f"Traders Sim:{index}")
 
         print("\n#### RESULTS ####")
+        results = dict()
         for trader, money in zip(traders, traders_average):
-            print(f"{trader.name} : {money / self.repetitions}")
-        print("Plotting")
-        Simulation._makefigs()
+            results[trader.name] = money / self.repetitions
+            print(f"{trader.name} : {results[trader.name]}")
+        if plot:
+            print("Plotting")
+            Simulation._makefigs()
+        return results
 
 
 if __name__ == "__main__":
+    import argparse
+
     argsparser = argparse.ArgumentParser()
     argsparser.add_argument('file', help="CryptoLang Simulation File", type=argparse.FileType('r'))
+    argsparser.add_argument('--cache-dir', help="Directory keeping the checked simulations between runs")
     args = argsparser.parse_args()
-    s = Simulation.load(args.file)
+    s = Simulation.load(args.file, args.cache_dir)
     s.run()
@@ -1,15 +1,16 @@
 import itertools
-import random
 
+from CryptoSimulator import streams
 from CryptoSimulator.library_built_in.genetic_meta import genetic_flow
 
 
 class TraderGenericTemplate:
 
-    def __init__(self, name, *, initial_money):
+    def __init__(self, name, *, initial_money, population=1):
         self.name = name
         self.money = initial_money
         self.initial_money = initial_money
+        self.population = population  # how many traders of this declaration trade in the market
         self.wallet: dict[str, int] = dict()
 
     def __hash__(self):
@@ -30,8 +31,8 @@ class TraderGenericTemplate:
 
 
 class TraderGeneticTemplate(TraderGenericTemplate):
-    def __init__(self, name, *, initial_money, population_size=20):
-        super().__init__(name, initial_money=initial_money)
+    def __init__(self, name, *, initial_money, population=1, population_size=20):
+        super().__init__(name, initial_money=initial_money, population=population)
         self.population_size = population_size
         self.optimized_attrs = []
         self.population_funcs = dict()
@@ -53,6 +54,7 @@ class TraderGeneticTemplate(TraderGenericTemplate):
     @staticmethod
     def optimize(gens, step_div=20, selection_div=5, *, market, my):
         print()
+        rng = streams.active()  # stream of the trader that is initializing
 
         def populatefunc():
             solutions = []
@@ -63,7 +65,7 @@ class TraderGeneticTemplate(TraderGenericTemplate):
                         resp = my.population_funcs[param]()
                         sol.append(resp)
                     else:
-                        sol.append(random.uniform(0, 1))
+                        sol.append(rng.uniform(0, 1))
                 solutions.append(sol)
             return solutions
 
@@ -101,8 +103,8 @@ class TraderGeneticTemplate(TraderGenericTemplate):
             # crossover strategy middle point
             new_gen = []
             for _ in range(my.population_size // 2):
-                sol1 = random.choice(solutions)
-                sol2 = random.choice(solutions)
+                sol1 = solutions[rng.integers(len(solutions))]
+                sol2 = solutions[rng.integers(len(solutions))]
                 half = len(sol1) // 2
                 new_sols1 = sol1[:half] + sol2[half:]
                 new_sols2 = sol2[:half] + sol1[half:]
@@ -119,7 +121,7 @@ class TraderGeneticTemplate(TraderGenericTemplate):
                         resp = my.mutation_funcs[param](val)
                         mut.append(resp)
                     else:
-                        resp = val + random.uniform(-0.1, 0.1)
+                        resp = val + rng.uniform(-0.1, 0.1)
                         resp = min(max(resp, 0), 1)
                         mut.append(resp)
                 mutated.append(mut)
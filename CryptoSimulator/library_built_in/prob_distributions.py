@@ -1,8 +1,6 @@
-import random
-from math import log
-from random import uniform
+from math import exp, log, pi, sqrt
 
-import numpy as np
+from CryptoSimulator import streams
 
 
 # First conf of simulation
@@ -13,7 +11,7 @@ def Uniform(lower=0, upper=1):
     # X ∼ U(a, b)~(b − a)U + a
     # can div to floor with 1 to get one discrete uniform with // 1 operation
     '''
-    u = uniform(0, 1)
+    u = streams.active().random()
     res = lower + (upper - lower) * u
     return res
 
@@ -24,7 +22,7 @@ def Exponential(l):
     exponential distribution params.. simulated via inverse transform
     X ~ −(1/λ)ln(U)
     """
-    u = uniform(0, 1)
+    u = streams.active().random()
     res = -(1 / l) * log(u)
     return res
 
@@ -38,7 +36,7 @@ def Poison(t, l0, l1=None):
     num = 0
     while total < t:
         num += 1
-        l = random.uniform(l0, l1) if l1 is not None else l0
+        l = streams.active().uniform(l0, l1) if l1 is not None else l0
         r = Exponential(l)
         total += r
     return num
@@ -49,7 +47,7 @@ def Bernoulli(p):
     bernoulli discrete distribution
     # X ∼ Ber(p)
     """
-    u = uniform(0, 1)
+    u = streams.active().random()
     res = 1 if u <= p else 0
     return res
 
@@ -58,14 +56,15 @@ def Normal(mean_p=0, std_p=1):
     """
     Normal distribution simulated via acept-rejection montecarlo algorithm
     """
-    density_gen = lambda x, mean, std: (1 / std * np.sqrt(2 * np.pi)) * np.exp((-1 / 2) * ((x - mean) / std) ** 2)
+    density_gen = lambda x, mean, std: (1 / std * sqrt(2 * pi)) * exp((-1 / 2) * ((x - mean) / std) ** 2)
     density_spec = lambda x: density_gen(x, mean_p, std_p)
     xmin = mean_p - 5 * std_p
     xmax = mean_p + 5 * std_p
     ymax = density_spec(mean_p) + 0.2
+    rng = streams.active()
     while True:
-        x = np.random.uniform(low=xmin, high=xmax)
-        y = np.random.uniform(low=0, high=ymax)
+        x = rng.uniform(low=xmin, high=xmax)
+        y = rng.uniform(low=0, high=ymax)
         if y < density_spec(x):
             return x #, y
 
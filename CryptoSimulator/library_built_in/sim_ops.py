@@ -1,8 +1,4 @@
-import random
-import logging
-logging.basicConfig(filename="output.log",filemode="w",level=logging.INFO)
-
-
+from CryptoSimulator import streams, trade_log
 from interpreter.tree_interpreter import TrowableReturnContainer
 
 
@@ -16,7 +12,7 @@ def say(str):
     '''
     alias for python print
     '''
-    logging.info(str)
+    trade_log.log(str)
 
 
 def pick_coin(idx, wallet):
@@ -48,7 +44,7 @@ def pick_random_coin(wallet):
     returns a random coin
     '''
     wallet = list(wallet.keys()) if isinstance(wallet, dict) else wallet
-    res = random.choice(wallet) if len(wallet) else 0
+    res = wallet[streams.active().integers(len(wallet))] if len(wallet) else 0
     return res
 
 
@@ -71,7 +67,7 @@ def buy(coin, amount=None, *, my, market):
     if amount == 0:
         return
     if amount is None:
-        amount = random.uniform(1, max(my.money,1))
+        amount = streams.active().uniform(1, max(my.money,1))
     if amount == "all":
         amount = my.money
     purchased = amount / coin.value
@@ -85,7 +81,7 @@ def buy(coin, amount=None, *, my, market):
     if my.money < 0.0001:
         my.money = 0  # avoid numerical errors on iee754 double
     if market.verbose:
-        logging.info(msg + f" -> After Money {my.money} , Wallet {my.wallet}")
+        trade_log.log(msg + f" -> After Money {my.money} , Wallet {my.wallet}")
 
 
 def sell(coin, amount=None, *, my, market):
@@ -95,7 +91,7 @@ def sell(coin, amount=None, *, my, market):
     if amount == 0:
         return
     if amount is None:
-        amount = random.uniform(0.0001, max(my.wallet[coin][0],0.0001))
+        amount = streams.active().uniform(0.0001, max(my.wallet[coin][0],0.0001))
     if amount == "all":
         amount = my.wallet[coin][0]
     msg = f"{market.time} {repr(my)} Attempt Sell {amount} of {coin.name}"
@@ -108,7 +104,21 @@ def sell(coin, amount=None, *, my, market):
         my.money += coin.value * amount
         my.wallet[coin] = after_purchase
     if market.verbose:
-        logging.info(msg + f" -> After Money {my.money} , Wallet {my.wallet}")
+        trade_log.log(msg + f" -> After Money {my.money} , Wallet {my.wallet}")
+
+
+def sleep(time, *, my, market):
+    '''
+    the agent will not act again until the given time elapses
+    '''
+    market.wake_at(my, market.time + time)
+
+
+def wake_on_price(coin, price, *, my, market):
+    '''
+    the agent sleeps until the value of the coin crosses the price, if it also sleeps the first to happen wakes it
+    '''
+    market.wake_on_price(my, coin, price)
 
 
 def leave(*, my, market):
@@ -120,5 +130,5 @@ def leave(*, my, market):
         sell(coin, amount, my=my, market=market)
     market.leaved.add(my)
     if market.verbose:
-        logging.info(f"{repr(my)} Left, Arrived with {my.initial_money} ")
+        trade_log.log(f"{repr(my)} Left, Arrived with {my.initial_money} ")
     raise TrowableReturnContainer(None)
@@ -0,0 +1,116 @@
+import heapq
+from math import inf
+
+
+class Scheduler:
+    '''
+    wake up times and price triggers requested by the agents, an agent with nothing requested acts every step
+    an agent waiting only for a trigger sleeps until the coin value crosses the threshold
+    '''
+
+    def __init__(self):
+        self.wake_times: dict = dict()
+        self.triggers: dict = dict()  # coin -> list of (agent, threshold, was_above)
+        self.origin = 0
+        self.step_size = 1
+
+    def set_grid(self, origin, step_size):
+        '''
+        times the simulation steps at, origin + k * step_size, wake up times are moved to them
+        '''
+        self.origin = origin
+        self.step_size = step_size
+
+    def clear(self):
+        self.wake_times.clear()
+        self.triggers.clear()
+
+    def on_grid(self, time):
+        '''
+        first step at or after the time, the step loop would wake an agent there, so the event loop does too
+        '''
+        steps = -(-(time - self.origin) // self.step_size)
+        return self.origin + steps * self.step_size
+
+    def wake_at(self, agent, time):
+        self.wake_times[agent] = self.on_grid(time)
+
+    def wake_on_price(self, agent, coin, threshold):
+        self.triggers.setdefault(coin, []).append((agent, threshold, coin.value > threshold))
+        self.wake_times.setdefault(agent, inf)
+
+    def awake(self, agent, time) -> bool:
+        '''
+        step mode check, an awake agent forgets what it requested before acting again
+        '''
+        if (wake := self.wake_times.get(agent, None)) is None:
+            return True
+        if wake > time:
+            return False
+        self.forget(agent)
+        return True
+
+    def next_wake(self, agent, time, step_size):
+        '''
+        event mode, time of the next action after acting at the given time, None if it waits for a trigger
+        '''
+        wake = self.wake_times.get(agent, None)
+        if wake is None:
+            return time + step_size
+        if wake == inf:
+            return None
+        if wake > time:
+            return wake
+        del self.wake_times[agent]
+        return time + step_size
+
+    def fire(self, coin, time) -> list:
+        '''
+        agents whose threshold was crossed by the new value of the coin, they are woken at the given time
+        '''
+        if not (triggers := self.triggers.get(coin, None)):
+            return []
+        fired = [agent for agent, threshold, was_above in triggers if (coin.value > threshold) != was_above]
+        for agent in fired:
+            self.wake_times[agent] = time
+            self._drop_triggers(agent)
+        return fired
+
+    def forget(self, agent):
+        self.wake_times.pop(agent, None)
+        self._drop_triggers(agent)
+
+    def _drop_triggers(self, agent):
+        for coin, triggers in self.triggers.items():
+            triggers[:] = [t for t in triggers if t[0] is not agent]
+
+
+class EventQueue:
+    '''
+    priority queue of agents actions ordered by time, coins before traders and declaration order
+    rescheduling an agent invalidates its previous event
+    '''
+
+    def __init__(self):
+        self.heap = []
+        self.pending: dict = dict()
+
+    def push(self, time, phase, index, agent):
+        if self.pending.get(agent, None) == time:
+            return
+        self.pending[agent] = time
+        heapq.heappush(self.heap, (time, phase, index, agent))
+
+    def peek_time(self):
+        self._discard_stale()
+        return self.heap[0][0] if self.heap else inf
+
+    def pop(self):
+        self._discard_stale()
+        time, _, _, agent = heapq.heappop(self.heap)
+        del self.pending[agent]
+        return time, agent
+
+    def _discard_stale(self):
+        while self.heap and self.pending.get(self.heap[0][3], None) != self.heap[0][0]:
+            heapq.heappop(self.heap)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# stream the built ins draw from, the simulation activates the one of the agent that is acting
+# numpy is imported by the first draw, loading and checking simulations does not need it
+_active: np.random.Generator | None = None
+
+
+def active() -> np.random.Generator:
+    global _active
+    if _active is None:
+        import numpy as np
+        _active = np.random.default_rng()
+    return _active
+
+
+def activate(generator: np.random.Generator):
+    global _active
+    _active = generator
+
+
+class RandomStreams:
+    '''
+    independent random streams derived from one seed with numpy SeedSequence
+    each stream is addressed by a spawn key so it does not depend on the order they are requested
+    '''
+    INITIALIZATION = 0
+    REPETITION = 1
+
+    def __init__(self, seed=None):
+        from numpy.random import SeedSequence
+        self.seed_sequence = SeedSequence(seed)
+
+    def stream(self, *key: int) -> np.random.Generator:
+        from numpy.random import SeedSequence, Generator, PCG64
+        child = SeedSequence(self.seed_sequence.entropy, spawn_key=key)
+        return Generator(PCG64(child))
+
+    def initialization(self, index: int) -> np.random.Generator:
+        return self.stream(self.INITIALIZATION, index)
+
+    def repetition(self, repetition: int, agents: list) -> dict:
+        res = {agent: self.stream(self.REPETITION, repetition, i) for i, agent in enumerate(agents)}
+        return res
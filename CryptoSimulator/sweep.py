@@ -0,0 +1,172 @@
+import contextlib
+import csv
+import inspect
+import io
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Dict, Iterator, List
+
+from CryptoSimulator.Simulation import Simulation
+from interpreter import ast_crypto as ast
+
+# interpreter and checked simulation of the worker processes, set once by _init_worker
+_worker: tuple | None = None
+
+
+def _value(text: str):
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_axis(spec: str) -> tuple[str, list]:
+    '''
+    "endtime=100,200" sweeps a simulation option, "Trader0.initial_money=50,100" an option of an agent declaration
+    '''
+    name, sep, values = spec.partition("=")
+    if not sep or not values:
+        raise ValueError(f"Invalid sweep axis {spec}, expected name=value,value...")
+    return name.strip(), [_value(value.strip()) for value in values.split(",")]
+
+
+def _check_axes(interpreter, simulation: ast.Simulation, axes: Dict[str, list]):
+    agents = {agent.name.name: agent.subtype.name for agent in simulation.agents}
+    for name in axes:
+        agent, _, option = name.rpartition(".")
+        if not agent:
+            if option not in interpreter.sim_opts:
+                raise Exception(f"Invalid simulation Option {option}")
+            continue
+        if agent not in agents:
+            raise Exception(f"Agent {agent} not defined")
+        parameters = inspect.signature(interpreter.agent_templates[agents[agent]].__init__).parameters.values()
+        if option not in {p.name for p in parameters if p.kind == inspect.Parameter.KEYWORD_ONLY}:
+            raise Exception(f"Agent subtype option not exists {name}")
+
+
+def grid(axes: Dict[str, list]) -> Iterator[tuple[int, dict]]:
+    '''
+    job number and parameters of every point of the grid, the last axis changes first
+    '''
+    names = list(axes)
+    for job, values in enumerate(product(*axes.values())):
+        yield job, dict(zip(names, values))
+
+
+def _overrides(params: dict) -> Dict[str, dict]:
+    res = dict()
+    for name, value in params.items():
+        agent, _, option = name.rpartition(".")
+        res.setdefault(agent or "options", dict())[option] = value
+    return res
+
+
+def _init_worker(simulation: ast.Simulation, cache_dir):
+    global _worker
+    _worker = (Simulation.interpreter(cache_dir), simulation)
+
+
+def run_job(job: int, params: dict) -> tuple[int, dict]:
+    '''
+    average money of every trader of one point of the grid, in a worker process already holding the simulation
+    '''
+    interpreter, simulation = _worker
+    sim = Simulation()
+    sim.log_trades = False  # the workers would write the same output.log
+    coins, traders, opts = interpreter.instantiate(simulation, sim, _overrides(params))
+    sim.set_params(coins, traders, **opts)
+    with contextlib.redirect_stdout(io.StringIO()):
+        res = sim.run(plot=False)
+    return job, res
+
+
+def _rows_per_job(interpreter, simulation: ast.Simulation, jobs: List[tuple[int, dict]]) -> Dict[int, int]:
+    '''
+    rows every job writes, one per trader once the populations of its parameters are instantiated
+    '''
+    return {job: len(interpreter.instantiate(simulation, Simulation(), _overrides(params))[1]) for job, params in jobs}
+
+
+def _done_jobs(out: str, header: List[str], rows_per_job: Dict[int, int]) -> set:
+    '''
+    jobs already in the output of an interrupted sweep, a job is done only when all its rows are there, the rows of the
+    jobs cut by the interruption are dropped and those jobs run again
+    '''
+    if not os.path.exists(out):
+        return set()
+    with open(out, "r+", newline="") as file:
+        lines = file.read().splitlines(keepends=True)
+        if lines and not lines[-1].endswith("\n"):
+            lines.pop()  # cut inside a row, even its job may be cut short
+        rows = list(csv.reader(lines))
+        if not rows:
+            return set()
+        if rows[0] != header:
+            raise Exception(f"{out} holds the results of another sweep")
+        counts = Counter(int(row[0]) for row in rows[1:])
+        done = {job for job, count in counts.items() if count == rows_per_job.get(job)}
+        file.seek(0)
+        file.write(lines[0] + "".join(line for line, row in zip(lines[1:], rows[1:]) if int(row[0]) in done))
+        file.truncate()
+    return done
+
+
+def sweep(source: str, axes: Dict[str, list], out: str, workers=None, resume=False, cache_dir=None) -> int:
+    '''
+    runs the simulation once per point of the grid of axes on a process pool, the source is parsed and checked once
+    and every worker gets the checked ast, results are appended to the out csv as jobs finish, one row per trader
+    (job, parameters..., trader, money), with resume the jobs already there are skipped
+    workers=0 runs the jobs in this process, returns the number of jobs run
+    '''
+    interpreter = Simulation.interpreter(cache_dir)
+    simulation = interpreter.compile(source)
+    _check_axes(interpreter, simulation, axes)
+    header = ["job"] + list(axes) + ["trader", "money"]
+    jobs = list(grid(axes))
+    done = _done_jobs(out, header, _rows_per_job(interpreter, simulation, jobs)) if resume else set()
+    jobs = [(job, params) for job, params in jobs if job not in done]
+    with open(out, "a" if done else "w", newline="") as file:
+        writer = csv.writer(file)
+        if not done:
+            writer.writerow(header)
+            file.flush()
+
+        def write(job: int, res: dict):
+            rows = io.StringIO()
+            csv.writer(rows).writerows([job, *params[job].values(), trader, money] for trader, money in res.items())
+            file.write(rows.getvalue())  # all the rows of a job at once
+            file.flush()
+
+        params = dict(jobs)
+        if workers == 0:
+            _init_worker(simulation, cache_dir)
+            for job, job_params in jobs:
+                write(*run_job(job, job_params))
+            return len(jobs)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(simulation, cache_dir)) as pool:
+            for future in as_completed([pool.submit(run_job, job, job_params) for job, job_params in jobs]):
+                write(*future.result())
+    return len(jobs)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    argsparser = argparse.ArgumentParser(description="runs a CryptoLang simulation over a grid of parameters")
+    argsparser.add_argument('file', help="CryptoLang Simulation File", type=argparse.FileType('r'))
+    argsparser.add_argument('--set', dest="axes", action="append", default=[], type=parse_axis,
+                            help="name=value,value... name is a simulation option or agent.option")
+    argsparser.add_argument('--out', required=True, help="csv the results are appended to")
+    argsparser.add_argument('--workers', type=int, default=None, help="processes, 0 runs the jobs in this one")
+    argsparser.add_argument('--resume', action="store_true", help="skip the jobs already in the output")
+    argsparser.add_argument('--cache-dir', help="Directory keeping the checked simulations between runs")
+    args = argsparser.parse_args()
+    with args.file:
+        source = args.file.read()
+    count = sweep(source, dict(args.axes), args.out, args.workers, args.resume, args.cache_dir)
+    print(f"{count} jobs run, results in {args.out}")
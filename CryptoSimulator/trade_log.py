@@ -0,0 +1,12 @@
+# log of the trades the built ins make, scalar and vectorized ones write to the same output.log
+# the file is opened by the first message, importing the built ins has no side effects
+_logger = None
+
+
+def log(msg: str):
+    global _logger
+    if _logger is None:
+        import logging
+        logging.basicConfig(filename="output.log", filemode="w", level=logging.INFO)
+        _logger = logging.getLogger()
+    _logger.info(msg)
@@ -0,0 +1,269 @@
+import numpy as np
+
+from CryptoSimulator import streams, trade_log
+from interpreter import ast_crypto as ast
+from interpreter.tree_interpreter import TrowableReturnContainer
+from interpreter.vector_interpreter import VectorInterpreter
+
+# populations smaller than this are cheaper to run one by one
+MIN_POPULATION = 2
+
+
+class VectorWallet:
+    '''
+    wallets of a whole population, one row per trader and one column per coin of the market
+    coins are handled as 1-based indexes of market.wallet as pick_coin does and 0 means no coin
+    '''
+
+    def __init__(self, lanes, coins):
+        self.amount = np.zeros((lanes, coins))
+        self.price = np.zeros((lanes, coins))
+        self.time = np.zeros((lanes, coins))
+        self.held = np.zeros((lanes, coins), dtype=bool)
+
+    def truth(self):
+        return self.held.any(axis=1)
+
+
+class TraderPopulation:
+    '''
+    state of homogeneous traders held in arrays so the shared trade behavior runs once for all of them
+    attributes not known here are gathered from the members the first time the behavior reads them
+    '''
+
+    def __init__(self, members: list, market):
+        coins = market.wallet
+        wallet = VectorWallet(len(members), len(coins))
+        for lane, member in enumerate(members):
+            for coin, (amount, price, time) in member.wallet.items():
+                idx = coins.index(coin)
+                wallet.amount[lane, idx] = amount
+                wallet.price[lane, idx] = price
+                wallet.time[lane, idx] = time
+                wallet.held[lane, idx] = True
+        trade = members[0].trade
+        context = trade.context.parentctx.create_child_context()
+        context[ast.TOKEN_TYPE.MY_KW] = self
+        # bypass __setattr__, these are not gathered attributes
+        self.__dict__.update(_members=members, _market=market, _extra=set(), _behavior=trade.managed,
+                             _interpreter=VectorInterpreter(trade.context.parentctx, VECTOR_BUILT_INS),
+                             _context=context, name=members[0].name, wallet=wallet,
+                             money=np.array([m.money for m in members], dtype=float),
+                             initial_money=np.array([m.initial_money for m in members], dtype=float),
+                             left=np.array([m in market.leaved for m in members], dtype=bool))
+
+    def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError(item)
+        values = np.array([getattr(m, item) for m in self._members])
+        self.__dict__[item] = values
+        self._extra.add(item)
+        return values
+
+    def __setattr__(self, key, value):
+        if key not in self.__dict__:
+            self._extra.add(key)
+        self.__dict__[key] = value
+
+    def __len__(self):
+        return len(self._members)
+
+    def __repr__(self):
+        res = f"Population {self.name} x{len(self)}"
+        return res
+
+    @property
+    def members(self):
+        return self._members
+
+    def active_money(self) -> list:
+        return self.money[~self.left].tolist()
+
+    def trade(self):
+        mask = ~self.left
+        if mask.any():
+            self._interpreter.run(self._behavior, self._context, mask)
+
+    def scatter(self):
+        '''
+        writes the arrays back to the members
+        '''
+        coins = self._market.wallet
+        wallet = self.wallet
+        for lane, member in enumerate(self._members):
+            member.money = float(self.money[lane])
+            member.wallet = {coins[idx]: (float(wallet.amount[lane, idx]), float(wallet.price[lane, idx]),
+                                          wallet.time[lane, idx].item())
+                             for idx in np.nonzero(wallet.held[lane])[0]}
+            for attr in self._extra:
+                value = self.__dict__[attr]
+                setattr(member, attr, value[lane].item() if isinstance(value, np.ndarray) else value)
+            if self.left[lane]:
+                self._market.leaved.add(member)
+
+
+def group_populations(traders: list) -> tuple[list, list]:
+    '''
+    groups traders that share the same managed trade behavior, returns the traders that must run one by one and the
+    members of each population that can be vectorized
+    '''
+    groups = dict()
+    for trader in traders:
+        behavior = getattr(trader.trade, "managed", None)
+        groups.setdefault(id(behavior) if behavior is not None else id(trader), []).append(trader)
+    scalars = []
+    populations = []
+    for members in groups.values():
+        trade = members[0].trade
+        if len(members) < MIN_POPULATION or getattr(trade, "managed", None) is None or \
+                not VectorInterpreter(trade.context.parentctx, VECTOR_BUILT_INS).vectorizable(trade.managed):
+            scalars.extend(members)
+        else:
+            populations.append(members)
+    return scalars, populations
+
+
+### vectorized built ins, same semantic of the scalar ones but for every lane of the mask at once
+
+def _lanes(value, mask, dtype=None):
+    return np.broadcast_to(np.asarray(value, dtype=dtype), mask.shape)
+
+
+def _values(market):
+    return np.array([coin.value for coin in market.wallet], dtype=float)
+
+
+def Uniform(lower=0, upper=1, *, mask):
+    u = streams.active().random(len(mask))
+    res = lower + (upper - lower) * u
+    return res
+
+
+def Exponential(l, *, mask):
+    u = streams.active().random(len(mask))
+    res = -(1 / l) * np.log(u)
+    return res
+
+
+def Bernoulli(p, *, mask):
+    u = streams.active().random(len(mask))
+    res = (u <= p).astype(int)
+    return res
+
+
+def Normal(mean_p=0, std_p=1, *, mask):
+    res = streams.active().normal(mean_p, std_p, len(mask))
+    return res
+
+
+def say(str, *, my, market, mask):
+    trade_log.log(f"{repr(my)} lanes {int(mask.sum())}: {str}")
+
+
+def pick_coin(idx, wallet, *, mask):
+    if isinstance(wallet, VectorWallet):
+        order = np.cumsum(wallet.held, axis=1)
+        found = wallet.held & (order == _lanes(idx, mask)[:, None])
+        return np.where(found.any(axis=1), found.argmax(axis=1) + 1, 0)
+    return idx
+
+
+def _pick_by_value(wallet, market, mask, pick):
+    values = _values(market)
+    if isinstance(wallet, VectorWallet):
+        fill = np.inf if pick is np.argmin else -np.inf
+        candidates = np.where(wallet.held, values, fill)
+        return np.where(wallet.held.any(axis=1), pick(candidates, axis=1) + 1, 0)
+    return int(pick(values)) + 1 if len(values) else 0
+
+
+def pick_cheaper_coin(wallet, *, market, mask):
+    return _pick_by_value(wallet, market, mask, np.argmin)
+
+
+def pick_expensier_coin(wallet, *, market, mask):
+    return _pick_by_value(wallet, market, mask, np.argmax)
+
+
+def pick_random_coin(wallet, *, mask):
+    if isinstance(wallet, VectorWallet):
+        keys = np.where(wallet.held, streams.active().random(wallet.held.shape), -1)
+        return np.where(wallet.held.any(axis=1), keys.argmax(axis=1) + 1, 0)
+    return streams.active().integers(1, len(wallet) + 1, len(mask)) if len(wallet) else 0
+
+
+def get_with_more_utility(*, my, market, mask):
+    wallet: VectorWallet = my.wallet
+    utility = np.where(wallet.held, _values(market) - wallet.price, 0)
+    utility = np.where(utility > 0, utility, -np.inf)
+    return np.where(np.isfinite(utility).any(axis=1), utility.argmax(axis=1) + 1, 0)
+
+
+def buy(coin, amount=None, *, my, market, mask):
+    if amount is None:
+        amount = streams.active().uniform(1, np.maximum(my.money, 1))
+    elif isinstance(amount, str) and amount == "all":
+        amount = my.money.copy()
+    coin = _lanes(coin, mask, int)
+    amount = _lanes(amount, mask, float)
+    lanes = np.nonzero(mask & (coin > 0) & (amount != 0))[0]
+    if not len(lanes):
+        return
+    cidx = coin[lanes] - 1
+    value = _values(market)[cidx]
+    purchased = amount[lanes] / value
+    wallet: VectorWallet = my.wallet
+    held = wallet.held[lanes, cidx]
+    wallet.amount[lanes, cidx] = np.where(held, wallet.amount[lanes, cidx] + purchased, purchased)
+    wallet.price[lanes, cidx] = np.where(held, (wallet.price[lanes, cidx] + value) / 2, value)
+    wallet.time[lanes, cidx] = market.time
+    wallet.held[lanes, cidx] = True
+    money = my.money[lanes] - amount[lanes]
+    my.money[lanes] = np.where(money < 0.0001, 0, money)  # avoid numerical errors on iee754 double
+    if market.verbose:
+        trade_log.log(f"{market.time} {repr(my)} Buy lanes {len(lanes)} amount {amount[lanes].sum()}")
+
+
+def sell(coin, amount=None, *, my, market, mask):
+    wallet: VectorWallet = my.wallet
+    coin = _lanes(coin, mask, int)
+    selected = mask & (coin > 0)
+    selected[selected] &= wallet.held[selected, coin[selected] - 1]
+    if amount is not None and not isinstance(amount, str):
+        selected &= _lanes(amount, mask) != 0
+    lanes = np.nonzero(selected)[0]
+    if not len(lanes):
+        return
+    cidx = coin[lanes] - 1
+    held_amount = wallet.amount[lanes, cidx]
+    if amount is None:
+        amount = streams.active().uniform(0.0001, np.maximum(held_amount, 0.0001))
+    elif isinstance(amount, str) and amount == "all":
+        amount = held_amount
+    else:
+        amount = _lanes(amount, mask, float)[lanes]
+    value = _values(market)[cidx]
+    after = held_amount - amount
+    sold_all = after <= 0
+    my.money[lanes] += np.where(sold_all, value * held_amount, value * amount)
+    wallet.amount[lanes, cidx] = np.where(sold_all, 0, after)
+    wallet.held[lanes[sold_all], cidx[sold_all]] = False
+    if market.verbose:
+        trade_log.log(f"{market.time} {repr(my)} Sell lanes {len(lanes)} amount {amount.sum()}")
+
+
+def leave(*, my, market, mask):
+    wallet: VectorWallet = my.wallet
+    earned = (np.where(wallet.held, wallet.amount, 0) * _values(market)).sum(axis=1)
+    my.money[mask] += earned[mask]
+    wallet.amount[mask] = 0
+    wallet.held[mask] = False
+    my.left |= mask
+    if market.verbose:
+        trade_log.log(f"{repr(my)} Left lanes {int(mask.sum())}")
+    raise TrowableReturnContainer(None)
+
+
+VECTOR_BUILT_INS = {func.__name__: func for func in
+                    (Uniform, Exponential, Bernoulli, Normal, say, pick_coin, pick_cheaper_coin, pick_expensier_coin,
+                     pick_random_coin, get_with_more_utility, buy, sell, leave)}
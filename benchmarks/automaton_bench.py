@@ -0,0 +1,39 @@
+# usage: python -m benchmarks.automaton_bench, dfa state counts and build times with and without minimization
+
+import contextlib
+import io
+import json
+import sys
+import time
+
+from benchmarks.simulation_bench import commit_info
+from interpreter import simulation_interpreter, ast_crypto
+from interpreter.lexer import Lexer
+from toolchain.regx_engine import RegxEngine
+
+PATTERNS = ("[A-Za-z][\\dA-Z_a-z]*", "'[^']*'", "#[^\n\r]*", "\\d+|\\d+[\\.]\\d+", "(a|b)*abb", "(.)*x(.)(.)",
+            "(ab|a)*(ba|b)*")
+
+
+def _measure(compile_func) -> dict:
+    res = dict()
+    for minimize in (False, True):
+        start = time.perf_counter()
+        compiled = compile_func(minimize)
+        res["minimized" if minimize else "dfa"] = dict(states=len(compiled.table), classes=compiled.table.width - 1,
+                                                       seconds=time.perf_counter() - start)
+    return res
+
+
+def main():
+    with contextlib.redirect_stdout(io.StringIO()):
+        lexer = Lexer(simulation_interpreter.RegxMatcher(), ast_crypto.TOKEN_TYPE)
+    rules = [(name, matcher[0]) for name, matcher in lexer.matcher.matchers.items()]
+    results = {pattern: _measure(lambda minimize: RegxEngine.compile(pattern, minimize)) for pattern in PATTERNS}
+    results["<lexer>"] = _measure(lambda minimize: RegxEngine.compile_tokens(rules, minimize))
+    json.dump(dict(commit_info(), results=results), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# usage: python -m benchmarks.parser_bench, tokens per second of the generated LR parsers on already lexed input
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmarks.scenarios import scenario
+from benchmarks.simulation_bench import commit_info
+from interpreter import ast_crypto
+from interpreter.lexer import Lexer
+from interpreter.parser import Parser
+from interpreter.simulation_interpreter import RegxMatcher
+from toolchain.regx_engine import RegxEngine
+
+REGEXES = ("(?P<trader>T\\d+) (buy|sell) (?P<coin>[A-Z]+)( \\d+)?", "[^ab]+|\\.c|((a)|(b))+x*", "(a|b)*abb[0-9a-f]?")
+
+
+def best_rate(parse, tokens: list, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(tokens)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(tokens) / best
+
+
+def peak_memory(parse, tokens: list) -> int:
+    tracemalloc.start()
+    parse(tokens)
+    res = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return res
+
+
+def main(argv=None):
+    argsparser = argparse.ArgumentParser(description="times the dsl and regex parsers, outputs JSON")
+    argsparser.add_argument("--traders", type=int, default=400)
+    argsparser.add_argument("--repeat", type=int, default=5)
+    args = argsparser.parse_args(argv)
+
+    lexer = Lexer(RegxMatcher(), ast_crypto.TOKEN_TYPE)
+    tokens = lexer(scenario(coins=args.traders // 4, traders=args.traders))
+    parser = Parser(ast_crypto, ast_crypto.TOKEN_TYPE)
+    dsl = best_rate(parser, tokens, args.repeat)
+    dsl_peak = peak_memory(parser, tokens)
+    regex_tokens = [RegxEngine.tokeizer(regex * 20) for regex in REGEXES]
+    regex = min(best_rate(RegxEngine.parser, tokens, args.repeat) for tokens in regex_tokens)
+    results = dict(dsl_tokens=len(tokens), dsl_tokens_per_sec=dsl, dsl_peak_bytes=dsl_peak, regex_tokens_per_sec=regex)
+    print(results, file=sys.stderr)
+    json.dump(dict(commit_info(), **results), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# usage: python -m benchmarks.parser_gen_bench, seconds building the LR(1) and LALR(1) tables of the repo grammars
+
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.simulation_bench import commit_info
+
+
+def grammars() -> dict:
+    from interpreter._dsl_gen import dsl
+    from toolchain.regx_engine._regex_gen import rx
+    return dict(dsl=dsl, regex=rx)
+
+
+def main(argv=None):
+    argsparser = argparse.ArgumentParser(description="times the parser table construction, outputs JSON")
+    argsparser.add_argument("--repeat", type=int, default=3)
+    args = argsparser.parse_args(argv)
+
+    results = []
+    for name, grammar in grammars().items():
+        accepted = grammar._augment()
+        for lalr in (False, True):
+            best = None
+            for _ in range(args.repeat):
+                grammar._index = None  # firsts and items are encoded again each time
+                start = time.perf_counter()
+                dfa = grammar._lalr_automaton() if lalr else grammar._lr1_automaton()
+                table = grammar._lr_table(dfa, accepted)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            results.append(dict(grammar=name, lalr=lalr, states=len(dfa.states), actions=len(table._action),
+                                gotos=len(table._goto), seconds=best))
+            print(results[-1], file=sys.stderr)
+    json.dump(dict(commit_info(), results=results), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# usage: python -m benchmarks.regex_set_bench, seconds scanning a trade log for a growing number of signatures at once
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from benchmarks.simulation_bench import commit_info
+from toolchain.regx_engine import RegxEngine
+
+COINS = ("BTC", "ETH", "ADA", "DOT", "SOL")
+
+
+def trade_log(lines: int, seed: int) -> str:
+    rnd = random.Random(seed)
+    res = "".join(f"{t} T{rnd.randrange(100)} {rnd.choice(('buy', 'sell'))} {rnd.choice(COINS)} "
+                  f"{rnd.uniform(0, 1000):.4f}\n" for t in range(lines))
+    return res
+
+
+def signatures(count: int) -> list:
+    res = [f"T{i} (buy|sell) [A-Z]+" if i % 2 else f"T{i} sell {COINS[i % len(COINS)]} \\d+" for i in range(count)]
+    return res
+
+
+def main(argv=None):
+    argsparser = argparse.ArgumentParser(description="times one pass scans of a pattern set, outputs JSON")
+    argsparser.add_argument("--patterns", type=int, nargs="+", default=[1, 4, 16, 64])
+    argsparser.add_argument("--lines", type=int, default=20000)
+    argsparser.add_argument("--seed", type=int, default=0)
+    argsparser.add_argument("--run-lengths", type=int, nargs="+", default=[1000, 2000, 4000, 8000],
+                            help="scans of one match growing over the whole input, the starts must stay linear")
+    args = argsparser.parse_args(argv)
+
+    log = trade_log(args.lines, args.seed)
+    results = []
+    for count in args.patterns:
+        patterns = signatures(count)
+        start = time.perf_counter()
+        pattern_set = RegxEngine.compile_set(patterns)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        ends = sum(1 for _ in pattern_set.ends(log))
+        ends_time = time.perf_counter() - start
+        start = time.perf_counter()
+        matches = sum(1 for _ in pattern_set.scan(log))
+        scan_time = time.perf_counter() - start
+        results.append(dict(patterns=count, states=len(pattern_set.table), matches=matches, compile=compile_time,
+                            ends=ends_time, scan=scan_time))
+        print(results[-1], file=sys.stderr)
+    runs = []
+    pattern_set = RegxEngine.compile_set(["a+", "b"])
+    for length in args.run_lengths:
+        start = time.perf_counter()
+        matches = sum(1 for _ in pattern_set.scan("a" * length))
+        runs.append(dict(chars=length, matches=matches, scan=time.perf_counter() - start))
+        print(runs[-1], file=sys.stderr)
+    json.dump(dict(commit_info(), chars=len(log), results=results, runs=runs), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# parametric simulation sources for the benchmarks, they only use the sample agents so they are valid in every commit
+
+_HEADER = """options [init_time=1,endtime={endtime},step_size={step_size},repetitions={repetitions},seed={seed}]
+
+func fluctuation() {{
+f = my.base_value / Uniform(5,10);
+ret Uniform(-f,f) ;
+}}
+"""
+
+_COIN = """
+coin Coin{index} : CoinGenericTemplate [base_value={base_value}]
+{{
+update_parameters
+{{
+completed =  market.time/market.end_time;
+val = my.base_value + completed*{slope} + fluctuation();
+if val < 1
+{{
+val = 1;
+}}
+my.value = val;
+}}
+}}
+"""
+
+_RANDOM_TRADER = """
+trader Trader{index} : TraderGenericTemplate [initial_money=50]
+{{
+trade
+{{
+   coin_sell = pick_random_coin(my.wallet);
+   if coin_sell & Bernoulli(0.5)  {{
+    sell(coin_sell);
+   }}
+   if my.money {{
+   coin_ = pick_random_coin(market.wallet);
+   amount = Uniform(0,my.money) // 1;
+   if amount {{
+   buy(coin_,amount);
+   }}
+   }}
+   else {{
+    if !my.wallet {{
+        leave();
+    }}
+   }}
+}}
+}}
+"""
+
+_GREEDY_TRADER = """
+trader Trader{index} : TraderGenericTemplate [initial_money=50]
+{{
+trade
+{{
+   expensier_sell = pick_expensier_coin(my.wallet);
+   if expensier_sell & Bernoulli(0.5) {{
+    sell(expensier_sell);
+   }}
+   if my.money {{
+   if Bernoulli(0.5) {{
+   coin_ = pick_cheaper_coin(market.wallet);
+   amount = Uniform(0,my.money) // 1;
+   if amount {{
+   buy(coin_,amount);
+   }}
+   }}
+   }}
+   else {{
+    if !my.wallet {{
+        leave();
+    }}
+   }}
+}}
+}}
+"""
+
+_KNOWLEDGE_TRADER = """
+trader Trader{index} : TraderGenericTemplate [initial_money=50]
+{{
+trade
+{{
+   coin_picked = get_with_more_utility();
+   if coin_picked & Bernoulli(0.5) {{
+    sell(coin_picked,'all');
+   }}
+   if my.money {{
+   coin_ = coin_picked;
+   if !coin_ {{
+   coin_ = pick_random_coin(market.wallet);
+   }}
+   if Bernoulli(0.5){{
+   amount = Uniform(0,my.money/2) // 1;
+   buy(coin_,amount);
+   }}
+   }}
+   else {{
+    if !my.wallet {{
+        leave();
+    }}
+   }}
+}}
+}}
+"""
+
+_GENETIC_TRADER = """
+trader Genetic : TraderGeneticTemplate [initial_money=50]
+{{
+initialize
+{{
+my.register_param('tuned_sell');
+my.register_param('tuned_buy');
+my.optimize({gens});
+}}
+
+trade
+{{
+   coin_picked = get_with_more_utility();
+   if coin_picked & Bernoulli(my.tuned_sell) {{
+    sell(coin_picked);
+   }}
+   if my.money {{
+   coin_ = pick_random_coin(market.wallet);
+   if Bernoulli(my.tuned_buy){{
+   amount = Uniform(0,my.money/2) // 1;
+   buy(coin_,amount);
+   }}
+   }}
+   else {{
+    if !my.wallet {{
+        leave();
+    }}
+   }}
+}}
+}}
+"""
+
+_TRADERS = (_RANDOM_TRADER, _GREEDY_TRADER, _KNOWLEDGE_TRADER)
+
+
+def scenario(*, ticks=100, coins=3, traders=3, gens=0, step_size=10, repetitions=1, seed=0) -> str:
+    '''
+    source of a simulation running ticks steps with the given amount of coins and traders declarations,
+    gens > 0 adds a genetic trader that optimizes itself that many generations
+    '''
+    parts = [_HEADER.format(endtime=ticks * step_size + 1, step_size=step_size, repetitions=repetitions, seed=seed)]
+    for i in range(coins):
+        parts.append(_COIN.format(index=i, base_value=50 + 10 * i, slope=(-1) ** i * 25 * (i % 5 + 1)))
+    for i in range(traders):
+        parts.append(_TRADERS[i % len(_TRADERS)].format(index=i))
+    if gens:
+        parts.append(_GENETIC_TRADER.format(gens=gens))
+    res = "".join(parts)
+    return res
@@ -0,0 +1,147 @@
+# usage: python -m benchmarks.simulation_bench --out bench.json, compare the JSON of two commits to see regressions
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.scenarios import scenario
+from CryptoSimulator.Simulation import Simulation
+
+AXES = ("ticks", "coins", "traders", "gens")
+STAGES = ("construct", "lexer", "parser", "check", "setup", "optimize", "run")
+
+
+def commit_info() -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return dict(commit=commit, dirty=dirty)
+
+
+@contextlib.contextmanager
+def _timed_optimize(interpr, elapsed: list):
+    '''
+    wraps the optimize method of the loaded genetic template so its time can be subtracted from the run loop, the
+    template class is shared by every interpreter of the process so the method is restored on exit
+    '''
+    template = interpr.agent_templates.get("TraderGeneticTemplate", None)
+    if template is None:
+        yield
+        return
+    original = template.__dict__["optimize"]
+    optimize = original.__func__
+
+    @functools.wraps(optimize)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return optimize(*args, **kwargs)
+        finally:
+            elapsed.append(time.perf_counter() - start)
+
+    template.optimize = staticmethod(wrapper)
+    try:
+        yield
+    finally:
+        template.optimize = original
+
+
+def measure(source: str) -> dict:
+    '''
+    seconds spent in every stage of loading and running the simulation source
+    '''
+    timings = dict()
+    optimize_times = []
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        start = time.perf_counter()
+        interpr = Simulation._new_interpreter()  # Simulation.interpreter() is memoized, this stage times a new one
+        interpr.lexer, interpr.parser  # built on first use, keep them in this stage
+        timings["construct"] = time.perf_counter() - start
+        stack.enter_context(_timed_optimize(interpr, optimize_times))
+
+        start = time.perf_counter()
+        tokens = interpr.lexer(source)
+        timings["lexer"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        simulation = interpr.parser(tokens)
+        timings["parser"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        interpr.check(simulation)
+        timings["check"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sim = Simulation()
+        coins, traders, opts = interpr.instantiate(simulation, sim)
+        sim.set_params(coins, traders, **opts)
+        timings["setup"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sim.run(plot=False)
+        total = time.perf_counter() - start
+    timings["optimize"] = sum(optimize_times)
+    timings["run"] = total - timings["optimize"]
+    timings["tokens"] = len(tokens)
+    return timings
+
+
+def curves(base: dict, values: dict) -> list:
+    '''
+    scenarios varying one axis at a time while the others stay in their base value
+    '''
+    res = [dict(base)]
+    for axis in AXES:
+        for value in values[axis]:
+            params = dict(base, **{axis: value})
+            if params not in res:
+                res.append(params)
+    return res
+
+
+def main(argv=None):
+    argsparser = argparse.ArgumentParser(description="times every stage of the simulation engine, outputs JSON")
+    argsparser.add_argument("--ticks", type=int, nargs="+", default=[100, 200, 400, 800])
+    argsparser.add_argument("--coins", type=int, nargs="+", default=[3, 6, 12])
+    argsparser.add_argument("--traders", type=int, nargs="+", default=[3, 12, 48])
+    argsparser.add_argument("--gens", type=int, nargs="+", default=[0, 2, 4])
+    argsparser.add_argument("--step-size", type=int, default=10)
+    argsparser.add_argument("--seed", type=int, default=0)
+    argsparser.add_argument("--rounds", type=int, default=3, help="each scenario is measured this many times")
+    argsparser.add_argument("--out", type=argparse.FileType("w"), default=sys.stdout)
+    args = argsparser.parse_args(argv)
+
+    values = {axis: getattr(args, axis) for axis in AXES}
+    base = {axis: values[axis][0] for axis in AXES}
+    results = []
+    for params in curves(base, values):
+        source = scenario(step_size=args.step_size, seed=args.seed, **params)
+        rounds = [measure(source) for _ in range(args.rounds)]
+        timings = {stage: statistics.median(r[stage] for r in rounds) for stage in STAGES}
+        results.append(dict(params=params, tokens=rounds[0]["tokens"], timings=timings,
+                            min={stage: min(r[stage] for r in rounds) for stage in STAGES}))
+        print(f"{params} {timings}", file=sys.stderr)
+
+    report = dict(commit_info(), python=platform.python_version(), machine=platform.machine(),
+                  system=platform.system(), step_size=args.step_size, seed=args.seed, rounds=args.rounds,
+                  base=base, results=results)
+    json.dump(report, args.out, indent=2)
+    args.out.write("\n")
+
+
+if __name__ == "__main__":
+    main()
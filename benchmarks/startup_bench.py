@@ -0,0 +1,77 @@
+# usage: python -m benchmarks.startup_bench --budget-ms 150, cold start times of fresh processes and the modules
+# importing CryptoSimulator.Simulation pulls in (python -X importtime), exits with 1 when the import is over budget
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.simulation_bench import commit_info
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# modules only running a simulation needs, importing it must not load them
+DEFERRED = ("numpy", "logging", "argparse", "toolchain.regx_engine.regx_engine", "CryptoSimulator.vectorized")
+
+STAGES = {
+    "import": "import CryptoSimulator.Simulation",
+    "load": "from CryptoSimulator.Simulation import Simulation\nSimulation.load(open({file!r}), {cache!r})",
+}
+
+
+def _run(code: str, importtime=False) -> tuple[float, subprocess.CompletedProcess]:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    start = time.perf_counter()
+    res = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, res
+
+
+def importtime(rounds: int) -> tuple[float, list]:
+    '''
+    median microseconds of the import of CryptoSimulator.Simulation and the modules with the highest self time
+    '''
+    totals = []
+    modules = dict()
+    for _ in range(rounds):
+        _, res = _run(STAGES["import"], importtime=True)
+        for line in res.stderr.splitlines()[1:]:
+            self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+            modules.setdefault(name.strip(), []).append(int(self_us))
+            if name.strip() == "CryptoSimulator.Simulation":
+                totals.append(int(cumulative_us))
+    top = sorted(((statistics.median(times), name) for name, times in modules.items()), reverse=True)[:10]
+    return statistics.median(totals), [dict(module=name, self_us=us) for us, name in top]
+
+
+def main(argv=None):
+    argsparser = argparse.ArgumentParser(description="times the cold start of fresh processes, outputs JSON")
+    argsparser.add_argument("--file", default=os.path.join(ROOT, "CryptoSimulator", "SimulationCode.sim"))
+    argsparser.add_argument("--rounds", type=int, default=10, help="each stage is measured this many times")
+    argsparser.add_argument("--budget-ms", type=float, default=None, help="limit for the import of the simulator")
+    args = argsparser.parse_args(argv)
+
+    code = f"import sys, CryptoSimulator.Simulation\nprint(*[m for m in {DEFERRED!r} if m in sys.modules])"
+    leaked = _run(code)[1].stdout.split()
+    import_us, top = importtime(args.rounds)
+    timings = dict()
+    with tempfile.TemporaryDirectory() as cache:
+        for stage, cache_dir in (("import", None), ("load", None), ("load_cached", cache)):
+            code = STAGES[stage.removesuffix("_cached")].format(file=args.file, cache=cache_dir)
+            _run(code)  # warms the bytecode and the simulation caches
+            timings[stage] = statistics.median(_run(code)[0] for _ in range(args.rounds))
+            print(f"{stage} {timings[stage]:.4f}", file=sys.stderr)
+    over = args.budget_ms is not None and import_us / 1000 > args.budget_ms
+    report = dict(commit_info(), rounds=args.rounds, timings=timings, import_us=import_us, budget_ms=args.budget_ms,
+                  over_budget=over, deferred_imported=leaked, top_modules=top)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    if over or leaked:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
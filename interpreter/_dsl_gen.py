@@ -1,6 +1,10 @@
 import os.path
+import sys
 
-import ast_crypto as ast
+try:
+    from . import ast_crypto as ast
+except ImportError:
+    import ast_crypto as ast
 from toolchain.frontend_generator import Grammar
 
 dsl = Grammar()
@@ -217,6 +221,7 @@ FunCall > Identifier + o_par + ExpressionList + c_par / (ast.FunCall, (0, 2))
 
 Identifier > identifier / (ast.Identifier,)
 
-current_path = os.path.dirname(__file__)  # python 3.9
-dsl.write_lr1_parser(current_path)
-dsl.write_lexer(current_path)
+if __name__ == "__main__":  # python _dsl_gen.py [--lalr]
+    current_path = os.path.dirname(__file__)  # python 3.9
+    dsl.write_lr1_parser(current_path, lalr="--lalr" in sys.argv)
+    dsl.write_lexer(current_path)
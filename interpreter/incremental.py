@@ -0,0 +1,149 @@
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Set
+
+from . import ast_crypto as ast
+from .semantics import SemanticStaticChecker
+
+# what moves the scan: comments and strings are skipped whole, brackets change the depth, keywords start declarations
+_SCAN = re.compile(r"#[^\n]*|'[^']*'?|[(\[{]|[)\]}]|(?<![\w])(?:func|trader|options)(?![\w])|(?<![\w])coin ")
+
+
+def declaration_starts(source: str) -> List[tuple[int, str | None]]:
+    '''
+    offsets and keywords of the top level declarations, a declaration starts at a keyword out of brackets, strings
+    and comments, the text before the first keyword goes with the first declaration
+    '''
+    res = [(0, None)]
+    depth = 0
+    for match in _SCAN.finditer(source):
+        lexeme = match.group()
+        char = lexeme[0]
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char in "fcto" and depth == 0:
+            if res[-1][1] is None:
+                res[-1] = (0, lexeme)
+            else:
+                res.append((match.start(), lexeme))
+    return res
+
+
+def split_declarations(source: str, starts: List[tuple[int, str | None]]) -> List[tuple[str, int]]:
+    '''
+    text of every top level declaration at starts and the line it starts at, options go with the declaration after them
+    '''
+    bounds = [start for start, _ in starts]
+    if starts[0][1] == "options" and len(bounds) > 1:
+        del bounds[1]
+    bounds.append(len(source))
+    res = []
+    line = 1
+    for start, end in zip(bounds, bounds[1:]):
+        res.append((source[start:end], line))
+        line += source.count("\n", start, end)
+    return res
+
+
+@dataclass
+class Declaration:
+    '''
+    top level declaration lexed and parsed as a program of its own, options come with the declaration after them
+    '''
+    tokens: list
+    simulation: ast.Simulation
+    names: frozenset  # identifiers it mentions, the only globals its semantic checks can depend on
+    line: int = 1  # line its tokens are numbered from
+    checked: Set[frozenset] = field(default_factory=set)  # the visible names among names it passed the checks with
+
+
+class _CachedChecker(SemanticStaticChecker):
+    '''
+    skips the declarations that already passed the checks seeing the same globals among the names they mention
+    '''
+
+    def __init__(self, owners: Dict[int, Declaration], built_ins, agents_subtypes: dict, sim_opts: set):
+        super().__init__(built_ins, agents_subtypes, sim_opts)
+        self.owners = owners
+
+    def top_level(self, node: ast.TopLevelSt):
+        declaration = self.owners[id(node)]
+        visible = frozenset(name for name in declaration.names if name in self.global_ctx)
+        if visible not in declaration.checked:
+            super().top_level(node)
+            declaration.checked.add(visible)
+
+
+class DeclarationCache:
+    '''
+    incremental front end for sources edited between runs, the tokens, ast and semantic checks of every top level
+    declaration are cached by its text, so only the edited declarations are lexed and parsed again and only those
+    and the ones mentioning a global whose definitions changed are checked again
+    '''
+    CACHE_SIZE = 1024
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.cache: OrderedDict[str, Declaration] = OrderedDict()
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    def _declaration(self, text: str, line: int) -> Declaration:
+        if (res := self.cache.get(text, None)) is not None and res.line == line:
+            self.cache.move_to_end(text)
+            return res
+        if res is None:
+            tokens = self.interpreter.lexer(text)
+            for token in tokens:  # fresh tokens, numbered from the line the text starts at
+                token.line += line - 1
+            names = frozenset(token.lexeme for token in tokens if token.name == ast.TOKEN_TYPE.IDENTIFIER)
+            checked = set()
+        else:
+            # the same text moved, it is parsed again from copies of its tokens so the asts returned before keep
+            # their lines, only the lexing and the checks are reused
+            tokens = [replace(token, line=token.line + line - res.line) for token in res.tokens]
+            names, checked = res.names, set(res.checked)
+        res = self.cache[text] = Declaration(tokens, self.interpreter.parser(tokens), names, line, checked)
+        self.cache.move_to_end(text)
+        if len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return res
+
+    def parse(self, source: str) -> tuple[ast.Simulation, List[Declaration]]:
+        starts = declaration_starts(source)
+        if any(keyword == "options" for _, keyword in starts[1:]):
+            raise ValueError("Options out of the beginning")  # the whole program reports it
+        # the same text twice starts at two lines, so the copies never share a declaration
+        declarations = [self._declaration(text, line) for text, line in split_declarations(source, starts)]
+        tops = ast.PList()
+        for declaration in declarations:
+            tops.elements.extend(declaration.simulation.funcs)
+            tops.elements.extend(declaration.simulation.agents)
+        simulation = ast.Simulation(tops, declarations[0].simulation.options)
+        return simulation, declarations
+
+    def check(self, simulation: ast.Simulation, declarations: List[Declaration]):
+        owners = {id(top): declaration for declaration in declarations
+                  for top in declaration.simulation.funcs + declaration.simulation.agents}
+        interpreter = self.interpreter
+        checker = _CachedChecker(owners, interpreter.built_ins.keys(), interpreter.agent_templates,
+                                 interpreter.sim_opts)
+        checker(simulation)
+
+    def __call__(self, source: str) -> ast.Simulation:
+        '''
+        parsed and checked simulation of the source, reusing what did not change since the previous calls
+        '''
+        try:
+            simulation, declarations = self.parse(source)
+        except Exception:
+            # the split program does not parse, the whole one raises the error with its usual message
+            simulation = self.interpreter.parse(source)
+            self.interpreter.check(simulation)
+            return simulation
+        self.check(simulation, declarations)
+        return simulation
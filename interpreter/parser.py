@@ -1,37 +1,50 @@
-import base64
-import io
-import lzma
-import pickle
 from collections import namedtuple
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable
 
 
 class TOKEN_TYPE(Enum):
     pass
 
 
+def _literal(value) -> str:
+    '''
+    python source of a table value, the members of the tokens enum are written as attributes of TOKEN_TYPE
+    '''
+    if isinstance(value, Enum):
+        return f"TOKEN_TYPE.{value.name}"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(map(_literal, value)) + "]"
+    if isinstance(value, tuple):
+        items = ", ".join(map(_literal, value))
+        if hasattr(value, "_fields"):  # namedtuple
+            return f"{type(value).__name__}({items})"
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
 class Serializable:
-    class Finder(pickle.Unpickler):
-        def find_class(self, __module_name: str, __global_name: str):
-            return super().find_class(__name__, __global_name)
-
-    def get_serial_str(self) -> str:
-        compressor = lzma.LZMACompressor()
-        serial = pickle.dumps(self, fix_imports=True)
-        serial = compressor.compress(serial)
-        serial += compressor.flush()
-        serial = base64.b85encode(serial).decode("ascii")
-        return serial
+    '''
+    tables are written in the generated modules as python literals, compiled with the module and built once per
+    process for each tokens enum without decoding or unpickling
+    '''
 
-    @staticmethod
-    def deserialize(serial):
-        decompressor = lzma.LZMADecompressor()
-        serial = base64.b85decode(serial)
-        serial = decompressor.decompress(serial)
-        pickler = Serializable.Finder(io.BytesIO(serial))
-        table = pickler.load()
+    def _state(self) -> dict:
+        return vars(self)
+
+    def _restore(self, state: dict):
+        self.__dict__.update(state)
+
+    def get_literal(self) -> str:
+        return f"{type(self).__name__}.from_literal({_literal(self._state())})"
+
+    @classmethod
+    def from_literal(cls, state: dict):
+        table = cls.__new__(cls)
+        table._restore(state)
         return table
 
 
@@ -44,8 +57,19 @@ class LRtable(Serializable):
     def __init__(self):
         self.initial_symbol = None
         self.initial_state = None
-        self._action: Dict[(Any, str), (LRtable.Action, Any)] = dict()
-        self._goto: Dict[(Any, str), Any] = dict()
+        self._action: Dict[(Any, str), (LRtable.Action, Any)] | None = dict()
+        self._goto: Dict[(Any, str), Any] | None = dict()
+        self.productions: List[ReduceInfo] = []  # reduce actions hold indexes of this list
+        # packed tables, see pack
+        self.terminals: Dict[Any, int] = dict()
+        self.non_terminals: Dict[Any, int] = dict()
+        self.lhs: List[int] = []
+        self.rhs_len: List[int] = []
+        self.action_base: List[int] = []
+        self.action_check: List[int] = []
+        self.action_value: List[int] = []
+        self.goto_base: List[int] = []
+        self.goto_value: List[int] = []
 
     def action(self, key: (Any, str), new_value=None):
         if new_value is None:
@@ -59,9 +83,71 @@ class LRtable(Serializable):
             return self._goto[key]
         self._goto[key] = value
 
+    def pack(self):
+        '''
+        numbers the states (the initial one is 0), terminals and non terminals and row compresses both tables into
+        comb vectors, the entry of symbol k in state s is value[base[s] + k] when check[base[s] + k] == s
+        actions are encoded as ints, shift to s is s + 1, reduce of production p is -p - 1 and accept is 0
+        '''
+        states = {self.initial_state: 0}
+        for (state, symbol), (action, content) in self._action.items():
+            states.setdefault(state, len(states))
+            self.terminals.setdefault(symbol, len(self.terminals))
+            if action == LRtable.Action.SHIFT:
+                states.setdefault(content, len(states))
+        for (state, symbol), target in self._goto.items():
+            states.setdefault(state, len(states))
+            states.setdefault(target, len(states))
+            self.non_terminals.setdefault(symbol, len(self.non_terminals))
+        self.lhs = [self.non_terminals.setdefault(prod.prod_left, len(self.non_terminals)) for prod in self.productions]
+        self.rhs_len = [len(prod.prod_right) for prod in self.productions]
+
+        actions = [dict() for _ in states]
+        for (state, symbol), (action, content) in self._action.items():
+            if action == LRtable.Action.SHIFT:
+                code = states[content] + 1
+            elif action == LRtable.Action.REDUCE:
+                code = -content - 1
+            else:
+                code = 0
+            actions[states[state]][self.terminals[symbol]] = code
+        gotos = [dict() for _ in states]
+        for (state, symbol), target in self._goto.items():
+            gotos[states[state]][self.non_terminals[symbol]] = states[target]
+
+        self.action_base, self.action_check, self.action_value = self._comb(actions, len(self.terminals))
+        self.goto_base, _, self.goto_value = self._comb(gotos, len(self.non_terminals))  # gotos are never missing
+        self.initial_state = 0
+        self._action = self._goto = None
+
+    @staticmethod
+    def _comb(rows: List[Dict[int, int]], width: int) -> tuple[List[int], List[int], List[int]]:
+        '''
+        first fit of the rows, densest first, into one vector, padded so base + k is always a valid index
+        '''
+        base = [0] * len(rows)
+        check: List[int] = []
+        value: List[int] = []
+        free = 0  # every position before is taken
+        for row_id in sorted(range(len(rows)), key=lambda r: -len(rows[r])):
+            row = rows[row_id]
+            while free < len(check) and check[free] != -1:
+                free += 1
+            offset = free - min(row, default=0)
+            while any(offset + k < 0 or offset + k < len(check) and check[offset + k] != -1 for k in row):
+                offset += 1
+            base[row_id] = offset
+            if len(check) < offset + width:
+                check.extend([-1] * (offset + width - len(check)))
+                value.extend([0] * (offset + width - len(value)))
+            for k, code in row.items():
+                check[offset + k] = row_id
+                value[offset + k] = code
+        return base, check, value
+
     def expect(self, state):
-        act = map(lambda x: x[1], filter(lambda x: x[0] == state, self._action.keys()))
-        return set(act)
+        base = self.action_base[state]
+        return {symbol for symbol, k in self.terminals.items() if self.action_check[base + k] == state}
 
 
 ReduceInfo = namedtuple("ReduceInfo", ["prod_left", "prod_right", "attribute"])
@@ -97,72 +183,202 @@ class ParserSymbol:
         graph.unflatten().view(tempfile.mktemp(".gv"))
 
 
+def _table(TOKEN_TYPE) -> LRtable:  # the literal refers to the tokens enum by this name
+    return LRtable.from_literal({'initial_symbol': 'CryptoDsl', 'initial_state': 0, '_action': None, '_goto': None, 'productions': [ReduceInfo('CryptoDsl', ['SimOpts', 'TopLevelStList'], ('Simulation', (1, 0))), ReduceInfo('CryptoDsl', ['TopLevelStList'], ('Simulation',)), ReduceInfo('SimOpts', [TOKEN_TYPE.OPTS_KW, 'Opts'], (1,)), ReduceInfo('TopLevelStList', ['TopLevelStList', 'TopLevelSt'], ('PList', (0, 1))), ReduceInfo('TopLevelStList', ['TopLevelSt'], ('PList',)), ReduceInfo('TopLevelSt', ['FunDef'], None), ReduceInfo('TopLevelSt', ['EntDec'], None), ReduceInfo('Entkwgrp', [TOKEN_TYPE.TRADER_KW], None), ReduceInfo('Entkwgrp', [TOKEN_TYPE.COIN_KW], None), ReduceInfo('KwResolv', [TOKEN_TYPE.MY_KW], None), ReduceInfo('KwResolv', [TOKEN_TYPE.MARKET_KW], None), ReduceInfo('EntDec', ['Entkwgrp', 'Identifier', TOKEN_TYPE.DDOT, 'Identifier', 'Opts', TOKEN_TYPE.O_BRACES, 'BehaviorList', TOKEN_TYPE.C_BRACES], ('AgentDec', (0, 1, 3, 4, 6))), ReduceInfo('Opts', [TOKEN_TYPE.O_BRACKETS, 'OptsList', TOKEN_TYPE.C_BRACKETS], (1,)), ReduceInfo('OptsList', ['OptsList', TOKEN_TYPE.COMMA, 'Assign'], ('OptList', (0, 2))), ReduceInfo('OptsList', ['Assign'], ('OptList',)), ReduceInfo('OptsList', [], ('OptList',)), ReduceInfo('Behavior', ['Identifier', 'Body'], ('BehaviorDef', (0, 1))), ReduceInfo('FunDef', [TOKEN_TYPE.FUNC, 'Identifier', TOKEN_TYPE.O_PAR, 'Args', TOKEN_TYPE.C_PAR, 'Body'], ('FunDef', (1, 5, 3))), ReduceInfo('ExpressionList', ['ExpressionList', TOKEN_TYPE.COMMA, 'Expr'], ('ExpresionList', (0, 2))), ReduceInfo('ExpressionList', ['Expr'], ('ExpresionList',)), ReduceInfo('ExpressionList', [], ('ExpresionList',)), ReduceInfo('BehaviorList', ['BehaviorList', 'Behavior'], ('PList', (0, 1))), ReduceInfo('BehaviorList', ['Behavior'], ('PList',)), ReduceInfo('Args', ['Args', TOKEN_TYPE.COMMA, 'Identifier'], ('ArgList', (0, 2))), ReduceInfo('Args', ['Identifier'], ('ArgList',)), ReduceInfo('Args', [], ('ArgList',)), ReduceInfo('StatementList', ['StatementList', 'Statement'], ('StatementList', (0, 1))), ReduceInfo('StatementList', ['Statement'], ('StatementList',)), ReduceInfo('Statement', ['Expr', TOKEN_TYPE.SEMICOLON], None), ReduceInfo('Statement', ['If'], None), ReduceInfo('Statement', ['While'], None), ReduceInfo('Statement', ['Assign', TOKEN_TYPE.SEMICOLON], None), ReduceInfo('Statement', ['AssignResolv', TOKEN_TYPE.SEMICOLON], None), ReduceInfo('Statement', ['Ret', TOKEN_TYPE.SEMICOLON], None), ReduceInfo('Statement', [TOKEN_TYPE.BREAK, TOKEN_TYPE.SEMICOLON], ('Break',)), ReduceInfo('Body', [TOKEN_TYPE.O_BRACES, 'StatementList', TOKEN_TYPE.C_BRACES], (1,)), ReduceInfo('If', [TOKEN_TYPE.IF, 'Expr', 'Body'], ('If', (1, 2))), ReduceInfo('If', [TOKEN_TYPE.IF, 'Expr', 'Body', TOKEN_TYPE.ELSE, 'Body'], ('If', (1, 2, 4))), ReduceInfo('While', [TOKEN_TYPE.WHILE, 'Expr', 'Body'], ('While', (1, 2))), ReduceInfo('Ret', [TOKEN_TYPE.RET, 'Expr'], ('Ret', (1,))), ReduceInfo('Ret', [TOKEN_TYPE.RET], ('Ret',)), ReduceInfo('Assign', ['Identifier', TOKEN_TYPE.ASSIGN, 'Expr'], ('Assign', (0, 2))), ReduceInfo('AssignResolv', ['AttrResolv', TOKEN_TYPE.ASSIGN, 'Expr'], ('Assign', (0, 2))), ReduceInfo('Op_prec5', [TOKEN_TYPE.OR], None), ReduceInfo('Op_prec5', [TOKEN_TYPE.AND], None), ReduceInfo('Op_prec4', [TOKEN_TYPE.EQ], None), ReduceInfo('Op_prec4', [TOKEN_TYPE.NEQ], None), ReduceInfo('Op_prec4', [TOKEN_TYPE.GT], None), ReduceInfo('Op_prec4', [TOKEN_TYPE.GE], None), ReduceInfo('Op_prec4', [TOKEN_TYPE.LT], None), ReduceInfo('Op_prec4', [TOKEN_TYPE.LE], None), ReduceInfo('Op_prec3', [TOKEN_TYPE.PLUS], None), ReduceInfo('Op_prec3', [TOKEN_TYPE.MINUS], None), ReduceInfo('Op_prec2', [TOKEN_TYPE.MUL], None), ReduceInfo('Op_prec2', [TOKEN_TYPE.DIV], None), ReduceInfo('Op_prec2', [TOKEN_TYPE.FLOORDIV], None), ReduceInfo('Op_prec2', [TOKEN_TYPE.MOD], None), ReduceInfo('Op_prec1', [TOKEN_TYPE.MINUS], None), ReduceInfo('Op_prec1', [TOKEN_TYPE.NOT], None), ReduceInfo('Op_prec0', [TOKEN_TYPE.EXP], None), ReduceInfo('Expr', ['Expr', 'Op_prec5', 'CmpExpr'], ('BinaryOp', (0, 2, 1))), ReduceInfo('Expr', ['CmpExpr'], None), ReduceInfo('CmpExpr', ['CmpExpr', 'Op_prec4', 'ArithExpr'], ('BinaryOp', (0, 2, 1))), ReduceInfo('CmpExpr', ['ArithExpr'], None), ReduceInfo('ArithExpr', ['ArithExpr', 'Op_prec3', 'Term'], ('BinaryOp', (0, 2, 1))), ReduceInfo('ArithExpr', ['Term'], None), ReduceInfo('Term', ['Term', 'Op_prec2', 'Factor'], ('BinaryOp', (0, 2, 1))), ReduceInfo('Term', ['Factor'], None), ReduceInfo('Factor', ['Op_prec1', 'Exp'], ('UnaryOp', (1, 0))), ReduceInfo('Factor', ['Exp'], None), ReduceInfo('Exp', ['Atom', 'Op_prec0', 'Atom'], ('BinaryOp', (0, 2, 1))), ReduceInfo('Exp', ['Atom'], None), ReduceInfo('Atom', ['Identifier'], None), ReduceInfo('Atom', [TOKEN_TYPE.O_PAR, 'Expr', TOKEN_TYPE.C_PAR], (1,)), ReduceInfo('Atom', [TOKEN_TYPE.STRING], ('Literal',)), ReduceInfo('Atom', [TOKEN_TYPE.NUMBER], ('Literal',)), ReduceInfo('Atom', ['FunCall'], None), ReduceInfo('Atom', ['AttrResolv'], None), ReduceInfo('AttrResolv', ['KwResolv', TOKEN_TYPE.DOT, 'Identifier'], ('AttrRes', (0, 2))), ReduceInfo('AttrResolv', ['KwResolv', TOKEN_TYPE.DOT, 'FunCall'], ('AttrRes', (0, 2))), ReduceInfo('FunCall', ['Identifier', TOKEN_TYPE.O_PAR, 'ExpressionList', TOKEN_TYPE.C_PAR], ('FunCall', (0, 2))), ReduceInfo('Identifier', [TOKEN_TYPE.IDENTIFIER], ('Identifier',)), ReduceInfo("CryptoDsl'", ['CryptoDsl'], None)], 'terminals': {TOKEN_TYPE.OPTS_KW: 0, TOKEN_TYPE.TRADER_KW: 1, TOKEN_TYPE.COIN_KW: 2, TOKEN_TYPE.FUNC: 3, '$': 4, TOKEN_TYPE.IDENTIFIER: 5, TOKEN_TYPE.O_BRACKETS: 6, TOKEN_TYPE.DDOT: 7, TOKEN_TYPE.O_PAR: 8, TOKEN_TYPE.C_BRACKETS: 9, TOKEN_TYPE.COMMA: 10, TOKEN_TYPE.C_PAR: 11, TOKEN_TYPE.ASSIGN: 12, TOKEN_TYPE.MY_KW: 13, TOKEN_TYPE.MARKET_KW: 14, TOKEN_TYPE.MINUS: 15, TOKEN_TYPE.NOT: 16, TOKEN_TYPE.STRING: 17, TOKEN_TYPE.NUMBER: 18, TOKEN_TYPE.O_BRACES: 19, TOKEN_TYPE.OR: 20, TOKEN_TYPE.AND: 21, TOKEN_TYPE.EQ: 22, TOKEN_TYPE.NEQ: 23, TOKEN_TYPE.GT: 24, TOKEN_TYPE.GE: 25, TOKEN_TYPE.LT: 26, TOKEN_TYPE.LE: 27, TOKEN_TYPE.PLUS: 28, TOKEN_TYPE.MUL: 29, TOKEN_TYPE.DIV: 30, TOKEN_TYPE.FLOORDIV: 31, TOKEN_TYPE.MOD: 32, TOKEN_TYPE.EXP: 33, TOKEN_TYPE.DOT: 34, TOKEN_TYPE.BREAK: 35, TOKEN_TYPE.IF: 36, TOKEN_TYPE.WHILE: 37, TOKEN_TYPE.RET: 38, TOKEN_TYPE.C_BRACES: 39, TOKEN_TYPE.SEMICOLON: 40, TOKEN_TYPE.ELSE: 41}, 'non_terminals': {'SimOpts': 0, 'TopLevelStList': 1, 'TopLevelSt': 2, 'FunDef': 3, 'EntDec': 4, 'Entkwgrp': 5, 'CryptoDsl': 6, 'Identifier': 7, 'Opts': 8, 'OptsList': 9, 'Assign': 10, 'Args': 11, 'Expr': 12, 'CmpExpr': 13, 'ArithExpr': 14, 'Term': 15, 'Factor': 16, 'Op_prec1': 17, 'Exp': 18, 'Atom': 19, 'FunCall': 20, 'AttrResolv': 21, 'KwResolv': 22, 'Body': 23, 'Op_prec5': 24, 'Op_prec4': 25, 'Op_prec3': 26, 'Op_prec2': 27, 'Op_prec0': 28, 'BehaviorList': 29, 'Behavior': 30, 'StatementList': 31, 'Statement': 32, 'If': 33, 'While': 34, 'AssignResolv': 35, 'Ret': 36, 'ExpressionList': 37, "CryptoDsl'": 38}, 'lhs': [6, 6, 0, 1, 1, 2, 2, 5, 5, 22, 22, 4, 8, 9, 9, 9, 30, 3, 37, 37, 37, 29, 29, 11, 11, 11, 31, 31, 32, 32, 32, 32, 32, 32, 32, 23, 33, 33, 34, 36, 36, 10, 35, 24, 24, 25, 25, 25, 25, 25, 25, 26, 26, 27, 27, 27, 27, 17, 17, 28, 12, 12, 13, 13, 14, 14, 15, 15, 16, 16, 18, 18, 19, 19, 19, 19, 19, 19, 21, 21, 20, 7, 38], 'rhs_len': [2, 1, 2, 2, 1, 1, 1, 1, 1, 1, 1, 8, 3, 3, 1, 0, 2, 6, 3, 1, 0, 2, 1, 3, 1, 0, 2, 1, 2, 1, 1, 2, 2, 2, 2, 3, 3, 5, 3, 2, 1, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 2, 1, 3, 1, 1, 3, 1, 1, 1, 1, 3, 3, 4, 1, 1], 'action_base': [3, 73, 126, 179, 204, 209, 52, 7, 28, 33, 59, 214, 232, 261, 100, 85, 111, 358, 390, 404, 180, 215, 401, 408, 47, 73, 235, 411, 97, 405, 4213, 412, 178, 124, 400, 431, 233, 403, 404, 4913, 4915, 4227, 225, 250, -8, 421, 436, 3739, 277, 3298, 4241, 4255, 3739, 4269, 4283, 4297, 4311, 4325, 4339, 3758, 4353, 4367, 1067, 4381, 4395, 4409, 4423, 1091, 4929, 1115, 275, 4931, 18, 4009, 4437, 1137, 1160, 301, 326, 351, 408, 438, 441, 279, 442, 137, 422, 4451, 4465, 4199, 4479, 1179, 1200, 44, 304, 4493, 4507, 4521, 4535, 1226, 4945, 4549, 1250, 1274, 377, 4563, 400, 424, 70, 299, 449, 4052, 3895, 2449, 2471, 4947, 2493, 1296, 475, 4023, 1319, 1342, 429, 460, 357, 158, 553, 447, 3782, 3347, 163, 3361, 172, 3396, 3410, 3445, 427, 3459, 428, 3494, 445, 3508, 3543, 501, 523, 4577, 453, 483, 96, 4591, 4037, 4605, 1361, 1380, 549, 3367, 3909, 2511, 2532, 4961, 2553, 1399, 1420, 3782, 3801, 1446, 1470, 1494, 575, 4051, 1518, 1542, 455, 486, 307, 4619, 599, 3311, 4060, 3820, 1565, 1588, 4963, 1611, 623, 122, 4083, 647, 671, 458, 506, 4633, 4647, 4661, 4675, 2575, 4977, 4689, 2597, 2619, 1636, 473, 1658, 148, 696, 554, 555, 3557, 4703, 221, 722, 1677, 478, 508, 243, 3844, 3417, 3931, 2637, 2655, 4979, 2673, 1699, 748, 4097, 1718, 1737, 480, 510, 247, 3858, 4717, 4731, 4745, 2691, 4993, 4759, 2712, 2733, 1763, 499, 1784, 720, 1810, 4773, 4787, 4801, 4815, 1833, 4995, 4829, 1856, 1879, 774, 772, 797, 4140, 3949, 2755, 2777, 2799, 1904, 4111, 2821, 2843, 483, 513, 327, 1926, 823, 1949, 3592, 727, 3465, 271, 174, 4125, 845, 273, 329, 1968, 3606, 4843, 4857, 4871, 4885, 2861, 5009, 4899, 2879, 2897, 1994, 821, 2012, 3298, 517, 3963, 2915, 2936, 2957, 2038, 4139, 2978, 2999, 503, 534, 332, 2062, 871, 2086, 3347, 4148, 3877, 2109, 2132, 2155, 896, 4171, 2178, 2201, 506, 537, 334, 919, 200, 943, 894, 3021, 969, 2219, 3515, 3641, 3655, 3985, 3039, 3057, 3075, 2245, 4185, 3093, 3111, 527, 557, 353, 2263, 995, 2282, 3690, 3312, 967, 3129, 1041, 2306, 357, 3151, 2331, 3173, 359, 1017, 1223, 3191, 3704, 378, 3209, 2356, 3230, 380, 2379, 1043, 2402, 383, 3252, 2427, 3270], 'action_check': [44, 44, 44, 0, 0, 0, 0, 44, 7, 7, 7, 7, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 72, 72, 72, 8, 8, 8, 8, 72, 9, 9, 9, 9, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 93, 6, 6, 6, 93, 24, 24, 93, 10, 10, 10, 10, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 108, 1, 108, 108, 25, 25, 93, 108, 15, 15, 15, 15, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 108, 148, 14, 28, 28, 148, 14, 14, 148, 16, 16, 16, 16, 148, 148, 148, 148, 148, 148, 148, 148, 148, 148, 148, 148, 148, 148, 185, 2, 185, 185, 33, 33, 148, 185, 85, 85, 85, 85, 185, 185, 185, 185, 185, 185, 185, 185, 185, 185, 185, 185, 185, 185, 203, 203, 203, 125, 125, 125, 125, 203, 130, 130, 130, 130, 203, 203, 203, 203, 203, 203, 203, 203, 203, 203, 203, 203, 203, 203, 275, 32, 3, 20, 275, 32, 32, 275, 20, 20, 132, 132, 275, 275, 275, 275, 275, 275, 275, 275, 275, 275, 275, 275, 275, 275, 324, 4, 324, 324, 132, 5, 275, 324, 21, 21, 21, 11, 324, 324, 324, 324, 324, 324, 324, 324, 324, 324, 324, 324, 324, 324, 42, 42, 26, 26, 26, 12, 42, 209, 209, 36, 36, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 43, 43, 209, 214, 214, 214, 43, 229, 229, 229, 13, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 70, 70, 48, 48, 83, 83, 70, 274, 274, 278, 278, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 77, 109, 274, 77, 278, 94, 94, 77, 174, 174, 109, 109, 77, 77, 77, 77, 77, 77, 77, 77, 77, 77, 77, 77, 77, 77, 78, 78, 267, 267, 279, 279, 78, 306, 306, 322, 322, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 79, 79, 124, 343, 343, 17, 79, 353, 353, 357, 357, 79, 79, 79, 79, 79, 79, 79, 79, 79, 79, 79, 79, 79, 79, 104, 104, 104, 362, 362, 366, 366, 104, 370, 370, 18, 124, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 104, 106, 106, 19, 22, 23, 106, 27, 29, 31, 34, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 106, 107, 107, 35, 37, 38, 107, 45, 46, 80, 81, 107, 107, 107, 107, 107, 107, 107, 107, 107, 107, 107, 107, 107, 107, 110, 110, 82, 84, 86, 122, 110, 123, 127, 136, 138, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 118, 201, 140, 118, 146, 147, 172, 118, 173, 189, 201, 201, 118, 118, 118, 118, 118, 118, 118, 118, 118, 118, 118, 118, 118, 118, 143, 240, 190, 212, 213, 227, 228, 143, 265, 266, 240, 240, 143, 143, 143, 143, 143, 143, 143, 143, 143, 143, 143, 143, 143, 143, 144, 295, 304, 144, 305, 320, 143, 321, 144, 144, 144, 144, 144, 144, 144, 144, 144, 144, 144, 144, 144, 144, 154, 126, 205, 206, 341, 342, 144, 154, -1, -1, -1, 154, 154, 154, 154, 154, 154, 154, 154, 154, 154, 154, 154, 154, 154, 154, 168, 168, 168, -1, -1, -1, -1, 168, -1, 126, 205, 206, 168, 168, 168, 168, 168, 168, 168, 168, 168, 168, 168, 168, 168, 176, 176, -1, -1, -1, -1, 176, -1, -1, -1, -1, 176, 176, 176, 176, 176, 176, 176, 176, 176, 176, 176, 176, 176, 176, 184, 184, -1, -1, -1, 184, -1, -1, -1, -1, 184, 184, 184, 184, 184, 184, 184, 184, 184, 184, 184, 184, 184, 184, 187, 187, -1, -1, -1, 187, -1, -1, -1, -1, 187, 187, 187, 187, 187, 187, 187, 187, 187, 187, 187, 187, 187, 187, 188, 188, -1, -1, -1, 188, -1, -1, -1, -1, 188, 188, 188, 188, 188, 188, 188, 188, 188, 188, 188, 188, 188, 188, 204, 204, -1, -1, -1, -1, 204, -1, -1, -1, -1, 204, 204, 204, 204, 204, 204, 204, 204, 204, 204, 204, 204, 204, 204, 210, 242, 272, -1, -1, -1, -1, 210, -1, -1, 242, 242, 210, 210, 210, 210, 210, 210, 210, 210, 210, 210, 210, 210, 210, 210, 223, -1, -1, -1, -1, -1, 210, 223, -1, -1, 272, 223, 223, 223, 223, 223, 223, 223, 223, 223, 223, 223, 223, 223, 223, 223, 253, 254, 253, 253, -1, -1, -1, 253, -1, -1, 254, 254, 253, 253, 253, 253, 253, 253, 253, 253, 253, 253, 253, 253, 253, 255, 255, -1, -1, -1, 255, -1, -1, -1, -1, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 269, 292, -1, 269, -1, -1, -1, 269, -1, -1, 292, 292, 269, 269, 269, 269, 269, 269, 269, 269, 269, 269, 269, 269, 269, 269, 277, -1, -1, 277, -1, -1, -1, -1, 277, 277, 277, 277, 277, 277, 277, 277, 277, 277, 277, 277, 277, 277, 308, 308, 308, -1, -1, -1, 277, 308, -1, -1, -1, -1, 308, 308, 308, 308, 308, 308, 308, 308, 308, 308, 308, 308, 308, 316, 326, 316, 316, -1, -1, -1, 316, -1, -1, 326, 326, 316, 316, 316, 316, 316, 316, 316, 316, 316, 316, 316, 316, 316, 323, 323, -1, -1, -1, 323, -1, -1, -1, -1, 323, 323, 323, 323, 323, 323, 323, 323, 323, 323, 323, 323, 323, 323, 325, 325, -1, -1, -1, 325, -1, -1, -1, -1, 325, 325, 325, 325, 325, 325, 325, 325, 325, 325, 325, 325, 325, 325, 328, 349, -1, -1, -1, -1, -1, 328, -1, -1, 349, 349, 328, 328, 328, 328, 328, 328, 328, 328, 328, 328, 328, 328, 328, 328, 345, -1, -1, -1, -1, -1, 328, 345, -1, -1, -1, 345, 345, 345, 345, 345, 345, 345, 345, 345, 345, 345, 345, 345, 345, 345, 358, -1, -1, 358, -1, -1, -1, -1, 358, 358, 358, 358, 358, 358, 358, 358, 358, 358, 358, 358, 358, 358, 368, 351, 368, 368, -1, -1, 358, 368, -1, -1, 351, 351, 368, 368, 368, 368, 368, 368, 368, 368, 368, 368, 368, 368, 368, 62, 62, -1, -1, -1, -1, 62, -1, -1, -1, -1, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 67, 67, -1, -1, -1, -1, 67, -1, -1, -1, -1, 67, 67, 67, 67, 67, 67, 67, 67, 67, 67, 67, 67, 67, 69, 69, -1, -1, -1, -1, 69, -1, -1, -1, -1, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 69, 75, -1, -1, -1, 75, -1, -1, -1, -1, 75, 75, 75, 75, 75, 75, 75, 75, 75, 75, 75, 75, 75, 75, 76, -1, -1, -1, 76, -1, -1, -1, -1, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 91, -1, -1, -1, -1, 91, 91, 91, 91, 91, 91, 91, 91, 91, 91, 91, 91, 91, 91, -1, -1, 92, -1, -1, -1, 91, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 359, 99, 99, -1, -1, -1, 92, 99, -1, 359, 359, -1, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 102, 102, -1, -1, -1, -1, 102, -1, -1, -1, -1, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 103, 103, -1, -1, -1, -1, 103, -1, -1, -1, -1, 103, 103, 103, 103, 103, 103, 103, 103, 103, 103, 103, 103, 103, 117, -1, -1, -1, 117, -1, -1, -1, -1, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 120, -1, -1, -1, 120, -1, -1, -1, -1, 120, 120, 120, 120, 120, 120, 120, 120, 120, 120, 120, 120, 120, 120, 121, -1, -1, -1, 121, -1, -1, -1, -1, 121, 121, 121, 121, 121, 121, 121, 121, 121, 121, 121, 121, 121, 121, 152, -1, -1, -1, 152, 152, 152, 152, 152, 152, 152, 152, 152, 152, 152, 152, 152, 152, 152, 153, -1, -1, -1, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 161, -1, -1, -1, -1, 161, 161, 161, 161, 161, 161, 161, 161, 161, 161, 161, 161, 161, 161, -1, -1, 162, -1, -1, -1, 161, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, -1, 165, 165, -1, -1, -1, 162, 165, -1, -1, -1, -1, 165, 165, 165, 165, 165, 165, 165, 165, 165, 165, 165, 165, 165, 166, 166, -1, -1, -1, -1, 166, -1, -1, -1, -1, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 167, 167, -1, -1, -1, -1, 167, -1, -1, -1, -1, 167, 167, 167, 167, 167, 167, 167, 167, 167, 167, 167, 167, 167, 170, 170, -1, -1, -1, -1, 170, -1, -1, -1, -1, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 171, 171, -1, -1, -1, -1, 171, -1, -1, -1, -1, 171, 171, 171, 171, 171, 171, 171, 171, 171, 171, 171, 171, 171, 180, 180, -1, -1, -1, 180, -1, -1, -1, -1, 180, 180, 180, 180, 180, 180, 180, 180, 180, 180, 180, 180, 180, 181, 181, -1, -1, -1, 181, -1, -1, -1, -1, 181, 181, 181, 181, 181, 181, 181, 181, 181, 181, 181, 181, 181, 183, 183, -1, -1, -1, 183, -1, -1, -1, -1, 183, 183, 183, 183, 183, 183, 183, 183, 183, 183, 183, 183, 183, 200, -1, -1, 200, -1, -1, -1, 200, -1, -1, -1, -1, 200, 200, 200, 200, 200, 200, 200, 200, 200, 200, 200, 200, 200, 202, -1, -1, -1, 202, -1, -1, -1, -1, 202, 202, 202, 202, 202, 202, 202, 202, 202, 202, 202, 202, 202, 202, 211, -1, -1, -1, -1, 211, 211, 211, 211, 211, 211, 211, 211, 211, 211, 211, 211, 211, 211, -1, -1, -1, 222, -1, -1, 211, 222, 222, 222, 222, 222, 222, 222, 222, 222, 222, 222, 222, 222, 222, 222, 225, -1, -1, -1, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 226, -1, -1, -1, 226, 226, 226, 226, 226, 226, 226, 226, 226, 226, 226, 226, 226, 226, 226, 239, -1, -1, -1, -1, -1, -1, 239, -1, -1, -1, -1, 239, 239, 239, 239, 239, 239, 239, 239, 239, 239, 239, 239, 239, -1, -1, -1, 241, -1, -1, -1, 239, 241, 241, 241, 241, 241, 241, 241, 241, 241, 241, 241, 241, 241, 241, -1, 243, 243, -1, -1, -1, 241, 243, -1, -1, -1, -1, 243, 243, 243, 243, 243, 243, 243, 243, 243, 243, 243, 243, 243, 248, 248, -1, -1, -1, 248, -1, -1, -1, -1, 248, 248, 248, 248, 248, 248, 248, 248, 248, 248, 248, 248, 248, 251, 251, -1, -1, -1, 251, -1, -1, -1, -1, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 252, 252, -1, -1, -1, 252, -1, -1, -1, -1, 252, 252, 252, 252, 252, 252, 252, 252, 252, 252, 252, 252, 252, 261, -1, -1, 261, -1, -1, -1, 261, -1, -1, -1, -1, 261, 261, 261, 261, 261, 261, 261, 261, 261, 261, 261, 261, 261, 268, -1, -1, -1, 268, -1, -1, -1, -1, 268, 268, 268, 268, 268, 268, 268, 268, 268, 268, 268, 268, 268, 268, 270, -1, -1, -1, 270, -1, -1, -1, -1, 270, 270, 270, 270, 270, 270, 270, 270, 270, 270, 270, 270, 270, 270, 280, -1, -1, -1, -1, 280, 280, 280, 280, 280, 280, 280, 280, 280, 280, 280, 280, 280, 280, 291, -1, -1, -1, -1, -1, 280, 291, -1, -1, -1, 291, 291, 291, 291, 291, 291, 291, 291, 291, 291, 291, 291, 291, 291, 293, -1, -1, -1, 293, 293, 293, 293, 293, 293, 293, 293, 293, 293, 293, 293, 293, 293, 293, 300, -1, -1, -1, -1, -1, -1, 300, -1, -1, -1, -1, 300, 300, 300, 300, 300, 300, 300, 300, 300, 300, 300, 300, 300, 307, 307, -1, -1, -1, -1, 307, 300, -1, -1, -1, 307, 307, 307, 307, 307, 307, 307, 307, 307, 307, 307, 307, 307, 309, 309, -1, -1, -1, -1, 309, -1, -1, -1, -1, 309, 309, 309, 309, 309, 309, 309, 309, 309, 309, 309, 309, 309, 313, 313, -1, -1, -1, 313, -1, -1, -1, -1, 313, 313, 313, 313, 313, 313, 313, 313, 313, 313, 313, 313, 313, 314, 314, -1, -1, -1, 314, -1, -1, -1, -1, 314, 314, 314, 314, 314, 314, 314, 314, 314, 314, 314, 314, 314, 315, 315, -1, -1, -1, 315, -1, -1, -1, -1, 315, 315, 315, 315, 315, 315, 315, 315, 315, 315, 315, 315, 315, 318, 318, -1, -1, -1, 318, -1, -1, -1, -1, 318, 318, 318, 318, 318, 318, 318, 318, 318, 318, 318, 318, 318, 319, 319, -1, -1, -1, 319, -1, -1, -1, -1, 319, 319, 319, 319, 319, 319, 319, 319, 319, 319, 319, 319, 319, 329, -1, -1, -1, -1, 329, 329, 329, 329, 329, 329, 329, 329, 329, 329, 329, 329, 329, 329, 337, -1, -1, -1, -1, -1, 329, 337, -1, -1, -1, 337, 337, 337, 337, 337, 337, 337, 337, 337, 337, 337, 337, 337, 337, 344, -1, -1, -1, 344, 344, 344, 344, 344, 344, 344, 344, 344, 344, 344, 344, 344, 344, 344, 346, -1, -1, -1, 346, 346, 346, 346, 346, 346, 346, 346, 346, 346, 346, 346, 346, 346, 346, 352, 352, -1, -1, -1, 352, -1, -1, -1, -1, 352, 352, 352, 352, 352, 352, 352, 352, 352, 352, 352, 352, 352, 355, -1, -1, 355, -1, -1, -1, 355, -1, -1, -1, -1, 355, 355, 355, 355, 355, 355, 355, 355, 355, 355, 355, 355, 355, 364, -1, -1, -1, -1, -1, -1, 364, -1, -1, -1, -1, 364, 364, 364, 364, 364, 364, 364, 364, 364, 364, 364, 364, 364, 367, 367, -1, -1, -1, 367, -1, 364, -1, -1, 367, 367, 367, 367, 367, 367, 367, 367, 367, 367, 367, 367, 367, 369, 369, -1, -1, -1, 369, -1, -1, -1, -1, 369, 369, 369, 369, 369, 369, 369, 369, 369, 369, 369, 369, 369, 372, -1, -1, -1, -1, -1, -1, 372, -1, -1, -1, 372, 372, 372, 372, 372, 372, 372, 372, 372, 372, 372, 372, 372, 372, 113, -1, -1, -1, 113, -1, -1, -1, -1, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 114, -1, -1, -1, 114, -1, -1, -1, -1, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 116, -1, -1, -1, 116, -1, -1, -1, -1, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 157, -1, -1, -1, -1, 157, 157, 157, 157, 157, 157, 157, 157, 157, 157, 157, 157, 157, -1, -1, -1, 158, -1, -1, -1, 157, 158, 158, 158, 158, 158, 158, 158, 158, 158, 158, 158, 158, 158, -1, -1, -1, 160, -1, -1, -1, 158, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 195, -1, -1, -1, 195, -1, -1, 160, -1, 195, 195, 195, 195, 195, 195, 195, 195, 195, 195, 195, 195, 195, 198, -1, -1, -1, 198, -1, -1, -1, -1, 198, 198, 198, 198, 198, 198, 198, 198, 198, 198, 198, 198, 198, 199, -1, -1, -1, 199, -1, -1, -1, -1, 199, 199, 199, 199, 199, 199, 199, 199, 199, 199, 199, 199, 199, 218, -1, -1, -1, 218, 218, 218, 218, 218, 218, 218, 218, 218, 218, 218, 218, 218, 218, 219, -1, -1, -1, 219, 219, 219, 219, 219, 219, 219, 219, 219, 219, 219, 219, 219, 219, 221, -1, -1, -1, 221, 221, 221, 221, 221, 221, 221, 221, 221, 221, 221, 221, 221, 221, 234, -1, -1, -1, -1, 234, 234, 234, 234, 234, 234, 234, 234, 234, 234, 234, 234, 234, -1, -1, -1, 237, -1, -1, -1, 234, 237, 237, 237, 237, 237, 237, 237, 237, 237, 237, 237, 237, 237, -1, -1, -1, 238, -1, -1, -1, 237, 238, 238, 238, 238, 238, 238, 238, 238, 238, 238, 238, 238, 238, 258, -1, -1, -1, 258, -1, -1, 238, -1, 258, 258, 258, 258, 258, 258, 258, 258, 258, 258, 258, 258, 258, 259, -1, -1, -1, 259, -1, -1, -1, -1, 259, 259, 259, 259, 259, 259, 259, 259, 259, 259, 259, 259, 259, 260, -1, -1, -1, 260, -1, -1, -1, -1, 260, 260, 260, 260, 260, 260, 260, 260, 260, 260, 260, 260, 260, 263, -1, -1, -1, 263, -1, -1, -1, -1, 263, 263, 263, 263, 263, 263, 263, 263, 263, 263, 263, 263, 263, 264, -1, -1, -1, 264, -1, -1, -1, -1, 264, 264, 264, 264, 264, 264, 264, 264, 264, 264, 264, 264, 264, 286, -1, -1, -1, 286, 286, 286, 286, 286, 286, 286, 286, 286, 286, 286, 286, 286, 286, 289, -1, -1, -1, 289, 289, 289, 289, 289, 289, 289, 289, 289, 289, 289, 289, 289, 289, 290, -1, -1, -1, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 297, -1, -1, -1, -1, 297, 297, 297, 297, 297, 297, 297, 297, 297, 297, 297, 297, 297, -1, -1, -1, 298, -1, -1, -1, 297, 298, 298, 298, 298, 298, 298, 298, 298, 298, 298, 298, 298, 298, -1, -1, -1, 299, -1, -1, -1, 298, 299, 299, 299, 299, 299, 299, 299, 299, 299, 299, 299, 299, 299, -1, -1, -1, 302, -1, -1, -1, 299, 302, 302, 302, 302, 302, 302, 302, 302, 302, 302, 302, 302, 302, -1, -1, -1, 303, -1, -1, -1, 302, 303, 303, 303, 303, 303, 303, 303, 303, 303, 303, 303, 303, 303, 327, -1, -1, -1, 327, -1, -1, 303, -1, 327, 327, 327, 327, 327, 327, 327, 327, 327, 327, 327, 327, 327, 334, -1, -1, -1, 334, 334, 334, 334, 334, 334, 334, 334, 334, 334, 334, 334, 334, 334, 335, -1, -1, -1, 335, 335, 335, 335, 335, 335, 335, 335, 335, 335, 335, 335, 335, 335, 336, -1, -1, -1, 336, 336, 336, 336, 336, 336, 336, 336, 336, 336, 336, 336, 336, 336, 339, -1, -1, -1, 339, 339, 339, 339, 339, 339, 339, 339, 339, 339, 339, 339, 339, 339, 340, -1, -1, -1, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 350, -1, -1, -1, -1, 350, 350, 350, 350, 350, 350, 350, 350, 350, 350, 350, 350, 350, 354, -1, -1, -1, 354, -1, -1, 350, -1, 354, 354, 354, 354, 354, 354, 354, 354, 354, 354, 354, 354, 354, 356, -1, -1, -1, 356, -1, -1, -1, -1, 356, 356, 356, 356, 356, 356, 356, 356, 356, 356, 356, 356, 356, 360, -1, -1, -1, 360, 360, 360, 360, 360, 360, 360, 360, 360, 360, 360, 360, 360, 360, 363, -1, -1, -1, -1, 363, 363, 363, 363, 363, 363, 363, 363, 363, 363, 363, 363, 363, -1, -1, -1, 365, -1, -1, -1, 363, 365, 365, 365, 365, 365, 365, 365, 365, 365, 365, 365, 365, 365, -1, -1, -1, -1, 371, -1, -1, 365, 371, 371, 371, 371, 371, 371, 371, 371, 371, 371, 371, 371, 371, 371, 373, -1, -1, -1, 373, 373, 373, 373, 373, 373, 373, 373, 373, 373, 373, 373, 373, 373, 294, -1, -1, 294, 49, 49, -1, -1, 294, 294, 294, 294, 294, 294, 348, 49, 49, 348, 177, 177, -1, -1, 348, 348, 348, 348, 348, 348, 177, 177, 294, 294, 294, 294, 294, -1, 294, -1, -1, -1, -1, -1, -1, -1, 348, 348, 348, 348, 348, 129, 348, -1, 129, -1, 310, 310, -1, 129, 129, 129, 129, 129, 129, 131, 310, 310, 131, -1, -1, -1, -1, 131, 131, 131, 131, 131, 131, -1, -1, 129, 129, 129, 129, 129, 155, 155, 155, 155, 155, 155, 155, 155, -1, 131, 131, 131, 131, 131, 133, -1, -1, 133, -1, -1, 155, -1, 133, 133, 133, 133, 133, 133, 134, -1, -1, 134, -1, -1, -1, -1, 134, 134, 134, 134, 134, 134, -1, -1, 133, 133, 133, 133, 133, 216, 216, 216, 216, 216, 216, 216, 216, 216, 134, 134, 134, 134, 134, 135, -1, -1, 135, -1, -1, -1, -1, 135, 135, 135, 135, 135, 135, 137, -1, -1, 137, -1, -1, -1, -1, 137, 137, 137, 137, 137, 137, -1, -1, 135, 135, 135, 135, 135, 273, 273, 273, 273, 273, 273, 273, 273, -1, 137, 137, 137, 137, 137, 139, -1, -1, 139, -1, -1, 273, -1, 139, 139, 139, 139, 139, 139, 141, -1, -1, 141, -1, -1, -1, -1, 141, 141, 141, 141, 141, 141, -1, -1, 139, 139, 139, 139, 139, 330, 330, 330, 330, 330, 330, 330, 330, 330, 141, 141, 141, 141, 141, 142, -1, -1, 142, -1, -1, -1, -1, 142, 142, 142, 142, 142, 142, 207, -1, -1, 207, -1, -1, -1, -1, 207, 207, 207, 207, 207, 207, -1, -1, 142, 142, 142, 142, 142, -1, -1, -1, -1, -1, -1, -1, -1, -1, 207, 207, 207, 207, 207, 271, -1, -1, 271, -1, -1, -1, -1, 271, 271, 271, 271, 271, 271, 281, -1, -1, 281, -1, -1, -1, -1, 281, 281, 281, 281, 281, 281, -1, -1, 271, 271, 271, 271, 271, -1, -1, -1, -1, -1, -1, -1, -1, -1, 281, 281, 281, 281, 281, 331, -1, -1, 331, -1, -1, -1, -1, 331, 331, 331, 331, 331, 331, 332, -1, -1, 332, -1, -1, -1, -1, 332, 332, 332, 332, 332, 332, -1, -1, 331, 331, 331, 331, 331, -1, -1, -1, -1, -1, -1, -1, -1, -1, 332, 332, 332, 332, 332, 347, -1, -1, 347, -1, -1, -1, -1, 347, 347, 347, 347, 347, 347, 361, -1, -1, 361, -1, -1, -1, -1, 361, 361, 361, 361, 361, 361, -1, -1, 347, 347, 347, 347, 347, -1, -1, -1, -1, -1, -1, -1, -1, -1, 361, 361, 361, 361, 361, 47, -1, -1, 47, 52, 52, -1, -1, 47, 47, 47, 47, 47, 47, -1, 52, 52, 52, 52, 52, 52, 52, 52, 59, 59, -1, -1, -1, -1, 59, 47, 47, 47, 47, 59, 59, 59, 59, 59, 59, 59, 59, 59, 128, -1, -1, 128, 163, 163, -1, -1, 128, 128, 128, 128, 128, 128, -1, 163, 163, 163, 163, 163, 163, 163, 163, 164, 164, -1, -1, -1, -1, 164, 128, 128, 128, 128, 164, 164, 164, 164, 164, 164, 164, 164, 164, 179, 179, -1, -1, -1, 179, -1, -1, -1, -1, 179, 179, 179, 179, 179, 179, 179, 179, 179, 215, -1, -1, 215, -1, -1, -1, -1, 215, 215, 215, 215, 215, 215, 230, -1, -1, 230, -1, -1, -1, -1, 230, 230, 230, 230, 230, 230, -1, -1, 215, 215, 215, 215, -1, -1, -1, -1, 312, 312, -1, -1, -1, 312, 230, 230, 230, 230, 312, 312, 312, 312, 312, 312, 312, 312, 312, 112, -1, -1, -1, 112, -1, -1, -1, -1, 112, 112, 112, 112, 112, 112, 112, 112, 112, 156, -1, -1, -1, -1, 156, 156, 156, 156, 156, 156, 156, 156, 156, -1, -1, -1, -1, -1, -1, -1, -1, 217, -1, -1, 156, 217, 217, 217, 217, 217, 217, 217, 217, 217, 217, 257, -1, -1, -1, 257, -1, -1, -1, -1, 257, 257, 257, 257, 257, 257, 257, 257, 257, 296, -1, -1, -1, -1, 296, 296, 296, 296, 296, 296, 296, 296, 296, -1, -1, -1, -1, -1, -1, -1, -1, 333, -1, -1, 296, 333, 333, 333, 333, 333, 333, 333, 333, 333, 333, 73, -1, -1, 73, -1, 73, 73, -1, 73, 73, 73, 73, 73, 73, 119, -1, -1, 119, -1, 119, 119, -1, 119, 119, 119, 119, 119, 119, 150, -1, -1, 150, -1, 150, 150, -1, 150, 150, 150, 150, 150, 150, 169, -1, -1, 169, -1, 169, 169, 111, 169, 169, 169, 169, 169, 169, 178, 178, 111, 111, 111, 111, 111, 111, 111, 111, 178, 178, 178, 178, 178, 178, 178, 178, 186, -1, -1, 186, -1, 186, 186, -1, 186, 186, 186, 186, 186, 186, 224, -1, -1, 224, -1, 224, 224, -1, 224, 224, 224, 224, 224, 224, 262, -1, -1, 262, -1, 262, 262, -1, 262, 262, 262, 262, 262, 262, 276, -1, -1, 276, -1, 276, 276, -1, 276, 276, 276, 276, 276, 276, 301, -1, -1, 301, -1, 301, 301, 256, 301, 301, 301, 301, 301, 301, 311, 311, 256, 256, 256, 256, 256, 256, 256, 256, 311, 311, 311, 311, 311, 311, 311, 311, 317, -1, -1, 317, -1, 317, 317, -1, 317, 317, 317, 317, 317, 317, 338, -1, -1, 338, -1, 338, 338, -1, 338, 338, 338, 338, 338, 338, 89, -1, -1, 89, -1, -1, -1, -1, 89, 89, 89, 89, 89, 89, 30, -1, -1, 30, -1, -1, -1, -1, 30, 30, 30, 30, 30, 30, 41, -1, -1, 41, -1, -1, -1, 89, 41, 41, 41, 41, 41, 41, 50, -1, -1, 50, -1, -1, -1, -1, 50, 50, 50, 50, 50, 50, 51, -1, -1, 51, -1, -1, -1, -1, 51, 51, 51, 51, 51, 51, 53, -1, -1, 53, -1, -1, -1, -1, 53, 53, 53, 53, 53, 53, 54, -1, -1, 54, -1, -1, -1, -1, 54, 54, 54, 54, 54, 54, 55, -1, -1, 55, -1, -1, -1, -1, 55, 55, 55, 55, 55, 55, 56, -1, -1, 56, -1, -1, -1, -1, 56, 56, 56, 56, 56, 56, 57, -1, -1, 57, -1, -1, -1, -1, 57, 57, 57, 57, 57, 57, 58, -1, -1, 58, -1, -1, -1, -1, 58, 58, 58, 58, 58, 58, 60, -1, -1, 60, -1, -1, -1, -1, 60, 60, 60, 60, 60, 60, 61, -1, -1, 61, -1, -1, -1, -1, 61, 61, 61, 61, 61, 61, 63, -1, -1, 63, -1, -1, -1, -1, 63, 63, 63, 63, 63, 63, 64, -1, -1, 64, -1, -1, -1, -1, 64, 64, 64, 64, 64, 64, 65, -1, -1, 65, -1, -1, -1, -1, 65, 65, 65, 65, 65, 65, 66, -1, -1, 66, -1, -1, -1, -1, 66, 66, 66, 66, 66, 66, 74, -1, -1, 74, -1, -1, -1, -1, 74, 74, 74, 74, 74, 74, 87, -1, -1, 87, -1, -1, -1, -1, 87, 87, 87, 87, 87, 87, 88, -1, -1, 88, -1, -1, -1, -1, 88, 88, 88, 88, 88, 88, 90, -1, -1, 90, -1, -1, -1, -1, 90, 90, 90, 90, 90, 90, 95, -1, -1, 95, -1, -1, -1, -1, 95, 95, 95, 95, 95, 95, 96, -1, -1, 96, -1, -1, -1, -1, 96, 96, 96, 96, 96, 96, 97, -1, -1, 97, -1, -1, -1, -1, 97, 97, 97, 97, 97, 97, 98, -1, -1, 98, -1, -1, -1, -1, 98, 98, 98, 98, 98, 98, 101, -1, -1, 101, -1, -1, -1, -1, 101, 101, 101, 101, 101, 101, 105, -1, -1, 105, -1, -1, -1, -1, 105, 105, 105, 105, 105, 105, 145, -1, -1, 145, -1, -1, -1, -1, 145, 145, 145, 145, 145, 145, 149, -1, -1, 149, -1, -1, -1, -1, 149, 149, 149, 149, 149, 149, 151, -1, -1, 151, -1, -1, -1, -1, 151, 151, 151, 151, 151, 151, 175, -1, -1, 175, -1, -1, -1, -1, 175, 175, 175, 175, 175, 175, 191, -1, -1, 191, -1, -1, -1, -1, 191, 191, 191, 191, 191, 191, 192, -1, -1, 192, -1, -1, -1, -1, 192, 192, 192, 192, 192, 192, 193, -1, -1, 193, -1, -1, -1, -1, 193, 193, 193, 193, 193, 193, 194, -1, -1, 194, -1, -1, -1, -1, 194, 194, 194, 194, 194, 194, 197, -1, -1, 197, -1, -1, -1, -1, 197, 197, 197, 197, 197, 197, 208, -1, -1, 208, -1, -1, -1, -1, 208, 208, 208, 208, 208, 208, 231, -1, -1, 231, -1, -1, -1, -1, 231, 231, 231, 231, 231, 231, 232, -1, -1, 232, -1, -1, -1, -1, 232, 232, 232, 232, 232, 232, 233, -1, -1, 233, -1, -1, -1, -1, 233, 233, 233, 233, 233, 233, 236, -1, -1, 236, -1, -1, -1, -1, 236, 236, 236, 236, 236, 236, 244, -1, -1, 244, -1, -1, -1, -1, 244, 244, 244, 244, 244, 244, 245, -1, -1, 245, -1, -1, -1, -1, 245, 245, 245, 245, 245, 245, 246, -1, -1, 246, -1, -1, -1, -1, 246, 246, 246, 246, 246, 246, 247, -1, -1, 247, -1, -1, -1, -1, 247, 247, 247, 247, 247, 247, 250, -1, -1, 250, -1, -1, -1, -1, 250, 250, 250, 250, 250, 250, 282, -1, -1, 282, -1, -1, -1, -1, 282, 282, 282, 282, 282, 282, 283, -1, -1, 283, -1, -1, -1, -1, 283, 283, 283, 283, 283, 283, 284, -1, -1, 284, -1, -1, -1, -1, 284, 284, 284, 284, 284, 284, 285, -1, -1, 285, -1, -1, -1, -1, 285, 285, 285, 285, 285, 285, 288, -1, -1, 288, -1, -1, -1, -1, 288, 288, 288, 288, 288, 288, 39, -1, 40, 39, -1, 40, -1, -1, 39, 39, 40, 40, 39, 39, 40, 40, 68, -1, 71, 68, -1, 71, -1, -1, 68, 68, 71, 71, 68, 68, 71, 71, 100, -1, 115, 100, -1, 115, -1, -1, 100, 100, 115, 115, 100, 100, 115, 115, 159, -1, 182, 159, -1, 182, -1, -1, 159, 159, 182, 182, 159, 159, 182, 182, 196, -1, 220, 196, -1, 220, -1, -1, 196, 196, 220, 220, 196, 196, 220, 220, 235, -1, 249, 235, -1, 249, -1, -1, 235, 235, 249, 249, 235, 235, 249, 249, 287, -1, -1, 287, -1, -1, -1, -1, 287, 287, -1, -1, 287, 287, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1], 'action_value': [-82, -82, -82, 2, 3, 4, 5, -82, 3, 4, 5, -2, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 74, -73, -73, -5, -5, -5, -5, -73, -6, -6, -6, -6, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -82, 3, 4, 5, -82, -82, -82, -82, -7, -7, -7, -7, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 15, -82, -82, 27, 28, -82, -82, 3, 4, 5, -1, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 151, 23, -15, -15, 150, -16, -16, -73, -4, -4, -4, -4, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, 187, -8, -73, -73, 36, 35, -73, -73, -18, -18, -18, -18, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, 74, -79, -79, -12, -12, -12, -12, -79, -36, -36, -36, -36, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, 277, 23, -9, 25, -79, -16, -16, -79, -26, -26, 51, 52, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, 187, 14, -79, -79, 134, 0, -79, -79, -3, -3, -3, 13, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -75, -75, -13, -13, -13, -82, -75, 51, 52, -25, -25, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, -76, -40, 216, 51, 52, -76, 231, 51, 52, -82, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -72, -72, -14, -14, 85, 28, -72, 51, 52, 51, 52, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, 72, -82, 111, -43, -82, -42, -24, -24, -82, 176, 177, 51, 52, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -77, -77, 176, 269, 176, 281, -77, 176, 308, 176, 324, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, -78, 83, 176, 345, 19, -78, 176, 355, 176, 359, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -82, -82, -82, 176, 364, 176, 368, -82, 176, 372, 24, 126, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -75, -75, 21, -82, -82, -75, 23, 31, 33, 48, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, -76, 25, -10, -11, -76, 47, 83, 82, 45, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -74, -74, -82, -13, 143, 124, -74, 78, 129, 138, 140, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, 120, 203, 142, -73, 148, 94, 174, -73, 105, 191, 51, 52, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -82, 242, 109, 214, 144, 229, 155, -82, 267, 201, 51, 52, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 146, 216, 306, -78, 240, 322, -82, 254, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -82, -23, -22, -17, 343, 292, -78, -82, 0, 0, 0, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 170, -73, -73, 0, 0, 0, 0, -73, 0, -23, -22, -17, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -81, -81, 0, 0, 0, 0, -81, 0, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -72, -72, 0, 0, 0, -72, 0, 0, 0, 0, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, 72, -77, -77, 0, 0, 0, -77, 0, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, -78, 0, 0, 0, -78, 0, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -80, -80, 0, 0, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, 151, 244, -36, 0, 0, 0, 0, -73, 0, 0, 51, 52, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, 225, 0, 0, 0, 0, 0, -73, -73, 0, 0, -36, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -82, 256, -82, -82, 0, 0, 0, -82, 0, 0, 51, 52, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -74, -74, 0, 0, 0, -74, 0, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, 120, 294, 0, -79, 0, 0, 0, -79, 0, 0, 51, 52, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -80, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, 170, -79, -79, 0, 0, 0, -80, -79, 0, 0, 0, 0, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, 318, 328, -73, -73, 0, 0, 0, -73, 0, 0, 51, 52, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -81, -81, 0, 0, 0, -81, 0, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, -80, 0, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, 151, 351, 0, 0, 0, 0, 0, -79, 0, 0, 51, 52, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, 225, 0, 0, 0, 0, 0, -79, -79, 0, 0, 0, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -81, 0, 0, -81, 0, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, 318, 353, -79, -79, 0, 0, -81, -79, 0, 0, 51, 52, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -66, -66, 0, 0, 0, 0, -66, 0, 0, 0, 0, -66, -66, -66, -66, -66, -66, -66, -66, -66, 64, 65, 66, 67, -68, -68, 0, 0, 0, 0, -68, 0, 0, 0, 0, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -70, -70, 0, 0, 0, 0, -70, 0, 0, 0, 0, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -75, 0, 0, 0, -75, 0, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, 0, 0, 0, -76, 0, 0, 0, 0, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -75, 0, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, 0, 0, -76, 0, 0, 0, -75, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, 361, -69, -69, 0, 0, 0, -76, -69, 0, 51, 52, 0, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -75, -75, 0, 0, 0, 0, -75, 0, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, -76, 0, 0, 0, 0, -76, 0, 0, 0, 0, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -72, 0, 0, 0, -72, 0, 0, 0, 0, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, 72, -77, 0, 0, 0, -77, 0, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, 0, 0, 0, -78, 0, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -75, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, 0, 0, 0, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -72, 0, 0, 0, 0, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, 72, 0, 0, -77, 0, 0, 0, -72, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, 0, -65, -65, 0, 0, 0, -77, -65, 0, 0, 0, 0, -65, -65, -65, -65, -65, -65, -65, -65, -65, 64, 65, 66, 67, -67, -67, 0, 0, 0, 0, -67, 0, 0, 0, 0, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -71, -71, 0, 0, 0, 0, -71, 0, 0, 0, 0, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -77, -77, 0, 0, 0, 0, -77, 0, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, -78, 0, 0, 0, 0, -78, 0, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -66, -66, 0, 0, 0, -66, 0, 0, 0, 0, -66, -66, -66, -66, -66, -66, -66, -66, -66, 64, 65, 66, 67, -68, -68, 0, 0, 0, -68, 0, 0, 0, 0, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -70, -70, 0, 0, 0, -70, 0, 0, 0, 0, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -82, 0, 0, -82, 0, 0, 0, -82, 0, 0, 0, 0, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -74, 0, 0, 0, -74, 0, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -78, 0, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, 0, 0, 0, -72, 0, 0, -78, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, -72, 72, -77, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -82, 0, 0, 0, 0, 0, 0, -82, 0, 0, 0, 0, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, 0, 0, 0, -74, 0, 0, 0, -82, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, 0, -74, -74, 0, 0, 0, -74, -74, 0, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -69, -69, 0, 0, 0, -69, 0, 0, 0, 0, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -75, -75, 0, 0, 0, -75, 0, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, -76, 0, 0, 0, -76, 0, 0, 0, 0, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, 263, 0, 0, -73, 0, 0, 0, -73, 0, 0, 0, 0, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -81, 0, 0, 0, -81, 0, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, 0, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -81, 0, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -82, 0, 0, 0, 0, 0, -81, -82, 0, 0, 0, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -82, -74, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, 302, 0, 0, 0, 0, 0, 0, -73, 0, 0, 0, 0, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -81, -81, 0, 0, 0, 0, -81, -73, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, -80, 0, 0, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -65, -65, 0, 0, 0, -65, 0, 0, 0, 0, -65, -65, -65, -65, -65, -65, -65, -65, -65, 64, 65, 66, 67, -67, -67, 0, 0, 0, -67, 0, 0, 0, 0, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -71, -71, 0, 0, 0, -71, 0, 0, 0, 0, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -77, -77, 0, 0, 0, -77, 0, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, -78, 0, 0, 0, -78, 0, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, 339, 0, 0, 0, 0, 0, -80, -73, 0, 0, 0, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -73, -81, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -74, -74, 0, 0, 0, -74, 0, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, 263, 0, 0, -79, 0, 0, 0, -79, 0, 0, 0, 0, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, 302, 0, 0, 0, 0, 0, 0, -79, 0, 0, 0, 0, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -81, -81, 0, 0, 0, -81, 0, -79, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, -80, 0, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, 339, 0, 0, 0, 0, 0, 0, -79, 0, 0, 0, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -79, -66, 0, 0, 0, -66, 0, 0, 0, 0, -66, -66, -66, -66, -66, -66, -66, -66, -66, 64, 65, 66, 67, -68, 0, 0, 0, -68, 0, 0, 0, 0, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -70, 0, 0, 0, -70, 0, 0, 0, 0, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -66, 0, 0, 0, 0, -66, -66, -66, -66, -66, -66, -66, -66, -66, 64, 65, 66, 67, 0, 0, 0, -68, 0, 0, 0, -66, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, 0, 0, 0, -70, 0, 0, 0, -68, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -69, 0, 0, 0, -69, 0, 0, -70, 0, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -75, 0, 0, 0, -75, 0, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, 0, 0, 0, -76, 0, 0, 0, 0, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -66, 0, 0, 0, -66, -66, -66, -66, -66, -66, -66, -66, -66, -66, 64, 65, 66, 67, -68, 0, 0, 0, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -68, -70, 0, 0, 0, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -70, -69, 0, 0, 0, 0, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, 0, 0, 0, -75, 0, 0, 0, -69, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, 0, 0, 0, -76, 0, 0, 0, -75, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -65, 0, 0, 0, -65, 0, 0, -76, 0, -65, -65, -65, -65, -65, -65, -65, -65, -65, 64, 65, 66, 67, -67, 0, 0, 0, -67, 0, 0, 0, 0, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -71, 0, 0, 0, -71, 0, 0, 0, 0, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -77, 0, 0, 0, -77, 0, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, 0, 0, 0, -78, 0, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -69, 0, 0, 0, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -69, -75, 0, 0, 0, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -75, -76, 0, 0, 0, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -76, -65, 0, 0, 0, 0, -65, -65, -65, -65, -65, -65, -65, -65, -65, 64, 65, 66, 67, 0, 0, 0, -67, 0, 0, 0, -65, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, 0, 0, 0, -71, 0, 0, 0, -67, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, 0, 0, 0, -77, 0, 0, 0, -71, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, 0, 0, 0, -78, 0, 0, 0, -77, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -74, 0, 0, 0, -74, 0, 0, -78, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -65, 0, 0, 0, -65, -65, -65, -65, -65, -65, -65, -65, -65, -65, 64, 65, 66, 67, -67, 0, 0, 0, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -67, -71, 0, 0, 0, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -71, -77, 0, 0, 0, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -77, -78, 0, 0, 0, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -78, -74, 0, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -81, 0, 0, 0, -81, 0, 0, -74, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, 0, 0, 0, -80, 0, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -74, 0, 0, 0, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -74, -81, 0, 0, 0, 0, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, 0, 0, 0, -80, 0, 0, 0, -81, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, 0, 0, 0, 0, -81, 0, 0, -80, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -81, -80, 0, 0, 0, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -37, 0, 0, -37, -42, -42, 0, 0, -37, -37, -37, -37, -37, -37, -36, 51, 52, -36, -20, -20, 0, 0, -36, -36, -36, -36, -36, -36, 51, 52, -37, -37, -37, -37, -37, 0, 296, 0, 0, 0, 0, 0, 0, 0, -36, -36, -36, -36, -36, 94, -36, 0, 91, 0, -19, -19, 0, 38, 39, 40, 41, 92, 93, -28, 51, 52, -28, 0, 0, 0, 0, -28, -28, -28, -28, -28, -28, 0, 0, 87, 88, 89, 90, 131, -62, -62, 54, 55, 56, 57, 58, 59, 0, -28, -28, -28, -28, -28, -29, 0, 0, -29, 0, 0, -62, 0, -29, -29, -29, -29, -29, -29, -30, 0, 0, -30, 0, 0, 0, 0, -30, -30, -30, -30, -30, -30, 0, 0, -29, -29, -29, -29, -29, -62, -62, -62, 54, 55, 56, 57, 58, 59, -30, -30, -30, -30, -30, -31, 0, 0, -31, 0, 0, 0, 0, -31, -31, -31, -31, -31, -31, -32, 0, 0, -32, 0, 0, 0, 0, -32, -32, -32, -32, -32, -32, 0, 0, -31, -31, -31, -31, -31, -61, -61, 54, 55, 56, 57, 58, 59, 0, -32, -32, -32, -32, -32, -33, 0, 0, -33, 0, 0, -61, 0, -33, -33, -33, -33, -33, -33, -34, 0, 0, -34, 0, 0, 0, 0, -34, -34, -34, -34, -34, -34, 0, 0, -33, -33, -33, -33, -33, -61, -61, -61, 54, 55, 56, 57, 58, 59, -34, -34, -34, -34, -34, -35, 0, 0, -35, 0, 0, 0, 0, -35, -35, -35, -35, -35, -35, -27, 0, 0, -27, 0, 0, 0, 0, -27, -27, -27, -27, -27, -27, 0, 0, -35, -35, -35, -35, -35, 0, 0, 0, 0, 0, 0, 0, 0, 0, -27, -27, -27, -27, -27, 94, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, -39, 0, 0, -39, 0, 0, 0, 0, -39, -39, -39, -39, -39, -39, 0, 0, 87, 88, 89, 90, 273, 0, 0, 0, 0, 0, 0, 0, 0, 0, -39, -39, -39, -39, -39, 94, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, -36, 0, 0, -36, 0, 0, 0, 0, -36, -36, -36, -36, -36, -36, 0, 0, 87, 88, 89, 90, 333, 0, 0, 0, 0, 0, 0, 0, 0, 0, -36, -36, -36, -36, -36, 94, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, -38, 0, 0, -38, 0, 0, 0, 0, -38, -38, -38, -38, -38, -38, 0, 0, 87, 88, 89, 90, 349, 0, 0, 0, 0, 0, 0, 0, 0, 0, -38, -38, -38, -38, -38, 94, 0, 0, 91, -62, -62, 0, 0, 38, 39, 40, 41, 92, 93, 0, -62, -62, 54, 55, 56, 57, 58, 59, -64, -64, 0, 0, 0, 0, 62, 87, 88, 89, 90, -64, -64, -64, -64, -64, -64, -64, -64, 61, 94, 0, 0, 91, -61, -61, 0, 0, 38, 39, 40, 41, 92, 93, 0, -61, -61, 54, 55, 56, 57, 58, 59, -63, -63, 0, 0, 0, 0, 62, 87, 88, 89, 90, -63, -63, -63, -63, -63, -63, -63, -63, 61, -64, -64, 0, 0, 0, 62, 0, 0, 0, 0, -64, -64, -64, -64, -64, -64, -64, -64, 61, 94, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 94, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 0, 0, 87, 88, 89, 90, 0, 0, 0, 0, -63, -63, 0, 0, 0, 62, 87, 88, 89, 90, -63, -63, -63, -63, -63, -63, -63, -63, 61, -64, 0, 0, 0, 62, 0, 0, 0, 0, -64, -64, -64, -64, -64, -64, -64, -64, 61, 62, 0, 0, 0, 0, -64, -64, -64, -64, -64, -64, -64, -64, 61, 0, 0, 0, 0, 0, 0, 0, 0, 62, 0, 0, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, 61, -63, 0, 0, 0, 62, 0, 0, 0, 0, -63, -63, -63, -63, -63, -63, -63, -63, 61, 62, 0, 0, 0, 0, -63, -63, -63, -63, -63, -63, -63, -63, 61, 0, 0, 0, 0, 0, 0, 0, 0, 62, 0, 0, -63, -63, -63, -63, -63, -63, -63, -63, -63, -63, 61, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, -62, 38, 39, 40, 41, 107, 108, -62, -62, -62, -62, 54, 55, 56, 57, 58, 59, -62, -62, 54, 55, 56, 57, 58, 59, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, -61, 38, 39, 40, 41, 107, 108, -61, -61, -61, -61, 54, 55, 56, 57, 58, 59, -61, -61, 54, 55, 56, 57, 58, 59, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, -21, -21, 0, 38, 39, 40, 41, 107, 108, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 45, 0, 0, 42, 0, 0, 0, 0, 38, 39, 40, 41, 43, 44, 78, 0, 0, 75, 0, 0, 0, -41, 38, 39, 40, 41, 76, 77, -44, 0, 0, -44, 0, 0, 0, 0, -44, -44, -44, -44, -44, -44, -45, 0, 0, -45, 0, 0, 0, 0, -45, -45, -45, -45, -45, -45, -46, 0, 0, -46, 0, 0, 0, 0, -46, -46, -46, -46, -46, -46, -47, 0, 0, -47, 0, 0, 0, 0, -47, -47, -47, -47, -47, -47, -48, 0, 0, -48, 0, 0, 0, 0, -48, -48, -48, -48, -48, -48, -49, 0, 0, -49, 0, 0, 0, 0, -49, -49, -49, -49, -49, -49, -50, 0, 0, -50, 0, 0, 0, 0, -50, -50, -50, -50, -50, -50, -51, 0, 0, -51, 0, 0, 0, 0, -51, -51, -51, -51, -51, -51, -52, 0, 0, -52, 0, 0, 0, 0, -52, -52, -52, -52, -52, -52, -53, 0, 0, -53, 0, 0, 0, 0, -53, -53, -53, -53, -53, -53, -54, 0, 0, -54, 0, 0, 0, 0, -54, -54, -54, -54, -54, -54, -55, 0, 0, -55, 0, 0, 0, 0, -55, -55, -55, -55, -55, -55, -56, 0, 0, -56, 0, 0, 0, 0, -56, -56, -56, -56, -56, -56, -57, 0, 0, -57, 0, 0, 0, 0, -57, -57, -57, -57, -57, -57, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 155, 0, 0, 152, 0, 0, 0, 0, 38, 39, 40, 41, 153, 154, 155, 0, 0, 152, 0, 0, 0, 0, 38, 39, 40, 41, 153, 154, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 45, 0, 0, 42, 0, 0, 0, 0, 38, 39, 40, 41, 43, 44, 45, 0, 0, 42, 0, 0, 0, 0, 38, 39, 40, 41, 43, 44, 45, 0, 0, 42, 0, 0, 0, 0, 38, 39, 40, 41, 43, 44, 45, 0, 0, 42, 0, 0, 0, 0, 38, 39, 40, 41, 43, 44, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 109, 0, 0, 106, 0, 0, 0, 0, 38, 39, 40, 41, 107, 108, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 144, 0, 0, 91, 0, 0, 0, 0, 38, 39, 40, 41, 92, 93, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 109, 0, 0, 106, 0, 0, 0, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, 0, 0, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, 0, 0, 0, 38, 39, 40, 41, 107, 108, 109, 0, 0, 106, 0, 0, 0, 0, 38, 39, 40, 41, 107, 108, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, 155, 0, 0, 152, 0, 0, 0, 0, 38, 39, 40, 41, 153, 154, 155, 0, 0, 152, 0, 0, 0, 0, 38, 39, 40, 41, 153, 154, 155, 0, 0, 152, 0, 0, 0, 0, 38, 39, 40, 41, 153, 154, 155, 0, 0, 152, 0, 0, 0, 0, 38, 39, 40, 41, 153, 154, 78, 0, 0, 75, 0, 0, 0, 0, 38, 39, 40, 41, 76, 77, -58, 0, -59, -58, 0, -59, 0, 0, -58, -58, -59, -59, -58, -58, -59, -59, 45, 0, -60, 42, 0, -60, 0, 0, 38, 39, -60, -60, 43, 44, -60, -60, 105, 0, 78, 102, 0, 75, 0, 0, 38, 39, 38, 39, 103, 104, 76, 77, 144, 0, 109, 91, 0, 106, 0, 0, 38, 39, 38, 39, 92, 93, 107, 108, 201, 0, 155, 198, 0, 152, 0, 0, 38, 39, 38, 39, 199, 200, 153, 154, 240, 0, 254, 237, 0, 251, 0, 0, 38, 39, 38, 39, 238, 239, 252, 253, 292, 0, 0, 289, 0, 0, 0, 0, 38, 39, 0, 0, 290, 291, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], 'goto_base': [16, -6, 340, 340, 16, 340, 45, 78, 340, 340, 340, 27, 340, 340, 133, 108, 340, 340, 46, 340, 219, 340, 340, 340, 340, 340, 340, -6, 340, 340, 519, 53, 163, 340, 39, 84, 340, 340, 340, 340, 340, 535, 340, 340, 340, 340, 174, -7, 340, 68, 340, 340, 97, 340, 340, 340, 340, 340, 340, 115, 340, 340, 124, 340, 340, 340, 340, 340, 877, 340, 124, 340, 340, 233, 551, 340, 340, 340, 340, 340, 340, 194, 340, 340, 340, 340, 340, 567, 583, 599, 615, 340, 340, 340, 340, 791, 871, 951, 1022, 340, 57, 631, 340, 340, 340, 647, 340, 340, 340, 147, 340, 149, 156, 173, 340, 893, 340, 174, 340, 259, 340, 340, 340, 221, 114, 340, 340, 188, 23, 113, 340, 340, 188, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 663, 340, 222, 340, 679, 285, 695, 340, 340, 340, 202, 206, 206, 340, 909, 340, 206, 340, 232, 232, 232, 340, 340, 340, 311, 340, 340, 340, 224, 340, 711, 340, 236, 236, 236, 236, 340, 925, 340, 236, 340, 337, 340, 340, 340, 236, 807, 887, 967, 1038, 340, 87, 727, 340, 340, 340, 241, 340, 340, 340, 340, 340, 340, 823, 243, 340, 340, 340, 262, 8, 53, 243, 257, 257, 340, 941, 340, 257, 340, 363, 340, 340, 340, 288, 28, 83, 903, 983, 1045, 340, 117, 743, 340, 340, 340, 262, 340, 263, 340, 839, 919, 999, 1061, 340, 147, 759, 340, 340, 340, 264, 340, 264, 264, 264, 340, 340, 340, 389, 340, 340, 340, 314, 340, 340, 340, 340, 143, 340, 268, 270, 340, 415, 340, 285, 340, 340, 340, 855, 935, 1015, 1068, 340, 177, 775, 340, 340, 340, 286, 340, 340, 288, 286, 286, 340, 340, 340, 441, 340, 340, 340, 340, 340, 340, 340, 340, 290, 290, 290, 290, 340, 340, 340, 467, 340, 340, 340, 366, 340, 340, 340, 340, 295, 340, 340, 340, 295, 173, 340, 309, 309, 340, 340, 340, 493, 340, 340, 340, 392, 340, 340, 340, 340, 203, 340, 313, 340, 314, 340, 340, 340, 340, 340, 340, 340, 315, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340, 340], 'goto_value': [148, 29, 21, 136, 48, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 6, 7, 8, 9, 10, 11, 5, 19, 129, 131, 134, 135, 138, 140, 148, 281, 282, 136, 17, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 15, 8, 9, 10, 11, 294, 282, 31, 271, 131, 134, 135, 138, 140, 148, 45, 85, 136, 168, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 167, 170, 171, 172, 16, 9, 10, 11, 331, 131, 134, 135, 138, 140, 148, 94, 95, 136, 261, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 260, 263, 264, 265, 16, 9, 10, 11, 347, 131, 134, 135, 138, 140, 148, 127, 96, 136, 300, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 299, 302, 303, 304, 29, 97, 25, 28, 205, 207, 134, 135, 138, 140, 148, 98, 100, 136, 316, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 315, 318, 319, 320, 29, 191, 83, 28, 192, 207, 134, 135, 138, 140, 148, 127, 193, 136, 337, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 336, 339, 340, 341, 194, 203, 196, 124, 126, 207, 134, 135, 138, 140, 148, 206, 208, 136, 204, 132, 155, 156, 157, 158, 159, 160, 161, 162, 144, 146, 36, 231, 269, 275, 33, 308, 232, 233, 235, 207, 134, 135, 138, 140, 185, 270, 277, 324, 309, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 325, 96, 97, 98, 244, 245, 246, 247, 249, 191, 185, 208, 283, 328, 174, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 329, 284, 285, 287, 191, 191, 191, 192, 193, 194, 185, 231, 208, 345, 267, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 346, 208, 191, 361, 232, 233, 244, 245, 246, 247, 185, 191, 283, 355, 279, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 356, 284, 285, 191, 191, 191, 0, 0, 0, 0, 185, 0, 0, 364, 306, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 365, 0, 0, 0, 0, 0, 0, 0, 0, 0, 185, 0, 0, 368, 322, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 369, 0, 0, 0, 0, 0, 0, 0, 0, 0, 185, 0, 0, 372, 343, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 373, 0, 0, 0, 0, 0, 0, 0, 0, 0, 185, 0, 0, 0, 353, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 185, 0, 0, 0, 357, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 185, 0, 0, 0, 362, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 185, 0, 0, 0, 366, 177, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 72, 0, 0, 0, 370, 49, 52, 59, 62, 67, 68, 69, 70, 78, 79, 80, 118, 0, 0, 0, 0, 109, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 118, 0, 0, 0, 0, 201, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 223, 0, 0, 0, 0, 229, 216, 217, 218, 219, 220, 221, 222, 225, 226, 227, 223, 0, 0, 0, 0, 214, 216, 217, 218, 219, 220, 221, 222, 225, 226, 227, 210, 0, 0, 0, 0, 209, 155, 156, 157, 158, 159, 160, 161, 162, 211, 212, 118, 0, 0, 0, 0, 240, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 118, 0, 0, 0, 0, 242, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 118, 0, 0, 0, 0, 254, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 210, 0, 0, 0, 0, 274, 155, 156, 157, 158, 159, 160, 161, 162, 211, 212, 210, 0, 0, 0, 0, 278, 155, 156, 157, 158, 159, 160, 161, 162, 211, 212, 118, 0, 0, 0, 0, 292, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 185, 0, 0, 0, 0, 310, 178, 179, 180, 181, 182, 183, 184, 187, 188, 189, 118, 0, 0, 0, 0, 326, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 118, 0, 0, 0, 0, 349, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 118, 0, 0, 0, 0, 351, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 118, 0, 0, 0, 0, 359, 111, 112, 113, 114, 115, 116, 117, 120, 121, 122, 72, 0, 0, 0, 0, 0, 163, 59, 62, 67, 68, 69, 70, 78, 79, 80, 118, 0, 0, 0, 0, 0, 256, 112, 113, 114, 115, 116, 117, 120, 121, 122, 210, 0, 0, 0, 0, 0, 273, 156, 157, 158, 159, 160, 161, 162, 211, 212, 185, 0, 0, 0, 0, 0, 311, 179, 180, 181, 182, 183, 184, 187, 188, 189, 223, 0, 0, 0, 0, 0, 330, 217, 218, 219, 220, 221, 222, 225, 226, 227, 72, 0, 0, 0, 0, 0, 72, 164, 62, 67, 68, 69, 70, 78, 79, 80, 118, 99, 70, 78, 79, 80, 118, 257, 113, 114, 115, 116, 117, 120, 121, 122, 210, 195, 117, 120, 121, 122, 210, 296, 157, 158, 159, 160, 161, 162, 211, 212, 185, 234, 161, 162, 211, 212, 185, 312, 180, 181, 182, 183, 184, 187, 188, 189, 223, 248, 184, 187, 188, 189, 223, 333, 218, 219, 220, 221, 222, 225, 226, 227, 72, 286, 222, 225, 226, 227, 0, 0, 165, 67, 68, 69, 70, 78, 79, 80, 118, 0, 0, 0, 0, 0, 0, 0, 258, 114, 115, 116, 117, 120, 121, 122, 210, 0, 0, 0, 0, 0, 0, 0, 297, 158, 159, 160, 161, 162, 211, 212, 185, 0, 0, 0, 0, 0, 0, 0, 313, 181, 182, 183, 184, 187, 188, 189, 223, 0, 0, 0, 0, 0, 0, 72, 334, 219, 220, 221, 222, 225, 226, 227, 166, 68, 69, 70, 78, 79, 80, 118, 0, 0, 0, 0, 0, 0, 210, 0, 259, 115, 116, 117, 120, 121, 122, 298, 159, 160, 161, 162, 211, 212, 185, 0, 0, 0, 0, 0, 0, 223, 0, 314, 182, 183, 184, 187, 188, 189, 335, 220, 221, 222, 225, 226, 227, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]})
+
+
+_tables: Dict[Any, LRtable] = dict()  # by tokens enum, shared by the parsers of the process
+
+
 class Parser:
     def __init__(self, ast_types, tokens_type=None):
         if tokens_type:
             globals()["TOKEN_TYPE"] = tokens_type
         self.attributes_info = ast_types
-        self.table: LRtable = LRtable.deserialize("""{Wp48S^xk9=GL@E0stWa761SMbT8$j;u+p3Qe6N*0S;{*So@k!X(!_$dkC`jWrr3R=U*#h26E`Nq<yw#DvT+=UzIDL7`}m<0`c&cMIVm)q%ttB#GJ>^Lxl&?KpnI%q;AA35|MNiX<&TPiC9=s0cwaE7bba%;NR&>pSL`+wLfFudHgj<VEYbz5J8`ErbIBsv>V#QHt(~6X)34k8iLCs87$~Lo25zQ_+PNe(&&bQIH`ER-uAc0yVZ`JYK-f2Y^m6lHzHpj5c%|{7pm=>w3D<o3Vxzf0}rjDFS02(+x#OnHkik#s2V=Pf#f5xQ%P0<NoaZI(sKpPF^yNfv?1ZlA!{&@Ocl}%?2^4Y1VGzkW-{p~!jglT8#+{0YKJJ|{Uq-E?>Si%JFSx}(cSflI-&`F(?`cem1)wN5#@HwvF@MFz0(+Qi@*%7(w4dHJ6J&JCh34XCt5vD1B@FjtSSz6oK&*a>*PcQd<!66c!WH8d-n~Pk{gmI8KJ~sxe`1sRD4AaVr#_t3E%2ZO80ggH|`7^wE}l6wDkNl@3b+Dwql{inoX>|+Ee-PFsDxpLqW6ef)HW(ukik#+AlbKuTwp^rWs5|<?jLDL|iGcAHGq~esH#`YZ^+C6NJN+t%+zK|IK*gbrPc_f`q-XWTfMo*oj<)%dkn#mpn(I>5@(B&PGOUQDfH`cXx7fhe{Hs9#a5Cqf)z%5_#<wie0w6@Tk8vn~2z^@Yjfi?v}Y2&5MSKP5gUNW@fW}v*cOh5%3%>M6{d2$&uTrUJR9xJ7(qSqEl(9dV^mbww$=Ni86hEXV*OfAvK2+l6ExiVE8t%IM0I`E5r8n{Y^Tk`<lnyVMhm-9^rtakc?r9k!j8Epnh{LWU3v{1e_jz8Lp1Z$<tV^C$Yhm(UfFcF)uPkz?1V>&=;s^T308|Sz_*6v0tVe5ONqE?p7Na3i1PPxT&4hr5JQzni?k#gUSZ=B+J>c@5nH-%angDP=>AaSW2LgliXg}p9dsD5xaKKxPb4Gh&+ePAld;dg3R`#8(8xP_$CrjaB)4W;spzD*G!h!Vw(p8N3ikZSBt=M2a7skMtF{@H1DCx1Z5c^d`;s~tsT5pP_P+mQ0eh5;NKRHJaBQszB(hkpHJHi<blQXbpW-@gN!PDphfU3gpd@<B$Xk+eV^uFRUqyJec+whIg5Qd%qykpTFE%JQvd$21wwDOMvokq35~4P{}<+5ebo|;?Gs})bqLXM?qocz!|E|O36|0Ux2k>#iOT2VHamm5g*8Xw@x@b2EYE*q1Q#6+lSZJ^-R`lUhZtf?!RqZR+qH#A_v~bbQ|y{LMiyOW?UFBE100s?hZm*syn~$zMIWFDQ!AnL&$>53d%`A)`yuBmJU5JjSV7$2PduzVPe8bPrVIjEL~Ir@mBNGk8Xg+9T5$zkBl|;t!B&^ANyArLngrw(taQeY#-yE#aLT4OXCR2;j95rGgi7{0E+KELNLx*_$!D&`GV$fbPYVoTtXlQOIrYG*VedqDRcwW4V{r^o_9r^fFc-Awd5N>L9tcTckBmtppa3-gi#EJRR`W9-#Lsdb>(Xw2<&L`Fb2?h2823637R+08yyi{_;ed^Bz!m<G#w16AOA(^1e7Vc^EMF=})YTPQxL6^2o<Xhep^-C&Vj*><x48<fC?dwdRK*P%wwdjSMje5qdL|a8p=HS0YNihSll7xfIGGjm)=pgJ2dIt>)eb!@QGWv3n;%tG=vwnKl|rZNS6q|uFZ;#BVh>%SN`i7kRPkv-nQAu6b}=z+s?aa<Jlp@vKdm=Xy(XbVwTt~8=ChFA7Kgr&KWXEj5}71l<*H!Wc34UHVf0us0{uxdwaERKh@XX}lzA(&co3QWgoB?{cqKo(_&}C`wi<SM>@U-Nf5>*vv$)VxKkp!RS83l$FE-E$^l24&yAbF_>+<SCXo`az=4g6RoE>~c5ovQtL1`m)))Ju)vo>siGIw2F5$Rg2+>cO0`X&+3`ggQ4zT3beQH&@nYWO+FPxR{XtS!JSbwbN4w|F`4>1Q9M7?O~IzzbQZdISfr+c*#;M}3YFtDp>>9I<~#9HnbiUvBBE!)W$Pc+9)L)zX;{&t_8znY^EfUKpdp^xOCoZUx|=>Y^ov6R{fkhM5<qS*o)54qU7fB6OLm%4;1S)aAl&()(((j4{EfoOv!X(-u}oKFE6kh(fhj6IOP$lnA*0pz7rfa9%ty+4zNusT*n?RIc)@1RJTq-8$(i6W`w{8fQPx)t|E}vzGs!mE$l2SQ1ZtYt-R5;kt6iqJCNjea`M_AGa;n@}v5bO$54<d#I3k<Aod9FR|~O(S<xSTu5i*5@r+dIGF6hIn0~@+kwOliU*D_w6bxdZG9{_IQc&xEdlkggpS_ymv~fq(AyXoiZo4s#Hj?ulCVl=f4as1Q^eJe%I;z3Fq`p@xn2qt0pF~Kvc?A_EkmWH0q&7?ypf*-H+NFAZb5ybt|6gL1NE4_SWncHbZlA`Sm4NGIQpAa4cbj9h4;LO#@7of$l`VBX0Ok~nABs^TFzYrm{!JzgF=#!iY#D*_Ev2Duoz;3Zx#LuLu&b2LtZF!2&qKZiD&d>(tGwuBysKW+i@$p_*;<hnq$Wpung}M<~*rnqr6VX2JigrcGWslyUrMmfP#-72E#I5-_7)hs#JJ1Jpx#fY@n3Yv=%wzom0umzxBqfpsSiVyndVMq{ORjnL?yYc=x_bM%4#y44&V^?e^o8KP^gGH*~o!D4TtccJf52R_C*;pky~`hZ0Md1P(`aiVdxtyvucnf(TUguWLEz_DO}jhXCdu+uq%ty0<*qwqLdZh=Hm~ts6HJxO1BjN7#QEJ~z0UxN>BN_zclUx9s@Rq3O($K#hqJY2xw-#A@=cs&N|!tXyB=hlUjHRQHPBGL4nM|7D*+vySM&d{fYU{nt@xt$Qn}e)7~(XlelAS>$fFM_Eh5kl&=}w{JeDm;pZ@(;IwKmTs1s)hJ3j<LkPyexUsPkKYslA>8HQm6YmF8iL8UaCD79Sf>STbx~dDYih_bsdd@|o8Mhx;lJ;eJ6vx&iOfa$h_6stOYODF7x;wkf6lA@?3ud7vZ?m;a`LEH63RMKTrRPYGxWRA!xZ#q+gvt4N5j1d3uR&2s3S#jFzaFt*0n=<s(yBh4Gai{<iS62M0RxK)g{rMyX-l&yX|z-Y7k5}nHY7t+Z9W|&0&~*kErf|-@x?Q@DRyeTkv}c!>lL@kUjAtTMq^TWHw0&M_im#?sGT7L;siZXurb`jK#pAnKhX3>QF=t*(y}JfTRE@JGpon04hV5cNMHEN86v~tZ1m)Zk=+uat<yvm2c|=co!bzH~dzDs*3APIxe~RyLQ>rN5NMzQ))yEJMb@JzJAv3XD(0>`P?kOc3G~-wc@vUKl-Br$Jhd#MRwdd?%v<?&~KzpN#o3HwhIUtRnjUHxQQxU8U2MWw6N5RprjM0GU^zJ`Qwgi9(DRop}<F{jE8VEB2ZXpQxh(k4%Zu<+h|f9Ul(X?O8?IVFb^wt0EENiCu)AGCH=n=1ub&Z#hLp=7j1b9;{Yk!<1{wvv8=^Dl}pU*87He^kU})DRyX-P#F$7wNw*!qBzOqu&A$;621x@zF3>d{fT=EpSDv-{(Nxl^>mcA`Y^h<vh5B>*iN9%vqpXU{&mb1#Vl)X_*##m6_z>6~x!y$@1ll#)kLU5X<K95Pmzc#akn?;#UX&hM=n#(b`0o=0I9&9aQA~9ouKS(uICMgwJMTgaoVj@T09l;)={PkcT#I)yDM`O&M2<=eajW_53x`GH4Os!epoK_!4V=fo-?4B=#MEJ4vt74*7!(m?Aj$;$BOD*ulY4w5h8xM2NO#|Nr=%JRe|(^tSsREA+Q<RCI>|?AMAop7x5jKg!@9W1hYHu%{f&PQn~m)hh-a-h(LbJ#`KfvhDC<Mt-?d!n_J8R>_MqT%!~TOYIQHSSlTiVpnlXghHTWJd(a_l<01!n9Pl{12?;~`S%hjDbt+S)tGjC$Jc>}>9;0sPj#g49T@5JJMt-GJrdqOZMCD)#!Ho(vpjH%}M)~_7RL@DAH$YvGr(=;7EU<Tk(T%FzpMU0~vqRgkT6HN6-#lK!xl?<cZ&Gz0$zWli@`W)ue{J5dXgw8WgU3hYF{>0_wkAVL2Y(pBKOtEb1Pm@TcBqF{v|Nq4(R1N${{OSOfKR;zM&%faD1<m|osLS&!fc?ZDEMd$^8zRIWw2~+LlLTpWEFUydb`6t-UjCTY3LnH(KI)N2Q#WxHGyf6s!e}(Y%GYU+E~;(K!mkB+z~5Dx=1TUHoX(bH)xlTYJU>i%Q6Yn{C+IwYl{J;7*a}rNQ`jPiBpT&!3Mg$s$LVj$RIceL0`SiF3~>#P^@3#1?u25}`AAGnhkuFR2i@Hn5f6Ox<EB$bE?2z#f*y4`i0_BS?a#*u&K(|wK=D=zWVdAzx7CCFRly08LR^L5W^NZO2Z%z2=deNPX=#3+cZ^ULPqzXaU5>i;4iYhQXdta6R~R>>f?sKbqtn&Gj!W12?PJOymFnpWE9Ax9-id}`8|A$ln@rQYTn0pB!18{iGzU*GAU;d=44=5nl63f&JfB(TOJl5Ul3Mzcj^kkh!IJw-JY_rELF+)r`bH&3`-Qsuy5**Nk5Z(Os%R-W3{n6|f^57#s^ND4bomQ;gtewVOnw>>w*sqY(K)hU#RHWi*qd`!&q3JEXfN4qAIZ~xc-mru2A|({CX76DcSJM`4OR=n8B;E-fIwYcqit8=C2<aQ7d}GUWlnwg7XzW<bktJVRU8~)y!G6Cy8J)J#k1d05823o0r`S<N9dOu(G=G#u<8D~$%~dEXEeeCJ{vBe-fwB4+*=}YcQSwcB>~CaxV`uKB9J978shFBHAEkzSDa;mRrBI9uIOYE1y*mfRH^`gDId!$Pct8j+ohjoCM{7nh^HeD0bg(G%0k)&0WX4kHKtw8&u!~~7(ul1{Y?G|n@ufGXkitUp|)6jUY(p&J+*#(_Ak`udT8y{RlccEh!aN)zW=Za*IOUU%+Vsh(BRlIAUAfD^~tU$R=jAmDh*Ye*b6YI0pC}tW)m)IDS(lHP;IGH0=kl7fr>3M_PgM?K2;%WwAoM)&>L5?06fa&9r2}q?WV?~8a9)V^)UbV4pGNevWVH|{HspD2Rq|*as-4#<)=ft{(?AywB5Y=K71cj4RnTGe^k1A*kIL%uZU&s1^Vm8VPqO}Y?=$MEi5m#S0kGu+7OJ@`syJiOLdi*%Zgm0UQwma(kD7K7jn{x7R@ZH`uEgt`YiIp!Ecd*uZ!$*rNHgZHmSd8?vq_0_pp3Sy#sR{@~wgs<U9PPyaZisa~dCfekk-}%I)&LKSr@&b!-K=?T`o?VW=f${WV(v2OTFU%P5_P$VFce)pXT|v`Pua(M)p(LH^(eMmSW?@r~oEba@wRstm*)xSFh>=Wb^1+wy2D;gph>jsvhhM|Q>f5_Xxk!q-x$WeCr^sgIu=#jO%kGmbBb(V-(Q8jDRg9Vm$Jk^L0C{4#@{G5z~xXS~bY(<NlrCb5G9NHl{8WYovxbJOqLknw8E&&Gw4tRbAbR6lN1PW$95;hC5Ve5ILu=g8t2&kGjlF@V1XQFS4yj|J*-kHo6^=Phber=_Q*A|%r`dmQX2w=)^O$s`&;f1~%q-u9y~x#*QvbcX@EICS+}@$iLNo<gKT`;|4z;V+LL7|lNU{i|-PNcUf*{KSpc&7&k^mhA>I#5RU~nYp?@s}qjbTX%6*Ny(-lZf$rw>!aRH2L6WyYkwm)&M02_39AcrP18E;$k?}LZU8j^*D9XIie_!+(290pg=wVCkq*QgxcUOA89yf8L0*1r@80ey-XozmVIgo-mla@jF-;my{K}%Weqi0dbMjpGM|P9yZT6BBFwUilXe7fbCKxhPy(+$Vm^r;C#QZGbQi&2~5!JJ$qH^W25;fMRls@+|&xaihu6ocWz!|YYE>8BOcT!P~*%$hz>>>*p<8kfQR>_5cyQ4+6XFSQGb<qS4zmcMw@3DJdG<otcK-g2r`08Ztx$CrL$H7lg25>EPMBeUPWW`+P-&>B?Y<QyDA+$*n+=SekoQ0-sXBV<8l|v$bMBrR!WqPb4vHkY{BLphplSXmb%_SaywoJ0xy=<#)a@pnSb*GmOp#WDzg=uW^UrVy<h#U{10rxfUCnTq7fgzz(Z~QY<MqFvoBHPL=JNKZ*MGMs)2&WfL1js%Zy)yq3rC>c}hq)8b!=JtfWa%9wM=GP0;F6_NqawZTqwMo>O-uEMP04%>Y;cC+J}+9m3A%38-&<!K)avKLR+(<e?dc8d{=HYx12Yv)^ldPa*`AgIduzorrf?pki%uv88Y*EDE(Cjd^8Y)VZWGzoAF-81H0u<qJTd4dwbH+&*O-oK)tme;Y9w6dIy)85a?0qi^C~*6nL@57s4j-yjlCGrlvbgLPimOwTDzk0k}5bO#%|GbYKq-FdJ{HRDFC77XYdK#<M!O?XvwE2A)`2{_j)r(!S}$*3F+jpT3D;^4NA_O2R8m0Mc8})cinG>9*+twY(OcJB4q8CqT==_y4^%ZyT84%?gz5b8e9b%ND?7l2&JE`&{0xh&JJdcW7+Z?ETwNo`TtrauxJ(V2|i?i2cK&vVK94I;iO1Rl?h0wV~(nj#3F%XkQ~piq9NM><XG<=Ic&3l7kS3!TqupHg4QiY7FnM;(hZ%7#`gmYBTPQYp)?12nfA<rbBl$<X$N3aS^^S`4LGC_B1Nfm9xaA+Ew~gaj$?8h40=1HF)%-p=7`GGb~;TUy=9yt1cb*Prtg6UlM|LRoC-?lE79=*j``&*5H_mT3w44h$t>RrcW+r*l~^FF8k5<i000c=$G!za1@#vF99p%LfpG1g#{zt?*y0(8Cu!{>iVvDC5%@Ia`t^HC5%QYvq9GswRxs=AHXKRQxKxVky8x5_yUn*Wyf{0dqg_Ui@2OC|Dc>!d0hhx=a`|ACR&ekudM}bF>hdj3$6l+dU<2qUnLxOHm6%EfNt(}%m!nRlc<@I#1v2Yiv~O50;MWUalbPB)s0q!9eD~ZAlR=H!^?K}eFr}abl+KON{KTrEch6<ytjwK;)>zeR*ief~T)vLp43>#@<C*rA2fqGm^3%3a_;0ZIRtEvPWtLsBmR~Kc_dK|AA=qbqO&q<bt<~GCV}qcgPhP<KXDR}i=yy|m0p8USY(X*=cthk6wC$Mfv6fZH@>jziW?~w9P`ZGkC!%NrXQ|%W=yL_dT_LMJ7_@aZ^*3w#f$bzSwnD-MrN?mfqyvxgw0&c34amyhipG6xn0>;y3yq3vB<oQ-D9;!v!h41kX{$Hm?)cS&j5L2|ll`MVJb~7I#qvGydy<^b{Q0?zo1`V5;;%3-eiM{^tu_Ch@Hf&5G`Ink#xNF}aay!Op%T-FxTm5}RI0oGsTu&MD<76BJ{>@{feh<h>$NBf(1@K_=|^@r@p$7-qUIu(PwZ4<7)<cZIY=n@sT-L2KmG;-vK%IGa(LU`>Gk>=zYEG8R@iTo*u%T;mPqSS9}v;hASiOK#w$8(Bc|omf7%RhM|EJ0TFZKMv%(332$8m5RJ=`5(K+=<2l7wlDC&`$g|<sTaRtwAn*(N4q64hZoi2J~<`9@c;Hx6j`@Sfz(RI2xD_t;7d;M@jn+26M*)#WF-5D2DV<k{3p*Ozo3ss|!nR)K$O#^HTOCO0vZunB$7<-s`@Ad5OZJ^bxkd!mb#_C?C@ibIgZhX6Zbf%YGh`U*Stc$Xu0shi?=>A|egUD6^AOD{mE3S(SDAUSB<Pp<s*u{NkgxtlW{$Z-X$bK=L^$pl0J?M6PO+1-9ti!rz9x8Z-P^?=b>_61ZMk{xunu$41I^{Y^5um}nEwztJW=Pq51*+0x3?*aQ+Zzdzg$3igHAnFO5odM~d@GtE00D>8OQGX4p@jj!#Ncs2lM8&JJ9iOW5sXv|ate2NhpOKGpYpNBu;^%{RVuXJ6FSO-LUSB;Y$<EXzp5+i{1jJ(6>Ye-W|j~)H$2;_5iS46Xp<j)qKYPxC_VKi8P3aFjzTGi>1F|4^~b`|eP=!uCQx8q9ZTDIs^`KYCMMd6k{Y=BE^oq={Gh$huf^`68-CP$Ru)c3a{Ce9QKKRJygz59*hL)O$o#z(*o`^M3?@$p52)1Epkt<S9A{H_%{{qeR3*f$f8DCK+oud(4`}1fvDPvlEF=QK08{PddLXm~_0d_NHMEq9-f4S+p>!~FREgKQInRwo>vPdvr9oF6?F)HFhx&y=8)Mqn#J1ihXD@LgqV!S1d$L;(b2ghenuOTJb(y0t=FB#Q#*kv77H^ayR8;VFbyRp9eCjIBi)G;P2(6>@e=%+kZYW6v=Ic1JiJ7Ydjpzk#w$U<Kj!Qm`BM|kFdVmsrUN2q}6_me_^Q<!*ddnFO|J)@d_=Ha`$NU8AaW9<F0H@G)_9~W0{D8iG$;Rt-10!4^W6kSSmdx%hx1}czk9+Z%I&!5E6Bf&00v#;Eymo&Q7$ZhiQ)L)I!}DlyYqCzf%=D~vtZ@_I==UaY=2A58!QiQ*E@>~t*y(Yi-SdSx<XY)X+ok)%JOr)9bRj-u!E)MO&_)%@&!*Bq0KCfOX9!)Zh|hWUk?XF@y!(UUV;;$C)tQ^3d+#fr+HAo7bXVKGLh{uLMY_zEG(!n25AG5RR4-l(%=R+1rJ1U;4fbkU>q@2lV00J?j+pX&6<?6bQx(b9YXHo1Ou^9q5P8A|Jiuz&-cW)HgNP1L0oNB6s-YAgxn~ki7ysUn4#bM7*3%wdmd5=&ntu6wSR1xN>%<CsJ-ibfJs@Y4<M;TNC#%`_O;+-a;__fAHSNq&QW6-@LVU%ontRD3@w$%TeJ)t%Da)mWl+Q#RU0;{nZJ|Yr>eyuZfgu3LnpSKd$*5Afa#&k1FAn&~KDe%*rK>4H-=YhtR!jx_d3U^rc9`hrFR`zj{y9)-<6ja<H^BsG^g1g#2@6Se5U{va0Bc{^OQd+;Z8i4QtR|z}l_-<nh}>&c^z#kNSR^Xsv+c!+^NQ*80~I)O?)yLIPO&))^EC&8&fDNI6Z<bcY>k{E+#jwIysO;boyFJ0jqTo~ryaoDF|>BS?o)vJM}v#UDj+~O%hmV;c_}c&r^t8xvCF%QaH1<~9O11yV@$}zxcI;ZQaK4XpO#kK9>+45J>UFda9&?`!L|@(&UbaFd+=KHMl5PM8yk_qMMh3O!*rYBYo6HY-Lr-?LSvQb!pZXI*H`iO-XkA{h)6p4g!pI>!I2<dI&+<pSe=mOTtdXogYME-T76@Y7f?5=s(lOH$gv~8J>V@SZ#c?fl(AI_)khhK{23UdCLG+9(Y?35Tu7$If%4v5p5KKQKA$5^tgC%D%p0~g!1N4JTS&8!r_#UhIC4-8^C>myJ|=iNeBd2K=GP*ecfp<|TP$i&<?RX>c;fi32zraP58_j*yzUuns~{2Q>y*(yaH8y$2W$sv@nR_kw<2I<r@e}+jF+N`@}jnJf2Gb}|CVD_yBn6FWS)%?lDnx!k;g^EIq^+x8?!$S>eXDV;jN#%Jq-_#wbDZBBBDUgU?FHMgPcjqPevQJ#hJerApQTIiM@zN_ryyGcUUD>tOAM|Ys^-?lsG2GC)vEHgk~r?Y8J26G*^ReP{1%#!+4^;r_YoQlmRL%-61-)mG$NUNs8T%3<vb_<`${x0zeT5E)X-@@q4g~^u@uK{pu4eKONT{6ke@K2-<h|CYKQzp`jvzh;ykjM>yZNTz4(!sRL?<Un;GzgnC`i|Bf60t^@rX%b)w@K^eo21Y<--ru_w{U(Ih=aX#cRCE&(DDCn^rM=Js3Vn&n)#zJ$p35Zr#Y90hGM|^AB%@}6QK4_$6GPY~TWVR6H=CG~9^a?7Gj028AJb`0Iqt|0BFQQ9M{i#xo1%0ICBYd=t0=3VKV$wqdV3TK%)@cLgkLTsjHmfZP#kF;4D1a>5ER#e!KMq?Pl^2PF2DU2n2Mw(a%k)3gD>@3#RK9169&rb?>U?MA`c6dboExAvG}}CZ#jcZ}3&?-(U4J1%H+nxynsRoLN!H)pQ<U%EqeTrCI_;7?>`YNw4#Rc3eCPk0za0{a(}egJqrIL9v&p9q-W+YBMI{$41RBS*E@AF3O`Fpl$Xdf#hW6!^RFARe`l&pgp-V++d`MHs&9Siq_&!3iX-Ce0`)Mptp;A7|VShyfNIGBp?M)moZSviHg<w-0Ku<o!rtcAqP@&uiDM+4pEcAh=k<T_`0b@m`6PPeNl08v$D@t|d2bsackBr(*C+t&&*}dTOSDh=94?^dU?&rL`0UnkY&;dFyg&%{tOYs5neXk>x7p^6$5c4&P%xWY`WX&bKy0pE2P-;Rcg<9*(L8@d+pGTXC1=m(d?ko`#nPK-~%16c9e{k%X(k&caTj*IF%6O;DOh&!%Y=VZm1hP2^IMdo3J#{}l94;*j#X?Z9`^Nz+Nrkot-%Kf5aSkEK(c>rU8;42?0NzGJsG2`sUR_}YzljLJ|IYODHHvy0UYbF_E`)wR!qP!QlaGi(N^)@uDDgP3B~&~5PRms;Ga-gs9|W%O`p$JpQfc1j6x2_C_f{iZ?6e3A@QB8mgC|O5I}ZkrU1I=~^b-&?2LTE2Qb9<g++F8DrF|>Q@E14*vGM|fxQ@ZiAvQ=&Q*rttL785Qu%3h21zNEcT$=SIoG53hMsUUS;xZBdxPM{)SFmpPH1@3Q{__@CRkjr@pd`v50J~;;E)P%U8^t?0YU)MNGZ#Tq#je)B0p%^&7cJdJih6goOZJYD4$oob$C^F&GZICYA}`bOMTq%4uMTY{^t9G7b}>ge2hO;bvb7aD(DfxjTM!8q*HIcvyIlOKmP`eP7c2o`n9@GyYZtWSl{JD8fqLFe20s9aSaSk?meU1#6OFZt2N=la$qv$6n^z9?DIfO9>7!DFVJ_}E8Z*V=n02eLYB}AmkB09%JGCBQXw>V;6S89q-~1rWN8;bfFKVo~EAHDjN*ga66;Y9yB9YNTN;;Gofu(TqaCyOJq`OS;U+sOi+iBtCzve5E3U05EFDZ%qB`>gSGZc!|N?P0q9WOl!^e|RCnHOxWGpPYnsSz~OODPymYrH=K+3?`N)H5%pfC6Cyt(6t=DwinFHwi~I_rG!XC!%XYl!@+z%Y1fEkgwCY_#ra1U`<Zf{VPhQ#pQZ4W2WD>QMYB3gaF2rZHZ4!2hG1^za_Jjfw3u@a-HPAPGf6Kl^ohD`7W;0rXid~Je!jzMPk5>>{WL_9IxbEbk<0@$IH2BMj=gZ1I}F9OOxi{qb4ppENA9ni>q;-!Fp`r>Bidt=--AlRNULc0slP>jfY(09ftM%!<g}XeJ}DU@Osa}QrkcELu)=TeAt@sZI|`5_<T9pa*f8Kr4sifm37-$YS6<ImL%;irQuxMigz2B@RA;5;o6gH%B~qyW{YdI0Dg7kuPqY-I)VK>k1idg_LAQNJ>@Z(>yPD!*)f=4nYv{uRJX87QjYI1M{uP|%p5!>Dv}C{gHL;3pB2BsL|y@oBFP2y;wLcfx(B_#{LKPP&ywTc)1eTdhAZg8fO?4sdoJZl=&pahtT<uL&mABL@`}@MxAE!))p8bZlFd>;Y&Ih#Ms7mNE_^(G_U7&m39bm`wesYR%b~fn#BWhZfrh}0eD+Y>{Hf=stI-3zKjRjBjn(7(AcGE~DYgswKiw}j+O2+3{jmnmsRFYiha_6W^d+7x64Flvh-9hAWCiF#%=yTlXDl=Jwx6Q!OnK+C$<;yk?2IB*ckfhAqIsb$35vy>wM)LvcDFV8Jg9r7tG(Ba=a+N=ir_NES=*T-($}z+L|=Lz)YXJQ>UiV8GdEMvt_9U*#a3W8$TRs^IxV_czc$7uHhl?4I0!RK*#m}E0c5AnIEyR{@<G$-6{j<ZSFmC|^y+DqIr&utfseQ&VF)Au>1_;~v1~veDJ*XV`FODQN6vU{J18inLnFBXbV$yeL}lsk&b)AIJe?%P*s*~EN+G-ZHw;x>URhbBERx0o`kCG?lxDivHDwNDVI@THMf7V-Wh4h4JiT>t^pSntC32V|Zg-Ok8Q2sSSbY>Y>;Eygxts@!8V1nc_*)5@nWl(SlTFFAf!T|_90mXe+L8P;P<L1`vN>8C`_wppGo(Bl_WS;zhGN58GU$5%)Q8n!QMd8!98|mcucN^3E3;iNX7Eb@V&|@B=5@jTLEF$0YNQrpe^GAXbnDJ@3RmSvmIN{L5{=d{jLOzf3^Z!d<;K;*!pZ)j@a?XU_RoO}$s7m4NAg9FR^}%dkNTlB95ZUH&biHmHhAdM3bn!jBcLZL*2p9#!u=!eL$vUjbk&RH$LUskQv{=)btwjC^v;1e=q;<!4sPy4pr#c#50$UL$haN~e=x@+QFsoQ+vpN>W;S$dy}ez{oFPE@l7>O1F5zgAuwOso0)5XNGzfEd1I&8f`U3veN(M@;7z67(0WSYgCLUg~gc&cmu0tQ7uG;;*%FUD@5iwq2VoG~6#%76sE&ABF2N|ane%4S5El;@xiQKu5-eW<3)mM^L-xFGE?K_AW`W?OOxU%YA>e_^vYQsBO30AwW_mE%j`5(EuPKRcOUaa#!qmJ%nx>Sc+)DHsdUp5^VHJ@JDbE=+;H%lI)!dgQTEX4LkU{}z^ohb4xw=F#N>l(2ckTD$ijVHmPxTIkcHi+0EY@M6&g0IUgypsQW-D0muog&KtHYKt&PDv2G##O74)hX?g6PdeeMiX{<Tj2_pkJRwD*gI5JW~)`sVA;+$skv0B5|+H`9NKsIL*XCQt*M}T#WlLf2V*Cc+OXsg_C<ti7L6OYVB1F~`WYj*PA7Zyv-}zoa}zRIK4tj8*f<VOx_3Ms=S;`OIvhQ@U13;?-qDsa@#0l49b+`T0tm@9e9kz|A@WF*HPfQWQ@i^2`r_*$^=A}F>&rM_4A9+SIBuf#{^^I8L{4@D=k{%;0t#-LJw#EK-5D<IO5+oy<G9HfaDRrBN$tK)x#~Q2Q%pyT#?ZLdJGNAk9X$Rn<Ia%m*=;1E3vlshBuggX(=i-M+zn_4{cZtUcT&^i$)&kcPwGKCO%zu&RArOk4V99iVcsIPOwGOd@<$P9q>QQM2cCS(?lthk$<F#UV>>b)6qO$)H`zqE#Phbhe6Au6V$OZaRWf2_bSf18IpE&_0~Qa}F=eOsg(}}ImwtBn=A@($FkIwN<c~O>iclXf<io#zFB*&wRR73JJqyZ$je%s+dHj~BPtCw@EnY?eE<0gP4_A%+E|MJ5XO?PUgC-mwdwauMH~;_uCDMg`ba(Eb00Hh$-?In+Y6AYIvBYQl0ssI200dcD""")
+        self.reductions: tuple = _reductions(ast_types)
+        if (table := _tables.get(TOKEN_TYPE, None)) is None:
+            table = _tables[TOKEN_TYPE] = _table(TOKEN_TYPE)
+        self.table: LRtable = table
 
-    def __call__(self, tokens: List[Any],view=False):
-        state_stack = [self.table.initial_state]
-        symbol_stack = []
-        cursor = 0
+    def __call__(self, tokens: Iterable[Any],view=False):
+        '''
+        parses keeping a stack of states and one of values (tokens and ast nodes), with view the parse tree is built
+        too and shown
+        '''
+        table = self.table
+        terminals, productions, lhs, rhs_len = table.terminals, table.productions, table.lhs, table.rhs_len
+        action_base, action_check, action_value = table.action_base, table.action_check, table.action_value
+        goto_base, goto_value = table.goto_base, table.goto_value
+        reductions = self.reductions
+        tokens = iter(tokens)  # pulled one at a time so a streaming lexer never holds the whole program
+        state = table.initial_state
+        state_stack = [state]
+        value_stack = []
+        tree_stack: List[ParserSymbol] | None = [] if view else None
+        curr_tok = next(tokens)
+        terminal = terminals.get(curr_tok.name, None)
         while True:
-            curr_tok = tokens[cursor]
-            curr_state = state_stack[-1]
-            action, content = self.table.action((curr_state, curr_tok))
-            match action:
-                case self.table.Action.SHIFT:
-                    state_stack.append(content)
-                    new_sym = ParserSymbol(curr_tok.name, curr_tok)
-                    symbol_stack.append(new_sym)
-                    cursor += 1
-                case self.table.Action.REDUCE:
-                    content: ReduceInfo
-                    popped_syms = []
-                    for symbol in list(reversed(content.prod_right)):
-                        popped_symbol = symbol_stack.pop()
-                        state_stack.pop()
-                        curr_state = state_stack[-1]
-                        assert symbol == popped_symbol  # this is useless because stack is always viable prefix but..
-                        popped_syms.append(popped_symbol)
-                    popped_syms = list(reversed(popped_syms))
-                    instance = _attribute_apply(content.attribute, popped_syms, self.attributes_info)
-                    new_sym = ParserSymbol(content.prod_left, instance, popped_syms)
-                    symbol_stack.append(new_sym)
-                    goto = self.table.goto((curr_state, content.prod_left))
-                    state_stack.append(goto)
-                case self.table.Action.ACCEPT:
-                    last_symbol = symbol_stack.pop()
-                    assert last_symbol == self.table.initial_symbol  # just for fun :(
-                    if view:
-                        last_symbol.view()
-                    return last_symbol.content
-                case _:
-                    expected = self.table.expect(curr_state)
-                    raise ValueError(f"Invalid Syntax Unexpected Token {curr_tok}, Expected: {expected}")
-
-
-def _attribute_apply(attribute, popped_syms, info):
+            if terminal is None or action_check[(entry := action_base[state] + terminal)] != state:
+                expected = table.expect(state)
+                raise ValueError(f"Invalid Syntax Unexpected Token {curr_tok}, Expected: {expected}")
+            code = action_value[entry]
+            if code > 0:  # shift
+                state = code - 1
+                state_stack.append(state)
+                value_stack.append(curr_tok)
+                if view:
+                    tree_stack.append(ParserSymbol(curr_tok.name, curr_tok))
+                curr_tok = next(tokens)
+                terminal = terminals.get(curr_tok.name, None)
+            elif code < 0:  # reduce
+                prod = -code - 1
+                if size := rhs_len[prod]:
+                    values = value_stack[-size:]
+                    del value_stack[-size:]
+                    del state_stack[-size:]
+                else:
+                    values = []
+                instance = reductions[prod](values)
+                value_stack.append(instance)
+                if view:
+                    children = tree_stack[len(tree_stack) - size:]
+                    del tree_stack[len(tree_stack) - size:]
+                    tree_stack.append(ParserSymbol(productions[prod].prod_left, instance, children))
+                state = goto_value[goto_base[state_stack[-1]] + lhs[prod]]
+                state_stack.append(state)
+            else:  # accept
+                if view:
+                    tree_stack[-1].view()
+                return value_stack[-1]
+
+
+def _attribute_apply(attribute, values, info):
     ast_types = info
     if attribute:
         if len(attribute) == 1:
             if isinstance(attribute[0], int):
                 project_index = attribute[0]
-                instance = popped_syms[project_index].content  # project up
+                instance = values[project_index]  # project up
             elif isinstance(attribute[0], str):
                 prod_class = attribute[0]
-                arg = popped_syms[0].content if len(popped_syms) else None
+                arg = values[0] if values else None
                 instance = getattr(ast_types, prod_class)(arg)
             else:
                 raise Exception("Attribute Not Supported")
         elif len(attribute) == 2:
             prod_class, args_map = attribute
-            args = list(map(lambda i: popped_syms[i].content, args_map))
+            args = [values[i] for i in args_map]
             instance = getattr(ast_types, prod_class)(*args)
         else:
             raise Exception("Attribute Not Supported")
     else:
-        instance = popped_syms[0].content if len(popped_syms) else None  # project up
+        instance = values[0] if values else None  # project up
     return instance
+
+
+def _reductions(ast_types) -> tuple:  # by production index, called with the popped values
+    _Simulation = ast_types.Simulation
+    _PList = ast_types.PList
+    _AgentDec = ast_types.AgentDec
+    _OptList = ast_types.OptList
+    _BehaviorDef = ast_types.BehaviorDef
+    _FunDef = ast_types.FunDef
+    _ExpresionList = ast_types.ExpresionList
+    _ArgList = ast_types.ArgList
+    _StatementList = ast_types.StatementList
+    _Break = ast_types.Break
+    _If = ast_types.If
+    _While = ast_types.While
+    _Ret = ast_types.Ret
+    _Assign = ast_types.Assign
+    _BinaryOp = ast_types.BinaryOp
+    _UnaryOp = ast_types.UnaryOp
+    _Literal = ast_types.Literal
+    _AttrRes = ast_types.AttrRes
+    _FunCall = ast_types.FunCall
+    _Identifier = ast_types.Identifier
+    return (
+        lambda values: _Simulation(values[1], values[0]),  # CryptoDsl -> SimOpts TopLevelStList
+        lambda values: _Simulation(values[0]),  # CryptoDsl -> TopLevelStList
+        lambda values: values[1],  # SimOpts -> TOKEN_TYPE.OPTS_KW Opts
+        lambda values: _PList(values[0], values[1]),  # TopLevelStList -> TopLevelStList TopLevelSt
+        lambda values: _PList(values[0]),  # TopLevelStList -> TopLevelSt
+        lambda values: values[0],  # TopLevelSt -> FunDef
+        lambda values: values[0],  # TopLevelSt -> EntDec
+        lambda values: values[0],  # Entkwgrp -> TOKEN_TYPE.TRADER_KW
+        lambda values: values[0],  # Entkwgrp -> TOKEN_TYPE.COIN_KW
+        lambda values: values[0],  # KwResolv -> TOKEN_TYPE.MY_KW
+        lambda values: values[0],  # KwResolv -> TOKEN_TYPE.MARKET_KW
+        lambda values: _AgentDec(values[0], values[1], values[3], values[4], values[6]),  # EntDec -> Entkwgrp Identifier TOKEN_TYPE.DDOT Identifier Opts TOKEN_TYPE.O_BRACES BehaviorList TOKEN_TYPE.C_BRACES
+        lambda values: values[1],  # Opts -> TOKEN_TYPE.O_BRACKETS OptsList TOKEN_TYPE.C_BRACKETS
+        lambda values: _OptList(values[0], values[2]),  # OptsList -> OptsList TOKEN_TYPE.COMMA Assign
+        lambda values: _OptList(values[0]),  # OptsList -> Assign
+        lambda values: _OptList(None),  # OptsList ->
+        lambda values: _BehaviorDef(values[0], values[1]),  # Behavior -> Identifier Body
+        lambda values: _FunDef(values[1], values[5], values[3]),  # FunDef -> TOKEN_TYPE.FUNC Identifier TOKEN_TYPE.O_PAR Args TOKEN_TYPE.C_PAR Body
+        lambda values: _ExpresionList(values[0], values[2]),  # ExpressionList -> ExpressionList TOKEN_TYPE.COMMA Expr
+        lambda values: _ExpresionList(values[0]),  # ExpressionList -> Expr
+        lambda values: _ExpresionList(None),  # ExpressionList ->
+        lambda values: _PList(values[0], values[1]),  # BehaviorList -> BehaviorList Behavior
+        lambda values: _PList(values[0]),  # BehaviorList -> Behavior
+        lambda values: _ArgList(values[0], values[2]),  # Args -> Args TOKEN_TYPE.COMMA Identifier
+        lambda values: _ArgList(values[0]),  # Args -> Identifier
+        lambda values: _ArgList(None),  # Args ->
+        lambda values: _StatementList(values[0], values[1]),  # StatementList -> StatementList Statement
+        lambda values: _StatementList(values[0]),  # StatementList -> Statement
+        lambda values: values[0],  # Statement -> Expr TOKEN_TYPE.SEMICOLON
+        lambda values: values[0],  # Statement -> If
+        lambda values: values[0],  # Statement -> While
+        lambda values: values[0],  # Statement -> Assign TOKEN_TYPE.SEMICOLON
+        lambda values: values[0],  # Statement -> AssignResolv TOKEN_TYPE.SEMICOLON
+        lambda values: values[0],  # Statement -> Ret TOKEN_TYPE.SEMICOLON
+        lambda values: _Break(values[0]),  # Statement -> TOKEN_TYPE.BREAK TOKEN_TYPE.SEMICOLON
+        lambda values: values[1],  # Body -> TOKEN_TYPE.O_BRACES StatementList TOKEN_TYPE.C_BRACES
+        lambda values: _If(values[1], values[2]),  # If -> TOKEN_TYPE.IF Expr Body
+        lambda values: _If(values[1], values[2], values[4]),  # If -> TOKEN_TYPE.IF Expr Body TOKEN_TYPE.ELSE Body
+        lambda values: _While(values[1], values[2]),  # While -> TOKEN_TYPE.WHILE Expr Body
+        lambda values: _Ret(values[1]),  # Ret -> TOKEN_TYPE.RET Expr
+        lambda values: _Ret(values[0]),  # Ret -> TOKEN_TYPE.RET
+        lambda values: _Assign(values[0], values[2]),  # Assign -> Identifier TOKEN_TYPE.ASSIGN Expr
+        lambda values: _Assign(values[0], values[2]),  # AssignResolv -> AttrResolv TOKEN_TYPE.ASSIGN Expr
+        lambda values: values[0],  # Op_prec5 -> TOKEN_TYPE.OR
+        lambda values: values[0],  # Op_prec5 -> TOKEN_TYPE.AND
+        lambda values: values[0],  # Op_prec4 -> TOKEN_TYPE.EQ
+        lambda values: values[0],  # Op_prec4 -> TOKEN_TYPE.NEQ
+        lambda values: values[0],  # Op_prec4 -> TOKEN_TYPE.GT
+        lambda values: values[0],  # Op_prec4 -> TOKEN_TYPE.GE
+        lambda values: values[0],  # Op_prec4 -> TOKEN_TYPE.LT
+        lambda values: values[0],  # Op_prec4 -> TOKEN_TYPE.LE
+        lambda values: values[0],  # Op_prec3 -> TOKEN_TYPE.PLUS
+        lambda values: values[0],  # Op_prec3 -> TOKEN_TYPE.MINUS
+        lambda values: values[0],  # Op_prec2 -> TOKEN_TYPE.MUL
+        lambda values: values[0],  # Op_prec2 -> TOKEN_TYPE.DIV
+        lambda values: values[0],  # Op_prec2 -> TOKEN_TYPE.FLOORDIV
+        lambda values: values[0],  # Op_prec2 -> TOKEN_TYPE.MOD
+        lambda values: values[0],  # Op_prec1 -> TOKEN_TYPE.MINUS
+        lambda values: values[0],  # Op_prec1 -> TOKEN_TYPE.NOT
+        lambda values: values[0],  # Op_prec0 -> TOKEN_TYPE.EXP
+        lambda values: _BinaryOp(values[0], values[2], values[1]),  # Expr -> Expr Op_prec5 CmpExpr
+        lambda values: values[0],  # Expr -> CmpExpr
+        lambda values: _BinaryOp(values[0], values[2], values[1]),  # CmpExpr -> CmpExpr Op_prec4 ArithExpr
+        lambda values: values[0],  # CmpExpr -> ArithExpr
+        lambda values: _BinaryOp(values[0], values[2], values[1]),  # ArithExpr -> ArithExpr Op_prec3 Term
+        lambda values: values[0],  # ArithExpr -> Term
+        lambda values: _BinaryOp(values[0], values[2], values[1]),  # Term -> Term Op_prec2 Factor
+        lambda values: values[0],  # Term -> Factor
+        lambda values: _UnaryOp(values[1], values[0]),  # Factor -> Op_prec1 Exp
+        lambda values: values[0],  # Factor -> Exp
+        lambda values: _BinaryOp(values[0], values[2], values[1]),  # Exp -> Atom Op_prec0 Atom
+        lambda values: values[0],  # Exp -> Atom
+        lambda values: values[0],  # Atom -> Identifier
+        lambda values: values[1],  # Atom -> TOKEN_TYPE.O_PAR Expr TOKEN_TYPE.C_PAR
+        lambda values: _Literal(values[0]),  # Atom -> TOKEN_TYPE.STRING
+        lambda values: _Literal(values[0]),  # Atom -> TOKEN_TYPE.NUMBER
+        lambda values: values[0],  # Atom -> FunCall
+        lambda values: values[0],  # Atom -> AttrResolv
+        lambda values: _AttrRes(values[0], values[2]),  # AttrResolv -> KwResolv TOKEN_TYPE.DOT Identifier
+        lambda values: _AttrRes(values[0], values[2]),  # AttrResolv -> KwResolv TOKEN_TYPE.DOT FunCall
+        lambda values: _FunCall(values[0], values[2]),  # FunCall -> Identifier TOKEN_TYPE.O_PAR ExpressionList TOKEN_TYPE.C_PAR
+        lambda values: _Identifier(values[0]),  # Identifier -> TOKEN_TYPE.IDENTIFIER
+        lambda values: values[0],  # CryptoDsl' -> CryptoDsl
+    )
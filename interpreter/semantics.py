@@ -31,10 +31,13 @@ class SemanticStaticChecker:
             if opt.left.name not in self.sim_opts:
                 raise Exception("Invalid simulation Option")
         for fun in node.funcs:
-            fun.s_check(self, self.global_ctx)
+            self.top_level(fun)
             self.global_ctx[fun.name.name] = None
         for agent in node.agents:
-            agent.s_check(self, self.global_ctx)
+            self.top_level(agent)
+
+    def top_level(self, node: TopLevelSt):
+        node.s_check(self, self.global_ctx)
 
     @visitor
     def s_check(self, node: ArgList, ctx: Context):
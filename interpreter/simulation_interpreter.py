@@ -1,18 +1,44 @@
-from typing import Dict, List, Tuple
-
-from toolchain.regx_engine import RegxPattern, RegxEngine
+import hashlib
+import importlib.util
+import os
+from functools import cached_property
+from itertools import chain
+from typing import Dict, Iterable, List
+
+from toolchain import disk_cache
 from . import ast_crypto as ast
+from .incremental import DeclarationCache, declaration_starts, split_declarations
 from .lexer import MatchProvider, Lexer
 from .parser import Parser
 from .semantics import SemanticStaticChecker
 from .tree_interpreter import TreeInterpreter
 
+# part of the on disk cache keys, bump it when the format of the cached files changes, changes to the grammar, ast
+# classes, checks or the regex engine the lexer runs on are already told apart by the sources of ENGINE_PACKAGES
+ENGINE_VERSION = 1
+# the packages a cached simulation depends on, this one and the regex toolchain deciding how the source is tokenized
+ENGINE_PACKAGES = ("interpreter", "toolchain.regx_engine", "toolchain.automaton")
+
+
+def engine_sources() -> List[bytes]:
+    '''
+    sources of the modules of ENGINE_PACKAGES, the lexer, parser, ast and checks a cached simulation was made with
+    '''
+    res = []
+    for package in ENGINE_PACKAGES:
+        folder = importlib.util.find_spec(package).submodule_search_locations[0]
+        for name in sorted(os.listdir(folder)):
+            if name.endswith(".py"):
+                with open(os.path.join(folder, name), "rb") as file:
+                    res.append(file.read())
+    return res
+
 
-# this MatchProvider is a re matcher have to modify it cause capturing groups will not be implemented at the moment
+# this MatchProvider runs all the token patterns at once in a combined dfa, capturing groups are not implemented
 class RegxMatcher(MatchProvider):
     def __init__(self):
         self.matchers: Dict[str, tuple[str, str]] = dict()
-        self.compiled: List[Tuple[str, RegxPattern]] | None = None
+        self.compiled = None  # RegxTokenizer
 
     def add_matcher(self, sty: tuple[str, str, str]):
         if self.compiled is not None:
@@ -21,42 +47,106 @@ class RegxMatcher(MatchProvider):
 
     def initialize(self):
         if self.compiled is None:
-            self.compiled = []
-            for name, matcher in self.matchers.items():
-                regex = matcher[0]
-                pattern = RegxEngine.compile(regex)
-                self.compiled.append((name, pattern))
+            from toolchain.regx_engine import RegxEngine
+            self.compiled = RegxEngine.compile_tokens((name, matcher[0]) for name, matcher in self.matchers.items())
 
     def match(self, input_str, pos) -> tuple[str | None, str | None, str | None]:
-        final_name = None
-        final_match = ""
-        for name, matcher in self.compiled:
-            match = matcher.match(input_str, pos)
-            if match and len(match) > len(final_match):
-                final_match = match # go greedy temp fix
-                final_name = name
+        final_name, final_match = self.compiled.match(input_str, pos)
+        if not final_match:
+            return None, None, None
         t_type = self.matchers[final_name][1]
-        return (final_name, final_match, t_type) if final_match else (None, None, None)
+        return final_name, final_match, t_type
+
+    def match_partial(self, input_str, pos, final) -> tuple[str | None, str | None, str | None] | None:
+        final_name, final_match, alive = self.compiled.scan(input_str, pos)
+        if alive and not final:
+            return None
+        if not final_match:
+            return None, None, None
+        t_type = self.matchers[final_name][1]
+        return final_name, final_match, t_type
 
 
 class SimulationInterpreter:
-    def __init__(self, built_ins, agent_templates,sim_opts):
+    '''
+    with a cache_dir (or the SIM_CACHE_DIR environment variable) the checked simulations are pickled there keyed by the
+    source, the sources of ENGINE_PACKAGES, the dependencies (sources of the modules the built ins and agent templates
+    come from) and ENGINE_VERSION, so other processes loading the same simulation skip lexing, parsing and the checks
+    '''
+
+    def __init__(self, built_ins, agent_templates, sim_opts, dependencies: Iterable[bytes] = (), cache_dir=None):
         self.built_ins: dict = built_ins
         self.sim_opts : set = sim_opts
         self.agent_templates: dict = agent_templates
-        self.lexer = Lexer(RegxMatcher(), ast.TOKEN_TYPE)
-        self.parser = Parser(ast, ast.TOKEN_TYPE)
-
-    def interpret_simulation(self, prog: str, market):
+        self.declarations = DeclarationCache(self)
+        self.cache_dir: str | None = cache_dir if cache_dir is not None else os.environ.get("SIM_CACHE_DIR", None)
+        digests = (hashlib.sha256(dependency).hexdigest() for dependency in chain(engine_sources(), dependencies))
+        self.dependencies = hashlib.sha256(" ".join(digests).encode()).hexdigest()
+
+    # built when first needed, loading a cached simulation never lexes nor parses
+    @cached_property
+    def lexer(self) -> Lexer:
+        return Lexer(RegxMatcher(), ast.TOKEN_TYPE)
+
+    @cached_property
+    def parser(self) -> Parser:
+        return Parser(ast, ast.TOKEN_TYPE)
+
+    def _disk_path(self, source: str) -> str:
+        key = hashlib.sha256(source.encode()).hexdigest()
+        digest = hashlib.sha256(repr((ENGINE_VERSION, key, self.dependencies)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"sim-{digest}.pickle")
+
+    def _declaration_path(self, text: str) -> str:
+        key = hashlib.sha256(text.encode()).hexdigest()
+        digest = hashlib.sha256(repr((ENGINE_VERSION, key, self.dependencies)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"decl-{digest}.pickle")
+
+    def compile(self, source: str) -> ast.Simulation:
         '''
-        returns a tuple of coin agents and traders agents with overrided behaviors
+        parsed and checked simulation of the source, from the disk cache when there is one, a source not seen yet still
+        reuses the declarations it shares with the sources compiled before, also by other processes
+        every declaration has a file of its own so processes compiling at once never drop what the others stored
         '''
-        tokens = self.lexer(prog)
+        if self.cache_dir is None:
+            return self.declarations(source)
+        path = self._disk_path(source)
+        if (res := disk_cache.load(path)) is not None:
+            return res
+        cache = self.declarations.cache
+        texts = [text for text, _ in split_declarations(source, declaration_starts(source))]
+        known = dict()
+        for text in texts:
+            if text not in cache and (entry := disk_cache.load(self._declaration_path(text))) is not None:
+                cache[text] = entry
+            if (entry := cache.get(text, None)) is not None:
+                known[text] = (id(entry), len(entry.checked))
+        res = self.declarations(source)
+        for text in texts:  # only the declarations parsed or checked again
+            entry = cache.get(text, None)
+            if entry is not None and known.get(text, None) != (id(entry), len(entry.checked)):
+                disk_cache.store(self._declaration_path(text), entry)
+        disk_cache.store(path, res)
+        return res
+
+    def parse(self, prog) -> ast.Simulation:
+        '''
+        prog is the source or a file object, files are lexed in chunks as the parser asks for tokens
+        '''
+        tokens = self.lexer.tokenize(prog)
         simulation: ast.Simulation = self.parser(tokens)
-        static_checks = SemanticStaticChecker(self.built_ins.keys(), self.agent_templates,self.sim_opts)
+        return simulation
 
+    def check(self, simulation: ast.Simulation):
+        static_checks = SemanticStaticChecker(self.built_ins.keys(), self.agent_templates, self.sim_opts)
         static_checks(simulation)
 
+    def instantiate(self, simulation: ast.Simulation, market, overrides: Dict[str, dict] | None = None):
+        '''
+        returns a tuple of coin agents and traders agents with overrided behaviors from a checked simulation
+        overrides replaces options of the agents declared with its keys and of the simulation under "options"
+        '''
+        overrides = dict() if overrides is None else overrides
         ctx = ast.Context()
         for func in simulation.funcs:
             func: ast.FunDef
@@ -71,21 +161,41 @@ class SimulationInterpreter:
         coins = []
         traders = []
         options = tree_interpreter(simulation.options)
+        options.update(overrides.get("options", ()))
 
         for agn in simulation.agents:
             agn: ast.AgentDec
             templateclass = self.agent_templates[agn.subtype.name]
             opts = tree_interpreter(agn.options)
-            instance = templateclass(agn.name.name, **opts)
-
-            for behavior in agn.behavior_list.elements:
-                behavior: ast.FunDef
-                childctx = ctx.create_child_context()
-                childctx[ast.TOKEN_TYPE.MY_KW] = instance
-                wrapped = tree_interpreter.make_native(behavior, childctx)
-                setattr(instance, behavior.name.name, wrapped)
-            if agn.type == ast.TOKEN_TYPE.COIN_KW:
-                coins.append(instance)
-            else:
-                traders.append(instance)
-        return coins, traders,options
+            opts.update(overrides.get(agn.name.name, ()))
+            population = opts.get("population", 1)
+            for i in range(population):
+                name = agn.name.name if population == 1 else f"{agn.name.name}_{i}"
+                instance = templateclass(name, **opts)
+
+                for behavior in agn.behavior_list.elements:
+                    behavior: ast.FunDef
+                    childctx = ctx.create_child_context()
+                    childctx[ast.TOKEN_TYPE.MY_KW] = instance
+                    wrapped = tree_interpreter.make_native(behavior, childctx)
+                    setattr(instance, behavior.name.name, wrapped)
+                if agn.type == ast.TOKEN_TYPE.COIN_KW:
+                    coins.append(instance)
+                else:
+                    traders.append(instance)
+        return coins, traders, options
+
+    def interpret_simulation(self, prog, market):
+        '''
+        returns a tuple of coin agents and traders agents with overrided behaviors, a source str goes through the
+        declarations cache so rerunning it after an edit only reprocesses what the edit affects, with a cache_dir
+        files are read whole to look them up on disk, otherwise they are lexed in chunks
+        '''
+        if self.cache_dir is not None and not isinstance(prog, str):
+            prog = prog.read()  # the cache key needs the whole source
+        if isinstance(prog, str):
+            simulation = self.compile(prog)
+        else:
+            simulation = self.parse(prog)
+            self.check(simulation)
+        return self.instantiate(simulation, market)
@@ -42,6 +42,8 @@ class TreeInterpreter:
                 ret = retcontainer.value
             return ret
 
+        wrapper.managed = fun  # lets the vectorized execution find the behavior behind the native callable
+        wrapper.context = context
         return wrapper
 
     @visitor
@@ -0,0 +1,264 @@
+import inspect
+
+import numpy as np
+
+from .ast_crypto import *
+from .tree_interpreter import TrowableReturnContainer
+from .visitor import *
+
+
+_LANE_TYPES = (str, int, float, np.generic, np.ndarray)
+
+
+class VectorizationError(Exception):
+    pass
+
+
+class _Frame:
+    def __init__(self):
+        self.value = None
+
+
+def truth(value, lanes: int) -> np.ndarray:
+    '''
+    truthiness of a value for every lane, values that are the same for all lanes are broadcasted
+    '''
+    if hasattr(value, "truth"):
+        return value.truth()
+    if isinstance(value, np.ndarray) and value.shape == (lanes,):
+        if value.dtype == bool:
+            return value
+        if value.dtype.kind in "US":
+            return value != ""
+        return value != 0
+    return np.full(lanes, bool(value))
+
+
+def select(mask: np.ndarray, new, old):
+    '''
+    merges the new value in the lanes of the mask keeping the old one in the rest
+    '''
+    if old is None or new is old or mask.all():
+        return new
+    if isinstance(new, _LANE_TYPES) and isinstance(old, _LANE_TYPES):
+        return np.where(mask, new, old)
+    raise VectorizationError(f"Cant merge {type(new).__name__} and {type(old).__name__} across lanes")
+
+
+class VectorInterpreter:
+    '''
+    Executes a managed behavior for many agents at once, "my" is a population whose attributes are arrays with one
+    lane per agent, branches are handled with masks like a SIMT machine so every lane sees the same semantic it
+    would see in the TreeInterpreter
+    '''
+
+    def __init__(self, global_context, vector_built_ins: dict):
+        self.global_context: Context = global_context
+        self.vector_built_ins: dict = vector_built_ins
+        self._frames: List[_Frame] = []
+        self._loops: List[np.ndarray] = []
+        self._kwonly: dict = dict()
+
+    def vectorizable(self, fun: FunDef) -> bool:
+        '''
+        static check, every call reachable from the behavior has to be a managed func or a vectorized built in
+        '''
+        visited = set()
+
+        def check(node):
+            if isinstance(node, FunCall):
+                name = node.name.name
+                func = self.global_context[name] if name in self.global_context else None
+                if isinstance(func, FunDef):
+                    if id(func) not in visited:
+                        visited.add(id(func))
+                        if not check(func.body):
+                            return False
+                elif getattr(func, "__name__", None) not in self.vector_built_ins:
+                    return False
+            elif isinstance(node, AttrRes) and isinstance(node.attr, FunCall):
+                return False  # template methods are not vectorized
+            children = node.elements if isinstance(node, PList) else vars(node).values()
+            for child in children:
+                if isinstance(child, (Expression, Statement, PList)) and not check(child):
+                    return False
+            return True
+
+        return check(fun.body)
+
+    def run(self, fun: FunDef, context: Context, mask: np.ndarray):
+        self._frames.append(_Frame())
+        try:
+            with np.errstate(all="ignore"):  # masked lanes may compute garbage like div by zero
+                fun.body.v_interpret(self, context.create_child_context(), mask)
+        finally:
+            self._frames.pop()
+
+    def native_call(self, func, args, ctx, mask):
+        vector_func = self.vector_built_ins.get(getattr(func, "__name__", None), None)
+        if vector_func is None:
+            raise VectorizationError(f"No vectorized version of {func}")
+        if (kw := self._kwonly.get(vector_func, None)) is None:
+            params = inspect.signature(vector_func).parameters.values()
+            kw = set(map(lambda p: p.name, filter(lambda p: p.kind == inspect.Parameter.KEYWORD_ONLY, params)))
+            self._kwonly[vector_func] = kw
+        kwargs = dict(mask=mask)
+        if "my" in kw:
+            kwargs["my"] = ctx[TOKEN_TYPE.MY_KW]
+        if "market" in kw:
+            kwargs["market"] = ctx[TOKEN_TYPE.MARKET_KW]
+        ret = vector_func(*args, **kwargs)
+        return ret
+
+    def _return(self, mask, value):
+        frame = self._frames[-1]
+        frame.value = value if frame.value is None else select(mask, value, frame.value)
+
+    @visitor
+    def v_interpret(self, node: StatementList, ctx, mask):
+        for st in node.elements:
+            try:
+                res = st.v_interpret(self, ctx, mask)
+            except TrowableReturnContainer as retcontainer:  # a built in like leave returned for all the lanes
+                self._return(mask, retcontainer.value)
+                res = np.zeros_like(mask)
+            if isinstance(st, Statement):
+                mask = res
+            if not mask.any():
+                break
+        return mask
+
+    @visitor
+    def v_interpret(self, node: Assign, ctx, mask):
+        res = node.value.v_interpret(self, ctx, mask)
+        if isinstance(node.left, AttrRes):
+            instance = ctx[node.left.parent.name]
+            old = getattr(instance, node.left.attr.name, None)
+            setattr(instance, node.left.attr.name, select(mask, res, old))
+        else:
+            old = ctx[node.left.name] if node.left.name in ctx else None
+            ctx[node.left.name] = select(mask, res, old)
+        return mask
+
+    @visitor
+    def v_interpret(self, node: If, ctx, mask):
+        condition = truth(node.condition.v_interpret(self, ctx, mask), len(mask))
+        then_mask = mask & condition
+        else_mask = mask & ~condition
+        if then_mask.any():
+            then_mask = node.then_body.v_interpret(self, ctx, then_mask)
+        if node.else_body and else_mask.any():
+            else_mask = node.else_body.v_interpret(self, ctx, else_mask)
+        return then_mask | else_mask
+
+    @visitor
+    def v_interpret(self, node: While, ctx, mask):
+        exited = np.zeros_like(mask)
+        self._loops.append(np.zeros_like(mask))
+        try:
+            while mask.any():
+                condition = truth(node.condition.v_interpret(self, ctx, mask), len(mask))
+                exited |= mask & ~condition
+                mask = mask & condition
+                if mask.any():
+                    mask = node.body.v_interpret(self, ctx, mask)
+        finally:
+            broken = self._loops.pop()
+        return exited | broken
+
+    @visitor
+    def v_interpret(self, node: Ret, ctx, mask):
+        res = None
+        if node.value:
+            res = node.value.v_interpret(self, ctx, mask)
+        self._return(mask, res)
+        return np.zeros_like(mask)
+
+    @visitor
+    def v_interpret(self, node: Break, ctx, mask):
+        self._loops[-1] |= mask
+        return np.zeros_like(mask)
+
+    @visitor
+    def v_interpret(self, node: FunCall, ctx, mask):
+        func = node.name.v_interpret(self, ctx, mask)
+        args = [expr.v_interpret(self, ctx, mask) for expr in node.Args.elements]
+        if isinstance(func, FunDef):
+            same_level = ctx.create_same_level_context()
+            for param, value in zip(func.params.elements, args):
+                same_level[param.name] = value
+            self._frames.append(_Frame())
+            try:
+                func.body.v_interpret(self, same_level, mask)
+            finally:
+                frame = self._frames.pop()
+            return frame.value
+        return self.native_call(func, args, ctx, mask)
+
+    @visitor
+    def v_interpret(self, node: BinaryOp, ctx, mask):
+        first = node.first.v_interpret(self, ctx, mask)
+        second = node.second.v_interpret(self, ctx, mask)
+        match node.op:
+            case TOKEN_TYPE.PLUS:
+                res = first + second
+            case TOKEN_TYPE.MINUS:
+                res = first - second
+            case TOKEN_TYPE.MUL:
+                res = first * second
+            case TOKEN_TYPE.DIV:
+                res = np.true_divide(first, second)
+            case TOKEN_TYPE.FLOORDIV:
+                res = np.floor_divide(first, second)
+            case TOKEN_TYPE.MOD:
+                res = np.mod(first, second)
+            case TOKEN_TYPE.EXP:
+                res = np.power(first, second)
+            case TOKEN_TYPE.EQ:
+                res = np.equal(first, second)
+            case TOKEN_TYPE.NEQ:
+                res = np.not_equal(first, second)
+            case TOKEN_TYPE.AND:
+                res = (truth(first, len(mask)) & truth(second, len(mask))).astype(int)
+            case TOKEN_TYPE.OR:
+                res = (truth(first, len(mask)) | truth(second, len(mask))).astype(int)
+            case TOKEN_TYPE.GT:
+                res = np.greater(first, second).astype(int)
+            case TOKEN_TYPE.GE:
+                res = np.greater_equal(first, second).astype(int)
+            case TOKEN_TYPE.LT:
+                res = np.less(first, second).astype(int)
+            case TOKEN_TYPE.LE:
+                res = np.less_equal(first, second).astype(int)
+            case _:
+                raise Exception("Operator not implemented")
+        return res
+
+    @visitor
+    def v_interpret(self, node: UnaryOp, ctx, mask):
+        first = node.first.v_interpret(self, ctx, mask)
+        match node.op:
+            case TOKEN_TYPE.MINUS:
+                res = -first
+            case TOKEN_TYPE.NOT:
+                res = (~truth(first, len(mask))).astype(int)
+            case _:
+                raise Exception("Operator not implemented")
+        return res
+
+    @visitor
+    def v_interpret(self, node: AttrRes, ctx, mask):
+        instance = ctx[node.parent.name]
+        if isinstance(node.attr, Identifier):
+            return getattr(instance, node.attr.name)
+        raise VectorizationError("Template methods are not vectorized")
+
+    @visitor
+    def v_interpret(self, node: Identifier, ctx, mask):
+        res = ctx[node.name]
+        return res
+
+    @visitor
+    def v_interpret(self, node: Literal, ctx, mask):
+        res = node.value
+        return res
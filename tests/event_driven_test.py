@@ -0,0 +1,65 @@
+import contextlib
+import io
+
+from CryptoSimulator.Simulation import Simulation
+from CryptoSimulator.scheduler import Scheduler
+from benchmarks.scenarios import scenario
+
+# sleeps off the step grid and waits for prices, the event loop must act at the same steps as the step loop
+_WAITING_TRADERS = """
+trader Sleeper : TraderGenericTemplate [initial_money=50]
+{
+trade
+{
+   coin_ = pick_random_coin(market.wallet);
+   if my.money & Bernoulli(0.5) {
+   buy(coin_,Uniform(0,my.money) // 1);
+   }
+   coin_sell = pick_random_coin(my.wallet);
+   if coin_sell {
+    sell(coin_sell);
+   }
+   sleep(Uniform(1,25));
+}
+}
+
+trader Watcher : TraderGenericTemplate [initial_money=50]
+{
+trade
+{
+   coin_ = pick_cheaper_coin(market.wallet);
+   if my.money {
+   buy(coin_,Uniform(0,my.money) // 1);
+   }
+   expensier = pick_expensier_coin(my.wallet);
+   if expensier {
+    sell(expensier);
+   }
+   wake_on_price(coin_, 75);
+   sleep(33);
+}
+}
+"""
+
+
+def _run(source: str) -> dict:
+    simulation = Simulation.load(io.StringIO(source))
+    simulation.log_trades = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        return simulation.run(plot=False)
+
+
+def test_wake_times_are_moved_to_the_step_grid():
+    scheduler = Scheduler()
+    scheduler.set_grid(1, 10)
+    scheduler.wake_at("agent", 26.5)
+    assert scheduler.wake_times["agent"] == 31
+    scheduler.wake_at("agent", 21)
+    assert scheduler.wake_times["agent"] == 21
+
+
+def test_event_loop_matches_step_loop():
+    source = scenario(ticks=60, coins=2, traders=2, seed=11) + _WAITING_TRADERS
+    steps = _run(source)
+    events = _run(source.replace("seed=11", "seed=11,event_driven=1"))
+    assert events == steps
@@ -0,0 +1,17 @@
+from toolchain.frontend_generator import Grammar
+
+
+def test_closure_propagates_grown_lookaheads():
+    # A -> .D is first reached with $ and gets c later from B -> .A, D -> .d must get c too
+    g = Grammar()
+    c, d = g.symbol_emit(("c", "c"), ("d", "d"))
+    S, A, B, D = g.symbol_emit("S", "A", "B", "D")
+    g.initial_symbol = S
+    S > A | B + c
+    B > A
+    A > D
+    D > d
+    g._augment()
+    initial = g._lr1_automaton().initial_state
+    lookaheads = {item.production.left_part.name: {s.name for s in item.lookaheads} for item in initial.content}
+    assert lookaheads["D"] == {"$", "c"}
@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from CryptoSimulator.Simulation import Simulation
+from benchmarks.scenarios import scenario
+from interpreter.incremental import declaration_starts
+
+
+def _shape(simulation):
+    return [(type(top).__name__, top.name.name) for top in simulation.funcs + simulation.agents]
+
+
+def test_declarations_are_split_at_top_level_keywords():
+    source = "options [seed=1]\nfunc f() { x = 'trader'; # coin X\n ret 1; }\ncoin C : T [] {}\ntrader_x = 1;"
+    assert [keyword for _, keyword in declaration_starts(source)] == ["options", "func", "coin "]
+
+
+def test_edit_reprocesses_only_the_edited_declaration():
+    interpreter = Simulation.interpreter()
+    source = scenario(coins=3, traders=3)
+    full = interpreter.parse(source)
+    interpreter.check(full)
+    first = interpreter.declarations(source)
+    assert _shape(first) == _shape(full)
+    entries = len(interpreter.declarations.cache)
+    edited = source.replace("[initial_money=50]", "[initial_money=60]", 1)
+    second = interpreter.declarations(edited)
+    assert len(interpreter.declarations.cache) == entries + 1
+    assert second.funcs[0] is first.funcs[0] and second.agents[-1] is first.agents[-1]
+    assert second.agents[3] is not first.agents[3]
+
+
+def test_dependents_are_checked_again():
+    interpreter = Simulation.interpreter()
+    source = scenario(coins=1, traders=0)
+    interpreter.declarations(source)
+    with pytest.raises(Exception, match="Function not defined"):
+        interpreter.declarations(source.replace("func fluctuation()", "func wave()"))
+
+
+def test_syntax_errors_match_the_full_parse():
+    interpreter = Simulation.interpreter()
+    broken = scenario(coins=2, traders=1).replace("my.value = val;", "my.value = = val;")
+    with pytest.raises(Exception) as full:
+        interpreter.parse(broken)
+    with pytest.raises(Exception) as incremental:
+        interpreter.declarations(broken)
+    assert str(incremental.value) == str(full.value)
+
+
+def test_moving_declarations_keeps_the_lines_of_returned_asts():
+    interpreter = Simulation.interpreter()
+    source = scenario(coins=2, traders=2)
+    first = interpreter.declarations(source)
+    lines = [agent.type.line for agent in first.agents]
+    moved = interpreter.declarations("\n\n" + source)
+    assert [agent.type.line for agent in first.agents] == lines
+    assert [agent.type.line for agent in moved.agents] == [line + 2 for line in lines]
+    coin = source[source.index("coin Coin0"):source.index("coin Coin1")]
+    twice = interpreter.declarations(source + coin)
+    assert twice.agents[0] is not twice.agents[-1]
+    assert twice.agents[-1].type.line == source.count("\n") + 1
+
+
+def test_loads_of_an_edited_simulation_reuse_declarations():
+    source = scenario(coins=2, traders=3, seed=7)
+    Simulation.load(io.StringIO(source), incremental=True)
+    cache = Simulation.interpreter().declarations.cache
+    entries = len(cache)
+    edited = source.replace("[initial_money=50]", "[initial_money=80]", 1)
+    Simulation.load(io.StringIO(edited.replace("initial_money=80", "initial_money=90", 1)))  # lexed in chunks
+    assert len(cache) == entries
+    edited = Simulation.load(io.StringIO(edited), incremental=True)
+    assert len(cache) == entries + 1
+    assert edited.traders[0].initial_money == 80
@@ -0,0 +1,24 @@
+import pytest
+
+from toolchain.frontend_generator import Grammar
+
+
+def test_lalr_merge_conflict_is_told_apart(tmp_path):
+    # LR(1) but not LALR(1), merging the two states reducing c gives a reduce-reduce conflict
+    g = Grammar()
+    a, b, c, d, e = g.symbol_emit(("a", "a"), ("b", "b"), ("c", "c"), ("d", "d"), ("e", "e"))
+    S, A, B = g.symbol_emit("S", "A", "B")
+    g.initial_symbol = S
+    S > a + A + d | b + B + d | a + B + e | b + A + e
+    A > c
+    B > c
+    assert g.lr_states_count() == dict(lr1=14, lalr=13)
+    g.write_lr1_parser(str(tmp_path))
+    with pytest.raises(ValueError, match="introduced by the LALR"):
+        g.write_lr1_parser(str(tmp_path), lalr=True)
+
+
+def test_lalr_parser_has_fewer_states():
+    from toolchain.regx_engine._regex_gen import rx
+    counts = rx.lr_states_count()
+    assert counts["lalr"] < counts["lr1"]
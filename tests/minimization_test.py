@@ -0,0 +1,98 @@
+from itertools import product
+
+from toolchain.automaton import Automaton, State
+from toolchain.regx_engine import RegxEngine, ast_regex
+from interpreter import simulation_interpreter, ast_crypto
+from interpreter.lexer import Lexer
+
+
+def accepts(automaton: Automaton, word: str):
+    state = automaton.initial_state
+    for char in word:
+        if (state := state.goto(char)) is None:
+            return None
+    return Automaton._content_key(state) if state.final else None
+
+
+def same_language(first: Automaton, second: Automaton, alphabet: str, length: int):
+    for size in range(length + 1):
+        for word in map("".join, product(alphabet, repeat=size)):
+            assert accepts(first, word) == accepts(second, word), word
+
+
+def regex_dfa(regex: str) -> Automaton:
+    tokens = RegxEngine.tokeizer(regex)
+    return RegxEngine.parser(tokens).eval().get_dfa()
+
+
+def test_textbook_example():
+    # (a|b)*abb has 4 states in its minimal dfa
+    dfa = regex_dfa("(a|b)*abb")
+    minimal = dfa.minimize()
+    assert len(minimal.states) == 4
+    same_language(dfa, minimal, "ab", 8)
+
+
+def test_redundant_states_are_merged():
+    nfa = Automaton()
+    q0, q1, q2, q3 = State(), State(), State(), State(final=True)
+    nfa.add_state(q0, q1, q2, q3)
+    q0["a"] = q1
+    q0["b"] = q2
+    q1["a"] = q3
+    q2["a"] = q3
+    q3["a"] = q3
+    minimal = nfa.minimize()
+    # q1 and q2 behave the same
+    assert len(minimal.states) == 3
+    same_language(nfa, minimal, "ab", 6)
+
+
+def test_dead_states_are_dropped():
+    nfa = Automaton()
+    q0, q1, dead = State(), State(final=True), State()
+    nfa.add_state(q0, q1, dead)
+    q0["a"] = q1
+    q0["b"] = dead
+    dead["a"] = dead
+    minimal = nfa.minimize()
+    assert len(minimal.states) == 2
+    same_language(nfa, minimal, "ab", 5)
+
+
+def test_character_classes():
+    for regex, alphabet, states in (("[A-Za-z][\\dA-Z_a-z]*", "aZ1_-", 2), ("#[^\n\r]*", "#a\n", 2),
+                                    ("\\d+|\\d+[\\.]\\d+", "1.a", 4), ("ab|abcd", "abcd", 5)):
+        dfa = regex_dfa(regex)
+        minimal = dfa.minimize()
+        assert len(minimal.states) == states, regex
+        same_language(dfa, minimal, alphabet, 5)
+
+
+def test_tags_are_not_merged():
+    first, second = regex_dfa("a"), regex_dfa("b")
+    for st in first.final_states:
+        st.content = {(0, "A")}
+    for st in second.final_states:
+        st.content = {(1, "B")}
+    union = (first | second).get_dfa()
+    minimal = union.minimize()
+    assert len(minimal.states) == 3
+    same_language(union, minimal, "ab", 3)
+
+
+def test_minimized_lexer_is_equivalent():
+    lexer = Lexer(simulation_interpreter.RegxMatcher(), ast_crypto.TOKEN_TYPE)
+    rules = [(name, matcher[0]) for name, matcher in lexer.matcher.matchers.items()]
+    full = RegxEngine.compile_tokens(rules, minimize=False)
+    minimal = lexer.matcher.compiled
+    assert len(minimal.table) < len(full.table)
+    source = "options [endtime=10]\nfunc f(x) { # comment\n ret x // 2.5 >= 1 != 'str'; }\n" \
+             "trader T : TraderGenericTemplate [initial_money=50] { trade { if my.money { leave(); } } }"
+    pos = 0
+    while pos < len(source):
+        assert full.match(source, pos) == minimal.match(source, pos)
+        pos += 1
+    for alphabet in (ast_regex.DIGITS, "if_elsmy ", "<>=!/"):
+        for word in map("".join, product(alphabet, repeat=3)):
+            assert full.match(word) == minimal.match(word), word
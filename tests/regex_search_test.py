@@ -0,0 +1,60 @@
+import re
+
+from toolchain.regx_engine import RegxEngine
+
+
+def test_optional_does_not_enter_repeat():
+    # the skip of ? used to reach the back edge of the inner +
+    assert RegxEngine.compile("(b+a)?").match("b") == ""
+    assert RegxEngine.compile("((c|b)([a-c])+)?").match("a") == ""
+
+
+def test_search_is_leftmost_longest():
+    pattern = RegxEngine.compile("ab|bcdef")
+    assert pattern.search("xabcdef").span() == (1, 3)
+    assert pattern.search("xbcdefab").span() == (1, 6)
+    assert pattern.search("xyz") is None
+    assert pattern.fullmatch("ab").match == "ab"
+    assert pattern.fullmatch("abc") is None
+
+
+def test_groups():
+    pattern = RegxEngine.compile("(?P<trader>T\\d+) (buy|sell) (?P<coin>[A-Z]+)( \\d+)?")
+    match = pattern.search("t=4 T12 sell BTC")
+    assert match.span() == (4, 16)
+    assert match.groups() == ("T12", "sell", "BTC", None)
+    assert match["coin"] == "BTC" and match.span("trader") == (4, 7)
+    assert match.lastgroup == "coin"
+    assert match.groupdict() == {"trader": "T12", "coin": "BTC"}
+
+
+def test_finditer():
+    assert [m.span() for m in RegxEngine.compile("a*").finditer("baa")] == [(0, 0), (1, 3), (3, 3)]
+    assert RegxEngine.compile("(?P<coin>[A-Z]+):\\d").findall("BTC:1 ETH:2, X:") == ["BTC:1", "ETH:2"]
+
+
+def test_lazy_finditer_survives_flushes():
+    text = "ab" * 50 + "aab" * 50 + "b"
+    eager = RegxEngine.compile("(a|b)*abb|a|b")
+    lazy = RegxEngine.compile("(a|b)*abb|a|b", lazy=True, cache_size=3)
+    assert [m.span() for m in lazy.finditer(text)] == [m.span() for m in eager.finditer(text)]
+
+
+def test_set_reports_every_end_with_leftmost_start():
+    pattern_set = RegxEngine.compile_set(["T\\d+ buy", "buy [A-Z]+", "a+"])
+    text = "T12 buy BTC aa"
+    assert list(pattern_set.scan(text)) == [(0, 0, 7), (1, 4, 9), (1, 4, 10), (1, 4, 11), (2, 12, 13), (2, 12, 14)]
+    assert list(pattern_set.ends(text)) == [(pid, end) for pid, _, end in pattern_set.scan(text)]
+
+
+def test_set_starts_match_every_start_tried():
+    patterns = ["a+b", "b(a|b)*a", "ab|a", "x?", "[a-c]+"]
+    text = "abxbbaabacabbxaaab"
+    expected = []
+    for end in range(2, len(text) + 1):
+        for pattern_id, pattern in enumerate(patterns):
+            start = next((start for start in range(2, end + 1) if re.fullmatch(pattern, text[start:end])), None)
+            if start is not None:
+                expected.append((pattern_id, start, end))
+    assert list(RegxEngine.compile_set(patterns).scan(text, 2)) == expected
+    assert list(RegxEngine.compile_set(patterns, lazy=True, cache_size=2).scan(text, 2)) == expected
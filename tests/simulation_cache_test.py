@@ -0,0 +1,65 @@
+import io
+import os
+
+from CryptoSimulator.Simulation import Simulation
+from benchmarks.scenarios import scenario
+from interpreter import SimulationInterpreter, simulation_interpreter
+from toolchain.automaton import automaton
+
+
+def test_cached_simulation_skips_the_front_end(tmp_path):
+    source = scenario(ticks=20, coins=2, traders=3, seed=3)
+    first = Simulation.load(io.StringIO(source), str(tmp_path))
+    declarations = 1 + source.count("\ncoin ") + source.count("\ntrader ")  # options go with the func
+    assert sorted(name[:4] for name in os.listdir(tmp_path)) == ["decl"] * declarations + ["sim-"]
+    interpreter = Simulation._new_interpreter(str(tmp_path))  # as in another process
+    simulation = interpreter.compile(source)
+    assert "lexer" not in vars(interpreter) and "parser" not in vars(interpreter)
+    assert [agent.name.name for agent in simulation.agents] == [f"Coin{i}" for i in range(2)] + \
+           [f"Trader{i}" for i in range(3)]
+    second = Simulation.load(io.StringIO(source), str(tmp_path))
+    assert second.run(plot=False) == first.run(plot=False)
+
+
+def test_dependencies_are_part_of_the_key(tmp_path):
+    source = scenario(ticks=20, coins=1, traders=1)
+    old = Simulation.interpreter(str(tmp_path))
+    old.compile(source)
+    new = SimulationInterpreter(old.built_ins, old.agent_templates, old.sim_opts, [b"edited built ins"], str(tmp_path))
+    new.compile(source)
+    assert "parser" in vars(new) and len(os.listdir(tmp_path)) == 2 * (1 + 1 + 1 + 1)
+
+
+def test_engine_sources_are_part_of_the_key(tmp_path, monkeypatch):
+    source = scenario(ticks=20, coins=1, traders=1)
+    old = Simulation._new_interpreter(str(tmp_path))
+    sources = simulation_interpreter.engine_sources()
+    with open(simulation_interpreter.__file__, "rb") as interpreter, open(automaton.__file__, "rb") as automata:
+        assert interpreter.read() in sources and automata.read() in sources
+    monkeypatch.setattr(simulation_interpreter, "engine_sources", lambda: sources + [b"# edited check"])
+    new = Simulation._new_interpreter(str(tmp_path))
+    assert new._disk_path(source) != old._disk_path(source)
+
+
+def test_other_processes_reuse_the_declarations(tmp_path):
+    source = scenario(ticks=20, coins=2, traders=3)
+    Simulation._new_interpreter(str(tmp_path)).compile(source)
+    interpreter = Simulation._new_interpreter(str(tmp_path))
+    edited = interpreter.compile(source.replace("[initial_money=50]", "[initial_money=70]", 1))
+    declarations = 1 + source.count("\ncoin ") + source.count("\ntrader ")  # options go with the func
+    assert len(interpreter.declarations.cache) == declarations  # only the declarations of this source are read
+    assert sum(name.startswith("decl") for name in os.listdir(tmp_path)) == declarations + 1
+    assert [agent.name.name for agent in edited.agents][-1] == "Trader2"
+
+
+def test_processes_compiling_at_once_keep_each_others_declarations(tmp_path):
+    source = scenario(ticks=20, coins=1, traders=2)
+    first, second = Simulation._new_interpreter(str(tmp_path)), Simulation._new_interpreter(str(tmp_path))
+    second.compile(source)
+    trader0, trader1 = (f"{name} : TraderGenericTemplate [initial_money=50]" for name in ("Trader0", "Trader1"))
+    first.compile(source.replace(trader0, trader0.replace("50", "60")))
+    second.compile(source.replace(trader1, trader1.replace("50", "70")))
+    both = source.replace(trader0, trader0.replace("50", "60")).replace(trader1, trader1.replace("50", "70"))
+    third = Simulation._new_interpreter(str(tmp_path))
+    assert [agent.name.name for agent in third.compile(both).agents] == ["Coin0", "Trader0", "Trader1"]
+    assert "lexer" not in vars(third)  # every declaration came from the files of the others
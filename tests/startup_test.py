@@ -0,0 +1,20 @@
+import os
+import subprocess
+import sys
+
+from CryptoSimulator.Simulation import Simulation
+from CryptoSimulator.library_built_in import sim_ops
+from benchmarks.startup_bench import DEFERRED, ROOT
+
+
+def test_import_defers_what_only_runs_need(tmp_path):
+    code = f"import sys, CryptoSimulator.Simulation\nprint(*[m for m in {DEFERRED!r} if m in sys.modules])"
+    res = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=dict(os.environ, PYTHONPATH=ROOT),
+                         capture_output=True, text=True, check=True)
+    assert res.stdout.split() == []
+    assert os.listdir(tmp_path) == []  # output.log is opened by the first message
+
+
+def test_reflected_modules_are_the_imported_ones():
+    interpreter = Simulation.interpreter()
+    assert interpreter.built_ins["leave"] is sim_ops.leave
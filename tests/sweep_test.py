@@ -0,0 +1,47 @@
+import csv
+
+import pytest
+
+from CryptoSimulator.sweep import grid, parse_axis, sweep
+from benchmarks.scenarios import scenario
+
+AXES = dict([parse_axis("endtime=101,201"), parse_axis("Trader0.population=1,2"), parse_axis("Coin1.base_value=9.5")])
+
+
+def _rows(path) -> list:
+    with open(path, newline="") as file:
+        return sorted(csv.reader(file))
+
+
+def test_grid_and_overrides(tmp_path):
+    assert [params for _, params in grid(AXES)][1] == {"endtime": 101, "Trader0.population": 2, "Coin1.base_value": 9.5}
+    out = tmp_path / "sweep.csv"
+    assert sweep(scenario(ticks=20, coins=2, traders=2, seed=1), AXES, str(out), workers=0) == 4
+    rows = _rows(out)
+    assert rows[-1] == ["job", "endtime", "Trader0.population", "Coin1.base_value", "trader", "money"]
+    assert [row[4] for row in rows if row[0] == "3"] == ["Trader0_0", "Trader0_1", "Trader1"]
+
+
+def test_resume_reruns_only_what_is_missing(tmp_path):
+    source = scenario(ticks=20, coins=2, traders=2, seed=1)
+    out = tmp_path / "sweep.csv"
+    sweep(source, AXES, str(out), workers=2)
+    full = _rows(out)
+    text = out.read_text()
+    out.write_text(text[:text.rfind("Trader1")])  # interrupted while writing the last job
+    assert sweep(source, AXES, str(out), workers=0, resume=True) == 1
+    assert _rows(out) == full
+    with pytest.raises(Exception, match="another sweep"):
+        sweep(source, dict([parse_axis("seed=1,2")]), str(out), workers=0, resume=True)
+    endtimes = dict([parse_axis("endtime=" + ",".join(str(21 + i) for i in range(12)))])
+    sweep(source, endtimes, str(out), workers=0)
+    full = _rows(out)
+    text = out.read_text()
+    out.write_text(text[:text.rfind("\n11,") + 2])  # cut inside the job id of the last row
+    assert sweep(source, endtimes, str(out), workers=0, resume=True) == 1
+    assert _rows(out) == full
+
+
+def test_unknown_options_are_rejected(tmp_path):
+    with pytest.raises(Exception, match="option not exists"):
+        sweep(scenario(coins=1, traders=1), dict([parse_axis("Trader0.money=1")]), str(tmp_path / "out.csv"))
@@ -0,0 +1,80 @@
+import contextlib
+import io
+
+from CryptoSimulator.Simulation import Simulation
+from CryptoSimulator.vectorized import group_populations
+
+# no random draws, the vectorized population must end exactly as the traders run one by one
+_SOURCE = """options [init_time=1,endtime=301,step_size=10,vectorized={vectorized}]
+
+coin Up : CoinGenericTemplate [base_value=40]
+{{
+update_parameters
+{{
+my.value = my.base_value + market.time / 7;
+}}
+}}
+
+coin Wave : CoinGenericTemplate [base_value=60]
+{{
+update_parameters
+{{
+my.value = my.base_value + (market.time % 50) - 20;
+}}
+}}
+
+trader Crowd : TraderGenericTemplate [initial_money=100, population=4]
+{{
+trade
+{{
+   best = get_with_more_utility();
+   if best {{
+    sell(best, 'all');
+   }}
+   if my.money > 30 {{
+   buy(pick_cheaper_coin(market.wallet), 20);
+   }}
+   else {{
+   if !my.wallet {{
+    leave();
+   }}
+   }}
+   {extra}
+}}
+}}
+"""
+
+
+def _load(vectorized: int, extra="", source=_SOURCE) -> Simulation:
+    simulation = Simulation.load(io.StringIO(source.format(vectorized=vectorized, extra=extra)))
+    simulation.log_trades = False
+    return simulation
+
+
+def _run(simulation: Simulation) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return simulation.run(plot=False)
+
+
+def test_vectorized_population_matches_scalar_traders():
+    vectorized = _load(1)
+    scalars, populations = group_populations(vectorized.traders)
+    assert scalars == [] and [len(members) for members in populations] == [4]
+    assert _run(vectorized) == _run(_load(0))
+
+
+def test_built_ins_without_vector_version_fall_back_to_scalar_loop():
+    simulation = _load(1, "sleep(1);")
+    scalars, populations = group_populations(simulation.traders)
+    assert len(scalars) == 4 and populations == []
+    assert _run(simulation) == _run(_load(0, "sleep(1);"))
+
+
+def test_seeded_population_is_reproducible_but_draws_from_one_stream():
+    # the lanes draw from the stream of the first member, not each from its own as the scalar traders do
+    source = _SOURCE.replace("vectorized={vectorized}]", "vectorized={vectorized},seed=5]") \
+        .replace("buy(pick_cheaper_coin(market.wallet), 20);", "buy(pick_cheaper_coin(market.wallet), Uniform(5,30));")
+    vectorized = _run(_load(1, source=source))
+    assert vectorized == _run(_load(1, source=source))
+    assert _run(_load(0, source=source)) == _run(_load(0, source=source))
+    assert vectorized != _run(_load(0, source=source))
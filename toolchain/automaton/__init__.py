@@ -1 +1 @@
-from .automaton import Automaton, State
+from .automaton import Automaton, State, SymbolRange, IndexedAutomaton
@@ -1,6 +1,56 @@
+from bisect import bisect_right
 from collections import deque
 from itertools import chain, repeat
-from typing import Dict, List, Set, Callable, FrozenSet, Any, Iterable, Tuple
+from typing import Dict, List, Set, Callable, FrozenSet, Any, Iterable, Tuple, NamedTuple
+
+
+class SymbolRange(NamedTuple):
+    '''
+    inclusive range of code points used as one transition symbol instead of an edge per char
+    '''
+    first: int
+    last: int
+
+    def __repr__(self):
+        if self.first == self.last:
+            return repr(chr(self.first))
+        return f"{chr(self.first)!r}-{chr(self.last)!r}"
+
+    def __contains__(self, char: str):
+        return self.first <= ord(char) <= self.last
+
+    def covers(self, other: "SymbolRange") -> bool:
+        return self.first <= other.first and other.last <= self.last
+
+    @staticmethod
+    def of(chars: Iterable[str]) -> List["SymbolRange"]:
+        '''
+        fewest ranges holding exactly the given chars
+        '''
+        ranges = []
+        for code in sorted(set(map(ord, chars))):
+            if ranges and ranges[-1].last + 1 == code:
+                ranges[-1] = SymbolRange(ranges[-1].first, code)
+            else:
+                ranges.append(SymbolRange(code, code))
+        return ranges
+
+    @staticmethod
+    def disjoint(ranges: Iterable["SymbolRange"]) -> List["SymbolRange"]:
+        '''
+        splits the ranges in sorted disjoint pieces holding the same chars, every original range either covers a
+        piece or does not touch it
+        '''
+        points = sorted(chain.from_iterable(((r.first, 1), (r.last + 1, -1)) for r in ranges))
+        res = []
+        depth = 0
+        previous = None
+        for point, delta in points:
+            if depth > 0 and previous < point:
+                res.append(SymbolRange(previous, point - 1))
+            depth += delta
+            previous = point
+        return res
 
 
 class State:
@@ -28,7 +78,7 @@ class State:
         return hash(self.name)  # hash idempotent on int
 
     def __eq__(self, other: "State"):
-        return hash(self) == hash(other)
+        return self is other or isinstance(other, State) and self.name == other.name
 
     def __add__(self, other: "State"):
         name = None  # int(str(self.name) + str(other.name))
@@ -48,6 +98,17 @@ class State:
         else:
             return self.transitions.get(item, None)
 
+    def goto(self, char: str) -> "State | None":
+        '''
+        target consuming a char, looking into the range symbols too
+        '''
+        if (res := self.transitions.get(char, None)) is not None:
+            return res
+        for symbol, dst in self.transitions.items():
+            if isinstance(symbol, SymbolRange) and char in symbol:
+                return dst
+        return None
+
     def __setitem__(self, key, value):
         if key is None:
             self.epsilon_transitions.append(value)
@@ -103,8 +164,30 @@ class Automaton:
                 graph.edge(src_rpr, dst_rpr, label=e_repr)
         graph.unflatten().view(tempfile.mktemp(".gv"))
 
+    def _copy_into(self, target: "Automaton") -> State:
+        '''
+        adds a copy of every state to target, the copies are named by target so they never collide, returns the copy
+        of the initial state
+        '''
+        cpy_map = dict()
+        pending = list(chain((self.initial_state,), self.states))
+        for src in pending:  # grows with the states only reachable through transitions
+            if src in cpy_map:
+                continue
+            src_cpy = src.get_copy(None)
+            cpy_map[src] = src_cpy
+            target.add_state(src_cpy)
+            pending.extend(chain(src.transitions.values(), src.epsilon_transitions))
+        for src, src_cpy in cpy_map.items():
+            for e, dst in chain(src.transitions.items(), zip(repeat(None), src.epsilon_transitions)):
+                src_cpy[e] = cpy_map[dst]
+        return cpy_map[self.initial_state]
+
     def get_copy(self, prefix=None) -> "Automaton":
         new_automaton = Automaton()
+        if prefix is None:
+            new_automaton.initial_state = self._copy_into(new_automaton)
+            return new_automaton
         cpy_map = dict()
         for src in self.states:
             if (src_cpy := cpy_map.get(src, None)) is None:
@@ -122,21 +205,31 @@ class Automaton:
         return new_automaton
 
     @staticmethod
-    def _get_goto(states: Iterable[State], symbol) -> Tuple[State]:
-        goto = tuple(sorted(set([st[symbol] for st in states if st[symbol] is not None]), key=hash))
-        return goto
-
-    @staticmethod
-    def _get_epsilon_closure_of(states: Iterable[State]) -> Tuple[State]:
-        visited = set()
-        mdfs_stack = list(states)  # recursion not good in python
-        while mdfs_stack:
-            state = mdfs_stack.pop()
-            visited.add(state)
-            not_visited = list(filter(lambda s: s not in visited, state.epsilon_transitions))
-            mdfs_stack.extend(not_visited)
-        res = tuple(sorted(visited, key=hash))
-        return res
+    def expand_transitions(states: Iterable[State]) -> Tuple[List, Dict[State, Dict[Any, State]]]:
+        '''
+        transitions of every state over a common set of symbols, range symbols are split in the disjoint pieces
+        of all the states, returns the symbols (pieces sorted) and the transitions of each state over them
+        '''
+        states = list(states)
+        keys = set(chain.from_iterable(st.transitions.keys() for st in states))
+        pieces = SymbolRange.disjoint(key for key in keys if isinstance(key, SymbolRange))
+        starts = [piece.first for piece in pieces]
+        expanded = dict()
+        for st in states:
+            ranges = []
+            others = []
+            for key, dst in st.transitions.items():
+                if isinstance(key, SymbolRange):
+                    i = bisect_right(starts, key.first) - 1
+                    while i < len(pieces) and pieces[i].last <= key.last:
+                        ranges.append((pieces[i], dst))
+                        i += 1
+                else:
+                    others.append((key, dst))
+            ranges.sort(key=lambda item: item[0])
+            expanded[st] = dict(chain(ranges, others))
+        symbols = pieces + [key for key in keys if not isinstance(key, SymbolRange)]
+        return symbols, expanded
 
     @staticmethod
     def powerset_construct(initial_value: Iterable[Any], goto_func: Callable[[Tuple, Any], Tuple],
@@ -172,48 +265,136 @@ class Automaton:
     def get_dfa(self) -> "Automaton":
         if self.is_dfa():
             return self
-        transition_symbol_resolver: Callable[[Any], Any] = \
-            lambda subset: sorted(set(chain.from_iterable(x.get_transition_symbols() for x in subset)), key=hash)
-        state_maker: Callable[[Any], int | Any] = lambda subset: sum(subset)
-        goto_func = self._get_goto
-        closure_func = self._get_epsilon_closure_of
-        initial_value = [self.initial_state]
-        dfa = self.powerset_construct(initial_value, goto_func, closure_func, state_maker, transition_symbol_resolver)
+        nfa = IndexedAutomaton(self)
+        initial_value = [nfa.initial]
+        dfa = self.powerset_construct(initial_value, nfa.goto, nfa.closure, nfa.merged_state, nfa.symbols)
         return dfa
 
+    @staticmethod
+    def _content_key(state: State):
+        content = state.content
+        return frozenset(content) if isinstance(content, (set, list)) else content
+
+    def minimize(self) -> "Automaton":
+        '''
+        Hopcroft partition refinement over the dfa, final states start split by their content so tagged states
+        are never merged, states that can not reach a final state are dropped
+        '''
+        dfa = self.get_dfa()
+        sink = State()  # completes the dfa, every missing transition goes here
+        states = list(dfa.states) + [sink]
+        symbols, expanded = self.expand_transitions(dfa.states)
+        expanded[sink] = dict()
+        inverse: Dict[Any, Dict[State, List[State]]] = {symbol: dict() for symbol in symbols}
+        for src in states:
+            for symbol in symbols:
+                dst = expanded[src].get(symbol, sink)
+                inverse[symbol].setdefault(dst, []).append(src)
+
+        initial_blocks: Dict[Any, Set[State]] = dict()
+        for st in states:
+            key = (True, self._content_key(st)) if st.final and st is not sink else (False, None)
+            initial_blocks.setdefault(key, set()).add(st)
+        blocks: List[Set[State]] = list(initial_blocks.values())
+        block_of: Dict[State, int] = {st: i for i, block in enumerate(blocks) for st in block}
+        pending = set(range(len(blocks)))
+
+        while pending:
+            splitter = set(blocks[pending.pop()])  # the block may be split while it is used
+            for symbol in symbols:
+                predecessors = inverse[symbol]
+                touched: Dict[int, Set[State]] = dict()
+                for dst in splitter:
+                    for src in predecessors.get(dst, ()):
+                        touched.setdefault(block_of[src], set()).add(src)
+                for i, inside in touched.items():
+                    block = blocks[i]
+                    if len(inside) == len(block):
+                        continue
+                    block -= inside
+                    blocks.append(inside)
+                    new = len(blocks) - 1
+                    for st in inside:
+                        block_of[st] = new
+                    if i in pending:
+                        pending.add(new)
+                    else:
+                        pending.add(i if len(block) <= len(inside) else new)
+
+        minimal = Automaton()
+        dead = block_of[sink]
+        made: Dict[int, State] = dict()
+
+        def block_state(i: int) -> State:
+            if (st := made.get(i, None)) is None:
+                representative = next(iter(blocks[i]))
+                st = State(final=representative.final, content=representative.content)
+                made[i] = st
+                minimal.add_state(st)
+            return st
+
+        minimal.initial_state = block_state(block_of[dfa.initial_state])
+        pending_states = deque([block_of[dfa.initial_state]])
+        reached = set(pending_states)
+        while pending_states:
+            i = pending_states.popleft()
+            src = made[i]
+            representative = next(iter(blocks[i]))
+            last_range, last_block = None, None
+            for symbol, dst in expanded[representative].items():  # pieces come sorted, merge the contiguous ones
+                if (j := block_of[dst]) == dead:
+                    continue
+                if isinstance(symbol, SymbolRange):
+                    if last_range is not None and last_block == j and last_range.last + 1 == symbol.first:
+                        del src.transitions[last_range]
+                        symbol = SymbolRange(last_range.first, symbol.last)
+                    last_range, last_block = symbol, j
+                src[symbol] = block_state(j)
+                if j not in reached:
+                    reached.add(j)
+                    pending_states.append(j)
+        return minimal
+
     def __repr__(self):
         res = f"States {len(self.states)}, Finals {len(self.final_states)}, Initial {self.initial_state.name}"
         return res
 
     def __add__(self, other: "Automaton") -> "Automaton":
-        prefix = len(self.states) + len(other.states)
-        new_automaton = self.get_copy(prefix)
-        copy_o = other.get_copy(prefix * 2)
+        new_automaton = self.get_copy()
+        finals = list(new_automaton.final_states)
+        new_automaton.final_states.clear()
+        other_initial = other._copy_into(new_automaton)
         # concat automatons using epsilon transitions
-        for final in new_automaton.final_states:
-            final[None] = copy_o.initial_state
+        for final in finals:
+            final[None] = other_initial
             final.final = False
-        new_automaton.final_states.clear()
-        new_automaton.add_state(*copy_o.states)
         return new_automaton
 
     def __or__(self, other: "Automaton") -> "Automaton":
-        prefix = len(self.states) + len(other.states)
-        new_automaton = self.get_copy(prefix)
-        copy_o = other.get_copy(prefix * 2)
-        new_automaton.add_state(*copy_o.states)
-        # or automatons using epsilon transitions from dummy initial state
+        res = Automaton.union((self, other))
+        return res
+
+    @staticmethod
+    def union(automata: Iterable["Automaton"]) -> "Automaton":
+        '''
+        or of many automatons using epsilon transitions from one dummy initial state, each one is copied once
+        '''
+        new_automaton = Automaton()
         dummy_init = State()
         new_automaton.add_state(dummy_init)
-        dummy_init[None] = new_automaton.initial_state
-        dummy_init[None] = copy_o.initial_state
-        new_automaton.initial_state = dummy_init
+        for automaton in automata:
+            dummy_init[None] = automaton._copy_into(new_automaton)
         return new_automaton
 
     def lazy(self):
         new_automaton = self.get_copy()
-        for final in new_automaton.final_states:
-            new_automaton.initial_state[None] = final
+        # the skip goes between new states, from the old ones it could follow the back edges a repeat left on them
+        initial = State()
+        skip = State(final=True)
+        new_automaton.add_state(initial, skip)
+        initial[None] = new_automaton.initial_state
+        initial[None] = skip
+        new_automaton.initial_state = initial
         return new_automaton
 
     def repeat(self):
@@ -221,3 +402,118 @@ class Automaton:
         for final in new_automaton.final_states:
             final[None] = new_automaton.initial_state
         return new_automaton
+
+    def reverse(self) -> "Automaton":
+        '''
+        automaton of the reversed words, a new initial state goes by epsilon to the reversed final states and the
+        reversed initial state is the only final one
+        '''
+        nfa = IndexedAutomaton(self)
+        new_automaton = Automaton()
+        initial = State()
+        new_automaton.add_state(initial)
+        reversed_states = [State(final=i == nfa.initial) for i in range(len(nfa))]
+        new_automaton.add_state(*reversed_states)
+        for i, st in enumerate(nfa.states):
+            if st.final:
+                initial[None] = reversed_states[i]
+            for j in nfa.epsilon[i]:
+                reversed_states[j][None] = reversed_states[i]
+            for symbol, j in chain(nfa.moves[i].items(), nfa.range_moves[i]):
+                # many states may reach j with the same symbol, one epsilon hop per symbol keeps a target per key
+                if (hop := reversed_states[j][symbol]) is None:
+                    hop = State()
+                    new_automaton.add_state(hop)
+                    reversed_states[j][symbol] = hop
+                hop[None] = reversed_states[i]
+        return new_automaton
+
+
+class IndexedAutomaton:
+    '''
+    integer view of the states reachable in an automaton for the algorithms that work over sets of states,
+    epsilon closures of every state are memoized and sets of states are frozensets of ids
+    '''
+
+    def __init__(self, automaton: Automaton):
+        self.states: List[State] = [automaton.initial_state]
+        self.index: Dict[State, int] = {automaton.initial_state: 0}
+        for st in self.states:  # bfs numbering, grows while iterating
+            for dst in chain(st.transitions.values(), st.epsilon_transitions):
+                if dst not in self.index:
+                    self.index[dst] = len(self.states)
+                    self.states.append(dst)
+        index = self.index
+        self.initial = 0
+        self.final: List[bool] = [st.final for st in self.states]
+        self.epsilon: List[Tuple[int, ...]] = [tuple(index[dst] for dst in st.epsilon_transitions)
+                                               for st in self.states]
+        self.moves: List[Dict[Any, int]] = [{symbol: index[dst] for symbol, dst in st.transitions.items()
+                                             if not isinstance(symbol, SymbolRange)} for st in self.states]
+        self.range_moves: List[Tuple[Tuple[SymbolRange, int], ...]] = [
+            tuple((symbol, index[dst]) for symbol, dst in st.transitions.items() if isinstance(symbol, SymbolRange))
+            for st in self.states]
+        self._closures: List[FrozenSet[int] | None] = [None] * len(self.states)
+
+    def __len__(self):
+        return len(self.states)
+
+    def state_closure(self, i: int) -> FrozenSet[int]:
+        if (res := self._closures[i]) is None:
+            epsilon = self.epsilon
+            visited = {i}
+            stack = [i]
+            while stack:
+                for dst in epsilon[stack.pop()]:
+                    if dst not in visited:
+                        visited.add(dst)
+                        stack.append(dst)
+            res = frozenset(visited)
+            self._closures[i] = res
+        return res
+
+    def closure(self, ids: Iterable[int]) -> FrozenSet[int]:
+        res = frozenset().union(*map(self.state_closure, ids))
+        return res
+
+    def symbols(self, subset: Iterable[int]) -> List:
+        symbols = set(chain.from_iterable(self.moves[i].keys() for i in subset))
+        ranges = set(symbol for i in subset for symbol, _ in self.range_moves[i])
+        res = sorted(symbols, key=hash) + SymbolRange.disjoint(ranges)
+        return res
+
+    def goto(self, subset: Iterable[int], symbol) -> Set[int]:
+        if isinstance(symbol, SymbolRange):
+            # symbol is a piece of the disjoint split, it is inside every range it overlaps
+            res = set(dst for i in subset for key, dst in self.range_moves[i] if key.covers(symbol))
+        else:
+            res = set(dst for i in subset if (dst := self.moves[i].get(symbol, None)) is not None)
+        return res
+
+    def step(self, subset: Iterable[int], char: str) -> FrozenSet[int]:
+        '''
+        closure of the states reached consuming a char
+        '''
+        code = ord(char)
+        targets = []
+        for i in subset:
+            if (dst := self.moves[i].get(char, None)) is not None:
+                targets.append(dst)
+            for key, dst in self.range_moves[i]:
+                if key.first <= code <= key.last:
+                    targets.append(dst)
+        return self.closure(targets)
+
+    def accepting(self, subset: Iterable[int]) -> bool:
+        return any(self.final[i] for i in subset)
+
+    def merged_state(self, subset: Iterable[int]) -> State:
+        '''
+        dfa state of a subset, final if any member is final and with the content of all of them
+        '''
+        members = [self.states[i] for i in sorted(subset)]
+        contents = [st.content for st in members if st.content]
+        content = contents[0].__class__(chain.from_iterable(contents)) if len(contents) > 1 else \
+            (contents[0] if contents else None)
+        res = State(None, any(st.final for st in members), content)
+        return res
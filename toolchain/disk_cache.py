@@ -0,0 +1,23 @@
+import os
+import pickle
+
+
+# pickled values shared between processes through a folder, a missing or unreadable file is a miss and a failed
+# store is skipped, the caches stay an optimization
+def load(path: str):
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def store(path: str, value):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as file:
+            pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)  # readers never see half written files
+    except (OSError, pickle.PicklingError, RecursionError):
+        pass
@@ -1,8 +1,7 @@
 import inspect
 import os.path
 from collections import deque
-from itertools import chain
-from typing import Union, Dict, Iterable, Callable, Any, List
+from typing import Union, Dict, Iterable, Callable, List
 
 from toolchain.automaton import Automaton, State
 from .scaffold.lexer_scaffold import LexerTable
@@ -223,19 +222,129 @@ class LRitem:
         return res
 
 
+class ItemIndex:
+    '''
+    integer encoding of a grammar for the item sets constructions, the terminal k is the bit 1 << k of a lookahead
+    set and the lr(0) item (production, dot) is the int offsets[production] + dot, firsts are bitsets computed once
+    '''
+
+    def __init__(self, grammar: "Grammar"):
+        self.terminals: List[Terminal] = [t for t in grammar.terminals if not isinstance(t, Epsilon)]
+        self.symbols: List[Symbol] = self.terminals + grammar.non_terminals
+        self.productions: List[Production] = list(grammar.productions)
+        self.size = (len(grammar.terminals), len(grammar.non_terminals), len(grammar.productions))
+        symbol_ids = {s: k for k, s in enumerate(self.symbols)}
+        n_terminals = len(self.terminals)
+        rights = [[] if isinstance(p.right_part[0], Epsilon) else [symbol_ids[s] for s in p.right_part]
+                  for p in self.productions]
+        lefts = [symbol_ids[p.left_part] for p in self.productions]
+
+        # firsts of the symbols, terminals are their own bit
+        first = [1 << k if k < n_terminals else 0 for k in range(len(self.symbols))]
+        nullable = [False] * len(self.symbols)
+        changed = True
+        while changed:
+            changed = False
+            for left, right in zip(lefts, rights):
+                bits, null = self._first_of(right, first, nullable)
+                if bits & ~first[left] or null and not nullable[left]:
+                    first[left] |= bits
+                    nullable[left] |= null
+                    changed = True
+
+        self.offsets: List[int] = []
+        self.item_production: List[int] = []  # per item
+        self.item_dot: List[int] = []
+        self.next_symbol: List[int] = []  # -1 on reduce items
+        self.tail_first: List[int] = []  # first of what follows the next symbol
+        self.tail_nullable: List[bool] = []
+        for prod_id, right in enumerate(rights):
+            self.offsets.append(len(self.item_dot))
+            for dot in range(len(right) + 1):
+                self.item_production.append(prod_id)
+                self.item_dot.append(dot)
+                self.next_symbol.append(right[dot] if dot < len(right) else -1)
+                bits, null = self._first_of(right[dot + 1:], first, nullable)
+                self.tail_first.append(bits)
+                self.tail_nullable.append(null)
+        starts = [[] for _ in self.symbols]  # items with the dot at the beginning of each non terminal
+        for prod_id, left in enumerate(lefts):
+            starts[left].append(self.offsets[prod_id])
+        self.expands: List[tuple] = [tuple(starts[s]) if s >= n_terminals else () for s in self.next_symbol]
+
+    @staticmethod
+    def _first_of(sentence: List[int], first: List[int], nullable: List[bool]) -> tuple[int, bool]:
+        bits = 0
+        for symbol in sentence:
+            bits |= first[symbol]
+            if not nullable[symbol]:
+                return bits, False
+        return bits, True
+
+    def closure(self, kernel: Dict[int, int]) -> Dict[int, int]:
+        '''
+        items of the lr(1) closure of a kernel with their lookahead bitsets, an item is expanded again whenever its
+        lookaheads grow
+        '''
+        expands, tail_first, tail_nullable = self.expands, self.tail_first, self.tail_nullable
+        res = dict(kernel)
+        pending = list(kernel)
+        while pending:
+            item = pending.pop()
+            if not (starts := expands[item]):
+                continue
+            lookaheads = (tail_first[item] | res[item]) if tail_nullable[item] else tail_first[item]
+            for start in starts:
+                current = res.get(start)
+                if current is None:
+                    res[start] = lookaheads
+                    pending.append(start)
+                elif lookaheads & ~current:
+                    res[start] = current | lookaheads
+                    pending.append(start)
+        return res
+
+    def gotos(self, closure: Dict[int, int]) -> Dict[int, Dict[int, int]]:
+        '''
+        kernel reached by each symbol from a closure
+        '''
+        res: Dict[int, Dict[int, int]] = dict()
+        next_symbol = self.next_symbol
+        for item, lookaheads in closure.items():
+            if (symbol := next_symbol[item]) >= 0:
+                kernel = res.get(symbol)
+                if kernel is None:
+                    res[symbol] = {item + 1: lookaheads}
+                else:
+                    kernel[item + 1] = lookaheads
+        return res
+
+    def lr_items(self, closure: Dict[int, int]) -> tuple[LRitem]:
+        terminals = self.terminals
+        res = []
+        for item in sorted(closure):
+            lookaheads, bits, k = [], closure[item], 0
+            while bits:
+                if bits & 1:
+                    lookaheads.append(terminals[k])
+                bits >>= 1
+                k += 1
+            res.append(LRitem(self.productions[self.item_production[item]], self.item_dot[item], lookaheads))
+        return tuple(res)
+
+
 class Grammar:
     def __init__(self, attribute_encode=None, attribute_apply=None):
-        if not isinstance(attribute_encode, Callable):
-            self.attribute_encode = Grammar._attribute_encode
-        if not isinstance(attribute_apply, Callable):
-            self.attribute_apply = self._attribute_apply
+        self.attribute_encode = attribute_encode if isinstance(attribute_encode, Callable) else self._attribute_encode
+        self.attribute_apply = attribute_apply if isinstance(attribute_apply, Callable) else self._attribute_apply
         self.eof: EOF = EOF()
         self.epsilon: Epsilon = Epsilon()
         self.terminals: List[Terminal | EOF] = [self.eof, self.epsilon]
         self.non_terminals: List[NonTerminal] = []
         self.productions: List[Production] = list()
         self.initial_symbol: NonTerminal | None = None
-        self._cached_firsts: Dict[SentenceForm, set[Terminal]] | None = None
+        self._index: ItemIndex | None = None
+        self._accepted: NonTerminal | None = None  # initial symbol before augmenting
 
     def symbol_emit(self, *sym: Iterable[tuple | str]) -> Symbol | Iterable[Symbol]:
         res = []
@@ -254,74 +363,12 @@ class Grammar:
                     raise TypeError("Invalid type")
         return res if len(res) > 1 else res[0]
 
-    def _get_first(self, item: [SentenceForm] = None, allow_eps=True) -> set[Terminal]:
-
-        def calc_firsts_of_sentence(sentence_form):
-            calc = set()
-            for i, yi in enumerate(sentence_form):
-                sub_sentence = SentenceForm(yi)
-                first_yi = self._cached_firsts[sub_sentence]
-                calc.update(first_yi)
-                if self.epsilon not in first_yi:  # advance while epsilon in firsts
-                    break
-                if i != len(sentence_form) - 1:
-                    calc.remove(self.epsilon)  # will get epsilon from the last or not get it
-            return calc
-
-        if self._cached_firsts is None:
-            self._cached_firsts = {SentenceForm(s): ({s} if isinstance(s, Terminal) else set()) for s in
-                                   chain(self.terminals, self.non_terminals)}
-            change_happened = True
-            while change_happened:
-                change_happened = False
-                for production in self.productions:
-                    left_part, right_part = SentenceForm(production.left_part), production.right_part
-                    calculated = calc_firsts_of_sentence(right_part)
-                    change_happened |= right_part not in self._cached_firsts or len(
-                        calculated - self._cached_firsts[left_part]) != 0 \
-                                       or len(calculated - self._cached_firsts[right_part]) != 0
-                    self._cached_firsts[left_part].update(calculated)
-                    self._cached_firsts[right_part] = self._cached_firsts.get(right_part, calculated) | calculated
-
-        res = calc_firsts_of_sentence(item)
-        res2 = res if allow_eps else res - {self.epsilon}
-        return res2
-
-    def _get_lr1_goto(self, items: Iterable[LRitem], symbol: Symbol) -> tuple[LRitem]:
-        goto = tuple(sorted(set(item.advance_dot() for item in items if
-                                item.peek_nxt_symbol() is not None and symbol == item.peek_nxt_symbol()), key=hash))
-        return goto
-
-    def _get_lr1_closure(self, items: Iterable[LRitem]) -> tuple[LRitem]:
-        # lr1 closure is get all .Nonterminal items with theri lookaheads
-        closure = deque(items)
-        canonical: Dict[LRitem, LRitem] = {i.get_as_item_lr0(): i for i in items}
-        while closure:
-            item = closure.popleft()
-            next_symbol = item.peek_nxt_symbol()
-            if isinstance(next_symbol, NonTerminal):
-                calc_lookaheads = set()
-                for sf_plh in item.remain_with_each_lkahead():
-                    local_first = self._get_first(sf_plh, allow_eps=False)  # as follow cant contain eps
-                    calc_lookaheads.update(local_first)
-                for prod in next_symbol.associated_productions:
-                    lr0_itm = LRitem(prod)
-                    if (itm := canonical.get(lr0_itm, None)) is None:
-                        itm = LRitem(prod, 0, calc_lookaheads)
-                        canonical[lr0_itm] = itm
-                        closure.append(itm)
-                    else:
-                        itm.lookaheads = tuple(sorted(set(chain(itm.lookaheads, calc_lookaheads)), key=hash))
-        res = tuple(canonical.values())
-        return res
-
     def write_lexer(self, path) -> None:
         table = LexerTable(eof="$", linebreaker="\n", spacer=" ")
         for t in filter(lambda s: not (isinstance(s, Epsilon) or isinstance(s, EOF)), self.terminals):
             table.append((t.name, t.match, t.extra))
-        serial_str = table.get_serial_str()
         lexer_file = inspect.getfile(LexerTable)
-        parser_content = open(lexer_file).read().replace("REPLACE-ME-LEXER", serial_str)
+        parser_content = open(lexer_file).read().replace('"""REPLACE-ME-LEXER"""', table.get_literal())
         out_path = os.path.join(path, "lexer.py")
         newp = open(out_path, "w")
         newp.write(parser_content)
@@ -343,89 +390,210 @@ class Grammar:
         return None
 
     # do not decorate with static method this is just a scaffold
-    def _attribute_apply(attribute, popped_syms, info):
+    def _attribute_apply(attribute, values, info):
         ast_types = info
         if attribute:
             if len(attribute) == 1:
                 if isinstance(attribute[0], int):
                     project_index = attribute[0]
-                    instance = popped_syms[project_index].content  # project up
+                    instance = values[project_index]  # project up
                 elif isinstance(attribute[0], str):
                     prod_class = attribute[0]
-                    arg = popped_syms[0].content if len(popped_syms) else None
+                    arg = values[0] if values else None
                     instance = getattr(ast_types, prod_class)(arg)
                 else:
                     raise Exception("Attribute Not Supported")
             elif len(attribute) == 2:
                 prod_class, args_map = attribute
-                args = list(map(lambda i: popped_syms[i].content, args_map))
+                args = [values[i] for i in args_map]
                 instance = getattr(ast_types, prod_class)(*args)
             else:
                 raise Exception("Attribute Not Supported")
         else:
-            instance = popped_syms[0].content if len(popped_syms) else None  # project up
+            instance = values[0] if values else None  # project up
         return instance
 
-    def write_lr1_parser(self, path: [str | None] = None) -> None:
-        """
-        Generates an LR1 Shif-Reduce Parser for the Gramamr using attribute coder and attribute applier supplied or def
-        If no arg is provided visualizes the dfa
-        """
+    @staticmethod
+    def _reduction_body(attribute, size: int, classes: Dict[str, str]) -> str:
+        '''
+        expression building the node of a reduction from its popped values as _attribute_apply would do it
+        '''
+        if not attribute:
+            return "values[0]" if size else "None"  # project up
+        if len(attribute) == 1 and isinstance(attribute[0], int):
+            return f"values[{attribute[0]}]"
+        if len(attribute) == 1 and isinstance(attribute[0], str):
+            alias = classes.setdefault(attribute[0], f"_{attribute[0]}")
+            return f"{alias}({'values[0]' if size else 'None'})"
+        if len(attribute) == 2:
+            prod_class, args_map = attribute
+            alias = classes.setdefault(prod_class, f"_{prod_class}")
+            return f"{alias}({', '.join(f'values[{i}]' for i in args_map)})"
+        raise Exception("Attribute Not Supported")
+
+    def _reductions_source(self) -> str:
+        '''
+        source of the reductions of the generated parser, one function per production, the ast classes are looked up
+        once when the parser is built, a custom attribute applier is called as is
+        '''
+        default_apply = getattr(self.attribute_apply, "__func__", None) is Grammar._attribute_apply
+        classes: Dict[str, str] = dict()
+        reductions = []
+        for prod in self.productions:
+            right = [s.name for s in prod.right_part if s != self.epsilon]
+            attribute = self.attribute_encode(prod.attribute)
+            if default_apply:
+                body = self._reduction_body(attribute, len(right), classes)
+            else:
+                body = f"_attribute_apply({attribute!r}, values, ast_types)"
+            comment = f"{prod.left_part} -> {' '.join(map(str, right))}".rstrip()
+            reductions.append(f"        lambda values: {body},  # {comment}")
+        lines = ["def _reductions(ast_types) -> tuple:  # by production index, called with the popped values"]
+        lines += [f"    {alias} = ast_types.{name}" for name, alias in classes.items()]
+        lines += ["    return (", *reductions, "    )"]
+        return "\n".join(lines)
+
+    def _augment(self) -> NonTerminal:
+        '''
+        adds S' -> S once even if many parsers are written, returns S
+        '''
+        if self._accepted is None:
+            self._accepted = self.initial_symbol
+            S0 = self.symbol_emit(f"{self.initial_symbol}'")
+            S0 > self.initial_symbol
+            self.initial_symbol = S0
+        return self._accepted
+
+    def _item_index(self) -> ItemIndex:
+        size = (len(self.terminals), len(self.non_terminals), len(self.productions))
+        if self._index is None or self._index.size != size:
+            self._index = ItemIndex(self)
+        return self._index
+
+    def _lr1_automaton(self) -> Automaton:
+        return self._item_sets(merge_cores=False)
+
+    def _lalr_automaton(self) -> Automaton:
+        return self._item_sets(merge_cores=True)
+
+    def _item_sets(self, merge_cores: bool) -> Automaton:
+        '''
+        lr(1) automaton keyed by the kernels of the states, with merge_cores the states with the same core (items
+        without lookaheads) are merged as they are found so there is one per lr(0) state (lalr(1)), the lookaheads of
+        the kernels are propagated through the gotos until nothing changes
+        '''
+        index = self._item_index()
+        key: Callable[[Dict[int, int]], frozenset] = frozenset if merge_cores else lambda k: frozenset(k.items())
+        initial = index.offsets[self.productions.index(next(iter(self.initial_symbol.associated_productions)))]
+        start_kernel = {initial: 1 << index.terminals.index(self.eof)}
+        start = key(start_kernel)
+        kernels: Dict[frozenset, Dict[int, int]] = {start: start_kernel}
+        closures: Dict[frozenset, Dict[int, int]] = dict()
+        gotos: Dict[frozenset, Dict[int, frozenset]] = dict()
+        pending = deque([start])
+        queued = {start}
+        while pending:
+            core = pending.popleft()
+            queued.discard(core)
+            closures[core] = closure = index.closure(kernels[core])
+            gotos[core] = core_gotos = dict()
+            for symbol, goto in index.gotos(closure).items():
+                target = core_gotos[symbol] = key(goto)
+                if (kernel := kernels.get(target)) is None:
+                    kernels[target] = goto
+                    grown = True
+                else:
+                    grown = False
+                    for item, lookaheads in goto.items():
+                        if lookaheads & ~kernel[item]:
+                            kernel[item] |= lookaheads
+                            grown = True
+                if grown and target not in queued:
+                    pending.append(target)
+                    queued.add(target)
+
+        dfa = Automaton()
+        states = {core: State(None, final=True, content=index.lr_items(closures[core])) for core in kernels}
+        dfa.add_state(*states.values())  # start first
+        for core, core_gotos in gotos.items():
+            for symbol, target in core_gotos.items():
+                states[core][index.symbols[symbol]] = states[target]
+        return dfa
+
+    def _lr_table(self, dfa: Automaton, accepted: NonTerminal) -> LRtable:
         table = LRtable()
-        table.initial_symbol = self.initial_symbol.name
-
-        # Augment Grammar Always
-        S0 = self.symbol_emit(f"{self.initial_symbol}'")
-        S0 > self.initial_symbol
-        self.initial_symbol = S0
-
-        transition_symbol_resolver: Callable[[LRitem], Any] = \
-            lambda subset: sorted(set(ns for x in subset if (ns := x.peek_nxt_symbol()) is not None), key=hash)
-
-        state_maker: Callable[[Any], int | Any] = lambda subset: State(None, final=True, content=subset)
-        goto_func = self._get_lr1_goto
-        closure_func = self._get_lr1_closure
-        initial_value = [LRitem(next(iter(self.initial_symbol.associated_productions)), lookaheads=[self.eof])]
-        dfa = Automaton.powerset_construct(initial_value, goto_func, closure_func, state_maker,
-                                           transition_symbol_resolver)
-
-        if path is None:
-            dfa.view()
-            return
-
+        table.initial_symbol = accepted.name
         table.initial_state = dfa.initial_state.name
+        table.productions = [ReduceInfo(prod.left_part.name, [s.name for s in prod.right_part if s != self.epsilon],
+                                        self.attribute_encode(prod.attribute)) for prod in self.productions]
+        prod_ids = {id(prod): k for k, prod in enumerate(self.productions)}
         for state in dfa.states:
             state_content: Iterable[LRitem] = state.content
             for item in state_content:
                 if item.is_reduce:
                     prod = item.production
                     if prod.left_part == self.initial_symbol:
-                        table.action((state.name, self.eof.name), (LRtable.Action.ACCEPT, 0))
+                        entries = [(self.eof, (LRtable.Action.ACCEPT, 0))]
                     else:
-                        for symbol in item.lookaheads:
-                            symbol: Symbol
-                            attribute = self.attribute_encode(prod.attribute)
-                            right_part_dbg = [s.name for s in prod.right_part if s != self.epsilon]
-                            reduce_info = ReduceInfo(prod.left_part.name, right_part_dbg, attribute)
-                            table.action((state.name, symbol.name), (LRtable.Action.REDUCE, reduce_info))
+                        entries = [(symbol, (LRtable.Action.REDUCE, prod_ids[id(prod)])) for symbol in item.lookaheads]
                 else:
                     symbol = item.peek_nxt_symbol()
-                    if isinstance(symbol, Terminal):
-                        table.action((state.name, symbol.name), (LRtable.Action.SHIFT, state[symbol.name].name))
-                    else:
+                    if not isinstance(symbol, Terminal):
                         table.goto((state.name, symbol.name), state[symbol.name].name)
+                        continue
+                    entries = [(symbol, (LRtable.Action.SHIFT, state[symbol.name].name))]
+                for symbol, entry in entries:
+                    try:
+                        table.action((state.name, symbol.name), entry)
+                    except ValueError as conflict:
+                        raise ValueError(f"{conflict} on {symbol} in state {state.name}: {state_content}") from None
+        return table
+
+    def lr_states_count(self) -> Dict[str, int]:
+        '''
+        states of the canonical lr(1) and of the lalr(1) automatons of the grammar
+        '''
+        self._augment()
+        res = dict(lr1=len(self._lr1_automaton().states), lalr=len(self._lalr_automaton().states))
+        return res
+
+    def write_lr1_parser(self, path: [str | None] = None, lalr=False) -> None:
+        """
+        Generates an LR1 Shif-Reduce Parser for the Gramamr using attribute coder and attribute applier supplied or def
+        If no arg is provided visualizes the dfa
+        With lalr the states with the same core are merged (LALR(1)), much smaller tables for the same grammar but
+        merging may introduce reduce-reduce conflicts, those are told apart from the ones of a non LR(1) grammar
+        """
+        accepted = self._augment()
+        dfa = self._lalr_automaton() if lalr else self._lr1_automaton()
+
+        if path is None:
+            dfa.view()
+            return
 
-        print(f"Automaton States Count:{len(dfa.states)}")
+        try:
+            table = self._lr_table(dfa, accepted)
+        except ValueError as conflict:
+            if lalr:
+                try:
+                    self._lr_table(self._lr1_automaton(), accepted)
+                except ValueError:
+                    raise conflict from None
+                raise ValueError(f"{conflict} introduced by the LALR(1) merge, the grammar is LR(1)") from None
+            raise
+
+        print(f"Automaton States Count:{len(dfa.states)}" + (" (LALR(1))" if lalr else ""))
         print(f"Actions:{len(table._action)} Gotos:{len(table._goto)}")
+        table.pack()
 
-        serial_str = table.get_serial_str()
         parser_file = inspect.getfile(ReduceInfo)
         scaffold_cnt = open(parser_file).read()
         attrib_src = inspect.getsource(self.attribute_apply)
         unindented = inspect.cleandoc(attrib_src).replace("\n", "\n" + " " * 4)
-        code = scaffold_cnt.replace("def _attribute_apply(attribute, popped_syms, info): pass", unindented)
+        code = scaffold_cnt.replace("def _attribute_apply(attribute, values, info): pass", unindented)
+        code = code.replace("def _reductions(ast_types): pass", self._reductions_source())
         code = code.replace("_attribute_apply", self.attribute_apply.__name__)
-        parser_content = code.replace("REPLACE-ME-PARSER", serial_str)
+        parser_content = code.replace('"""REPLACE-ME-PARSER"""', table.get_literal())
         out_path = os.path.join(path, "parser.py")
         newp = open(out_path, "w")
         newp.write(parser_content)
@@ -1,37 +1,50 @@
-import base64
-import io
-import lzma
-import pickle
 from collections import namedtuple
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable
 
 
 class TOKEN_TYPE(Enum):
     pass
 
 
+def _literal(value) -> str:
+    '''
+    python source of a table value, the members of the tokens enum are written as attributes of TOKEN_TYPE
+    '''
+    if isinstance(value, Enum):
+        return f"TOKEN_TYPE.{value.name}"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(map(_literal, value)) + "]"
+    if isinstance(value, tuple):
+        items = ", ".join(map(_literal, value))
+        if hasattr(value, "_fields"):  # namedtuple
+            return f"{type(value).__name__}({items})"
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
 class Serializable:
-    class Finder(pickle.Unpickler):
-        def find_class(self, __module_name: str, __global_name: str):
-            return super().find_class(__name__, __global_name)
-
-    def get_serial_str(self) -> str:
-        compressor = lzma.LZMACompressor()
-        serial = pickle.dumps(self, fix_imports=True)
-        serial = compressor.compress(serial)
-        serial += compressor.flush()
-        serial = base64.b85encode(serial).decode("ascii")
-        return serial
+    '''
+    tables are written in the generated modules as python literals, compiled with the module and built once per
+    process for each tokens enum without decoding or unpickling
+    '''
 
-    @staticmethod
-    def deserialize(serial):
-        decompressor = lzma.LZMADecompressor()
-        serial = base64.b85decode(serial)
-        serial = decompressor.decompress(serial)
-        pickler = Serializable.Finder(io.BytesIO(serial))
-        table = pickler.load()
+    def _state(self) -> dict:
+        return vars(self)
+
+    def _restore(self, state: dict):
+        self.__dict__.update(state)
+
+    def get_literal(self) -> str:
+        return f"{type(self).__name__}.from_literal({_literal(self._state())})"
+
+    @classmethod
+    def from_literal(cls, state: dict):
+        table = cls.__new__(cls)
+        table._restore(state)
         return table
 
 
@@ -44,8 +57,19 @@ class LRtable(Serializable):
     def __init__(self):
         self.initial_symbol = None
         self.initial_state = None
-        self._action: Dict[(Any, str), (LRtable.Action, Any)] = dict()
-        self._goto: Dict[(Any, str), Any] = dict()
+        self._action: Dict[(Any, str), (LRtable.Action, Any)] | None = dict()
+        self._goto: Dict[(Any, str), Any] | None = dict()
+        self.productions: List[ReduceInfo] = []  # reduce actions hold indexes of this list
+        # packed tables, see pack
+        self.terminals: Dict[Any, int] = dict()
+        self.non_terminals: Dict[Any, int] = dict()
+        self.lhs: List[int] = []
+        self.rhs_len: List[int] = []
+        self.action_base: List[int] = []
+        self.action_check: List[int] = []
+        self.action_value: List[int] = []
+        self.goto_base: List[int] = []
+        self.goto_value: List[int] = []
 
     def action(self, key: (Any, str), new_value=None):
         if new_value is None:
@@ -59,9 +83,71 @@ class LRtable(Serializable):
             return self._goto[key]
         self._goto[key] = value
 
+    def pack(self):
+        '''
+        numbers the states (the initial one is 0), terminals and non terminals and row compresses both tables into
+        comb vectors, the entry of symbol k in state s is value[base[s] + k] when check[base[s] + k] == s
+        actions are encoded as ints, shift to s is s + 1, reduce of production p is -p - 1 and accept is 0
+        '''
+        states = {self.initial_state: 0}
+        for (state, symbol), (action, content) in self._action.items():
+            states.setdefault(state, len(states))
+            self.terminals.setdefault(symbol, len(self.terminals))
+            if action == LRtable.Action.SHIFT:
+                states.setdefault(content, len(states))
+        for (state, symbol), target in self._goto.items():
+            states.setdefault(state, len(states))
+            states.setdefault(target, len(states))
+            self.non_terminals.setdefault(symbol, len(self.non_terminals))
+        self.lhs = [self.non_terminals.setdefault(prod.prod_left, len(self.non_terminals)) for prod in self.productions]
+        self.rhs_len = [len(prod.prod_right) for prod in self.productions]
+
+        actions = [dict() for _ in states]
+        for (state, symbol), (action, content) in self._action.items():
+            if action == LRtable.Action.SHIFT:
+                code = states[content] + 1
+            elif action == LRtable.Action.REDUCE:
+                code = -content - 1
+            else:
+                code = 0
+            actions[states[state]][self.terminals[symbol]] = code
+        gotos = [dict() for _ in states]
+        for (state, symbol), target in self._goto.items():
+            gotos[states[state]][self.non_terminals[symbol]] = states[target]
+
+        self.action_base, self.action_check, self.action_value = self._comb(actions, len(self.terminals))
+        self.goto_base, _, self.goto_value = self._comb(gotos, len(self.non_terminals))  # gotos are never missing
+        self.initial_state = 0
+        self._action = self._goto = None
+
+    @staticmethod
+    def _comb(rows: List[Dict[int, int]], width: int) -> tuple[List[int], List[int], List[int]]:
+        '''
+        first fit of the rows, densest first, into one vector, padded so base + k is always a valid index
+        '''
+        base = [0] * len(rows)
+        check: List[int] = []
+        value: List[int] = []
+        free = 0  # every position before is taken
+        for row_id in sorted(range(len(rows)), key=lambda r: -len(rows[r])):
+            row = rows[row_id]
+            while free < len(check) and check[free] != -1:
+                free += 1
+            offset = free - min(row, default=0)
+            while any(offset + k < 0 or offset + k < len(check) and check[offset + k] != -1 for k in row):
+                offset += 1
+            base[row_id] = offset
+            if len(check) < offset + width:
+                check.extend([-1] * (offset + width - len(check)))
+                value.extend([0] * (offset + width - len(value)))
+            for k, code in row.items():
+                check[offset + k] = row_id
+                value[offset + k] = code
+        return base, check, value
+
     def expect(self, state):
-        act = map(lambda x: x[1], filter(lambda x: x[0] == state, self._action.keys()))
-        return set(act)
+        base = self.action_base[state]
+        return {symbol for symbol, k in self.terminals.items() if self.action_check[base + k] == state}
 
 
 ReduceInfo = namedtuple("ReduceInfo", ["prod_left", "prod_right", "attribute"])
@@ -97,51 +183,76 @@ class ParserSymbol:
         graph.unflatten().view(tempfile.mktemp(".gv"))
 
 
+def _table(TOKEN_TYPE) -> LRtable:  # the literal refers to the tokens enum by this name
+    return """REPLACE-ME-PARSER"""
+
+
+_tables: Dict[Any, LRtable] = dict()  # by tokens enum, shared by the parsers of the process
+
+
 class Parser:
     def __init__(self, ast_types, tokens_type=None):
         if tokens_type:
             globals()["TOKEN_TYPE"] = tokens_type
         self.attributes_info = ast_types
-        self.table: LRtable = LRtable.deserialize("""REPLACE-ME-PARSER""")
+        self.reductions: tuple = _reductions(ast_types)
+        if (table := _tables.get(TOKEN_TYPE, None)) is None:
+            table = _tables[TOKEN_TYPE] = _table(TOKEN_TYPE)
+        self.table: LRtable = table
 
-    def __call__(self, tokens: List[Any],view=False):
-        state_stack = [self.table.initial_state]
-        symbol_stack = []
-        cursor = 0
+    def __call__(self, tokens: Iterable[Any],view=False):
+        '''
+        parses keeping a stack of states and one of values (tokens and ast nodes), with view the parse tree is built
+        too and shown
+        '''
+        table = self.table
+        terminals, productions, lhs, rhs_len = table.terminals, table.productions, table.lhs, table.rhs_len
+        action_base, action_check, action_value = table.action_base, table.action_check, table.action_value
+        goto_base, goto_value = table.goto_base, table.goto_value
+        reductions = self.reductions
+        tokens = iter(tokens)  # pulled one at a time so a streaming lexer never holds the whole program
+        state = table.initial_state
+        state_stack = [state]
+        value_stack = []
+        tree_stack: List[ParserSymbol] | None = [] if view else None
+        curr_tok = next(tokens)
+        terminal = terminals.get(curr_tok.name, None)
         while True:
-            curr_tok = tokens[cursor]
-            curr_state = state_stack[-1]
-            action, content = self.table.action((curr_state, curr_tok))
-            match action:
-                case self.table.Action.SHIFT:
-                    state_stack.append(content)
-                    new_sym = ParserSymbol(curr_tok.name, curr_tok)
-                    symbol_stack.append(new_sym)
-                    cursor += 1
-                case self.table.Action.REDUCE:
-                    content: ReduceInfo
-                    popped_syms = []
-                    for symbol in list(reversed(content.prod_right)):
-                        popped_symbol = symbol_stack.pop()
-                        state_stack.pop()
-                        curr_state = state_stack[-1]
-                        assert symbol == popped_symbol  # this is useless because stack is always viable prefix but..
-                        popped_syms.append(popped_symbol)
-                    popped_syms = list(reversed(popped_syms))
-                    instance = _attribute_apply(content.attribute, popped_syms, self.attributes_info)
-                    new_sym = ParserSymbol(content.prod_left, instance, popped_syms)
-                    symbol_stack.append(new_sym)
-                    goto = self.table.goto((curr_state, content.prod_left))
-                    state_stack.append(goto)
-                case self.table.Action.ACCEPT:
-                    last_symbol = symbol_stack.pop()
-                    assert last_symbol == self.table.initial_symbol  # just for fun :(
-                    if view:
-                        last_symbol.view()
-                    return last_symbol.content
-                case _:
-                    expected = self.table.expect(curr_state)
-                    raise ValueError(f"Invalid Syntax Unexpected Token {curr_tok}, Expected: {expected}")
-
-
-def _attribute_apply(attribute, popped_syms, info): pass
+            if terminal is None or action_check[(entry := action_base[state] + terminal)] != state:
+                expected = table.expect(state)
+                raise ValueError(f"Invalid Syntax Unexpected Token {curr_tok}, Expected: {expected}")
+            code = action_value[entry]
+            if code > 0:  # shift
+                state = code - 1
+                state_stack.append(state)
+                value_stack.append(curr_tok)
+                if view:
+                    tree_stack.append(ParserSymbol(curr_tok.name, curr_tok))
+                curr_tok = next(tokens)
+                terminal = terminals.get(curr_tok.name, None)
+            elif code < 0:  # reduce
+                prod = -code - 1
+                if size := rhs_len[prod]:
+                    values = value_stack[-size:]
+                    del value_stack[-size:]
+                    del state_stack[-size:]
+                else:
+                    values = []
+                instance = reductions[prod](values)
+                value_stack.append(instance)
+                if view:
+                    children = tree_stack[len(tree_stack) - size:]
+                    del tree_stack[len(tree_stack) - size:]
+                    tree_stack.append(ParserSymbol(productions[prod].prod_left, instance, children))
+                state = goto_value[goto_base[state_stack[-1]] + lhs[prod]]
+                state_stack.append(state)
+            else:  # accept
+                if view:
+                    tree_stack[-1].view()
+                return value_stack[-1]
+
+
+def _attribute_apply(attribute, values, info): pass
+
+
+def _reductions(ast_types): pass
@@ -1,3 +1,12 @@
-from .regx_engine import *
+from importlib import import_module
 
-RegxEngine = RegxEngine()
+
+# the engine and its shared instance are built on first use, frontends importing just the generated lexer and parser
+# modules (for their Token classes) do not pay for the whole regex toolchain
+def __getattr__(name):
+    global RegxEngine
+    engine = import_module(".regx_engine", __name__)
+    if name == "RegxEngine":
+        RegxEngine = engine.RegxEngine()
+        return RegxEngine
+    return getattr(engine, name)
@@ -1,6 +1,10 @@
 import os.path
+import sys
 
-import ast_regex as ast
+try:
+    from . import ast_regex as ast
+except ImportError:
+    import ast_regex as ast
 from toolchain.frontend_generator import Grammar
 
 rx = Grammar()
@@ -70,7 +74,7 @@ EscapedOrShorthandRx > esc + char_ / (ast.EscapedOrShorthand, (0,1)) \
 CharRx > char_ / (ast.Char, (0,)) \
 | p / (ast.Char, (0,))
 
-current_path = os.path.dirname(__file__)
-
-rx.write_lr1_parser(current_path)  # python 3.9
-rx.write_lexer(current_path)
+if __name__ == "__main__":  # python _regex_gen.py [--lalr]
+    current_path = os.path.dirname(__file__)
+    rx.write_lr1_parser(current_path, lalr="--lalr" in sys.argv)  # python 3.9
+    rx.write_lexer(current_path)
@@ -3,12 +3,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from itertools import chain
 
-from toolchain.automaton import Automaton, State
+from toolchain.automaton import Automaton, State, SymbolRange
 
 try:
     from .lexer import Token
+    from .pike_vm import Program, CHAR, SPLIT, JMP, SAVE
 except ImportError:
     from lexer import Token
+    from pike_vm import Program, CHAR, SPLIT, JMP, SAVE
 
 INVALID = {"", ""}
 RESERVED = set(iter(".*+?()[]{}^\\<>"))
@@ -36,8 +38,8 @@ def multi_transition_simple_automata(alpha):
     final = State(final=True)
     res.add_state(state)
     res.add_state(final)
-    for char in alpha:
-        state[char] = final
+    for symbol in SymbolRange.of(alpha):
+        state[symbol] = final
     return res
 
 
@@ -47,6 +49,12 @@ class Atom(ABC):
     def eval(self):
         pass
 
+    def emit(self, program: Program):
+        '''
+        appends the pike vm instructions of the node, the ones after them follow when it matches
+        '''
+        raise Exception(f"{self.__class__.__name__} is not a regex")
+
 
 @dataclass
 class UnaryAtom(Atom, ABC):
@@ -66,6 +74,14 @@ class Alternation(BinaryAtom):
         res = left | right
         return res
 
+    def emit(self, program: Program):
+        split = program.emit(SPLIT, len(program) + 1, None)
+        self.first.emit(program)
+        jump = program.emit(JMP, None)
+        program.patch(split, 2, len(program))
+        self.second.emit(program)
+        program.patch(jump, 1, len(program))
+
 
 class Concatenation(BinaryAtom):
     def eval(self) -> Automaton:
@@ -74,6 +90,10 @@ class Concatenation(BinaryAtom):
         res = left + right
         return res
 
+    def emit(self, program: Program):
+        self.first.emit(program)
+        self.second.emit(program)
+
 
 class KleeneStar(UnaryAtom):
     def eval(self) -> Automaton:
@@ -82,6 +102,12 @@ class KleeneStar(UnaryAtom):
         res = res.repeat()
         return res
 
+    def emit(self, program: Program):
+        split = program.emit(SPLIT, len(program) + 1, None)
+        self.first.emit(program)
+        program.emit(JMP, split)
+        program.patch(split, 2, len(program))
+
 
 class KleenePlus(UnaryAtom):
     def eval(self) -> Automaton:
@@ -92,6 +118,11 @@ class KleenePlus(UnaryAtom):
         res = res0.repeat()
         return res
 
+    def emit(self, program: Program):
+        start = len(program)
+        self.first.emit(program)
+        program.emit(SPLIT, start, len(program) + 1)
+
 
 class Maybe(UnaryAtom):
     def eval(self) -> Automaton:
@@ -99,12 +130,23 @@ class Maybe(UnaryAtom):
         res = first.lazy()
         return res
 
+    def emit(self, program: Program):
+        split = program.emit(SPLIT, len(program) + 1, None)
+        self.first.emit(program)
+        program.patch(split, 2, len(program))
+
 
 class Group(UnaryAtom):
     def eval(self) -> Automaton:
         res = self.first.eval()
         return res
 
+    def emit(self, program: Program):
+        group = program.new_group()
+        program.emit(SAVE, 2 * group)
+        self.first.emit(program)
+        program.emit(SAVE, 2 * group + 1)
+
 
 class NamedGroup(BinaryAtom):
     def eval(self) -> Automaton:
@@ -114,31 +156,51 @@ class NamedGroup(BinaryAtom):
             st.content = {name}
         return res
 
+    def emit(self, program: Program):
+        group = program.new_group(self.first.eval())
+        program.emit(SAVE, 2 * group)
+        self.second.emit(program)
+        program.emit(SAVE, 2 * group + 1)
+
+
+class CharAtom(Atom, ABC):
+    '''
+    atoms matching one char of a set
+    '''
+
+    @abstractmethod
+    def chars(self):
+        pass
 
-class PositiveSet(UnaryAtom):
     def eval(self) -> Automaton:
-        content = self.first.eval()
-        res = multi_transition_simple_automata(content)
+        res = multi_transition_simple_automata(self.chars())
         return res
 
+    def emit(self, program: Program):
+        program.emit(CHAR, frozenset(self.chars()))
 
-class NegativeSet(UnaryAtom):
-    def eval(self) -> Automaton:
+
+class PositiveSet(UnaryAtom, CharAtom):
+    def chars(self):
+        res = self.first.eval()
+        return res
+
+
+class NegativeSet(UnaryAtom, CharAtom):
+    def chars(self):
         content = self.first.eval()
-        alha = ALPHABET - content
-        res = multi_transition_simple_automata(alha)
+        res = ALPHABET - content
         return res
 
 
-class Char(UnaryAtom):
-    def eval(self) -> Automaton:
-        content = self.first.lexeme
-        res = multi_transition_simple_automata([content])
+class Char(UnaryAtom, CharAtom):
+    def chars(self):
+        res = [self.first.lexeme]
         return res
 
 
-class EscapedOrShorthand(BinaryAtom):
-    def eval(self) -> Automaton:
+class EscapedOrShorthand(BinaryAtom, CharAtom):
+    def chars(self):
         if self.first.lexeme == "." and self.second.lexeme == "." \
                 or self.first.lexeme =="\\" and self.second.lexeme != ".":
             content = self.second.lexeme
@@ -146,8 +208,7 @@ class EscapedOrShorthand(BinaryAtom):
         else:
             # special case escaped dot
             alpha = {self.second.lexeme}
-        res = multi_transition_simple_automata(alpha)
-        return res
+        return alpha
 
 
 ### Cst like entities for better performance and less headaches
@@ -1,35 +1,50 @@
-import base64
-import io
-import lzma
-import pickle
+import codecs
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from typing import Iterator
 
 class TOKEN_TYPE(Enum):
     pass
 
 
+def _literal(value) -> str:
+    '''
+    python source of a table value, the members of the tokens enum are written as attributes of TOKEN_TYPE
+    '''
+    if isinstance(value, Enum):
+        return f"TOKEN_TYPE.{value.name}"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(map(_literal, value)) + "]"
+    if isinstance(value, tuple):
+        items = ", ".join(map(_literal, value))
+        if hasattr(value, "_fields"):  # namedtuple
+            return f"{type(value).__name__}({items})"
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
 class Serializable:
-    class Finder(pickle.Unpickler):
-        def find_class(self, __module_name: str, __global_name: str):
-            return super().find_class(__name__, __global_name)
-
-    def get_serial_str(self) -> str:
-        compressor = lzma.LZMACompressor()
-        serial = pickle.dumps(self, fix_imports=True)
-        serial = compressor.compress(serial)
-        serial += compressor.flush()
-        serial = base64.b85encode(serial).decode("ascii")
-        return serial
-
-    @staticmethod
-    def deserialize(serial):
-        decompressor = lzma.LZMADecompressor()
-        serial = base64.b85decode(serial)
-        serial = decompressor.decompress(serial)
-        pickler = Serializable.Finder(io.BytesIO(serial))
-        table = pickler.load()
+    '''
+    tables are written in the generated modules as python literals, compiled with the module and built once per
+    process for each tokens enum without decoding or unpickling
+    '''
+
+    def _state(self) -> dict:
+        return vars(self)
+
+    def _restore(self, state: dict):
+        self.__dict__.update(state)
+
+    def get_literal(self) -> str:
+        return f"{type(self).__name__}.from_literal({_literal(self._state())})"
+
+    @classmethod
+    def from_literal(cls, state: dict):
+        table = cls.__new__(cls)
+        table._restore(state)
         return table
 
 
@@ -61,6 +76,37 @@ class MatchProvider(ABC):
     def match(self, mathcstr, pos) -> tuple[str, str, str]:
         pass
 
+    def match_partial(self, mathcstr, pos, final: bool) -> tuple[str, str, str] | None:
+        '''
+        match on a buffer that may continue, None if the token could go on after its end and more input is needed
+        providers that cant tell only match once the input is final
+        '''
+        return self.match(mathcstr, pos) if final else None
+
+
+# chars read at once by the streaming lexer
+CHUNK_SIZE = 1 << 16
+
+
+def _chunks(source, chunk_size: int) -> Iterator[str]:
+    '''
+    text pieces of a str, a text or binary file object or an mmap, bytes are decoded as utf-8
+    '''
+    if isinstance(source, str):
+        if source:
+            yield source
+        return
+    decoder = None
+    while chunk := source.read(chunk_size):
+        if not isinstance(chunk, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None and (tail := decoder.decode(b"", final=True)):
+        yield tail
+
 
 class LexerTable(list, Serializable):
     def __init__(self, eof, linebreaker, spacer):
@@ -69,12 +115,29 @@ class LexerTable(list, Serializable):
         self.line_breaker = linebreaker
         self.spacer = spacer
 
+    def _state(self) -> dict:
+        return dict(vars(self), rows=list(self))
+
+    def _restore(self, state: dict):
+        state = dict(state)
+        self.extend(state.pop("rows"))
+        self.__dict__.update(state)
+
+
+def _table(TOKEN_TYPE) -> LexerTable:  # the literal refers to the tokens enum by this name
+    return LexerTable.from_literal({'eof_symbol': '$', 'line_breaker': '\n', 'spacer': ' ', 'rows': [('alt', '|', None), ('star', '*', None), ('plus', '+', None), ('minus', '-', None), ('ask', '?', None), ('acc', '^', None), ('esc', '\\', None), ('dot', '.', None), ('o_par', '(', None), ('c_par', ')', None), ('o_bra', '[', None), ('c_bra', ']', None), ('gt', '>', None), ('lt', '<', None), ('p', 'P', None), ('char', '', None)]})
+
+
+_tables: dict = dict()  # by tokens enum, shared by the lexers of the process
+
 
 class Lexer:
     def __init__(self, match_provider: MatchProvider,tokens_type= None):
         if tokens_type:
             globals()["TOKEN_TYPE"] = tokens_type
-        self.table: LexerTable = LexerTable.deserialize("""{Wp48S^xk9=GL@E0stWa761SMbT8$j-~nU+;9USf0S<FXmZb#^v4NZ>be@vYabVR|_K9Ft`RM@&aM{L3v{P%Lr6>N6(KC~^TdHWGX*KY~N|8*Z@{FS~d2iD#(HqeuvADxO;WvTUDwQ>gPjnPfeHFMr@?Y4}z>%J1w+5Ca21xww#%AR&C+%#$j6xk2{CHNOa8v+0p3Y`bPcjqIfRsFRjI;TH#?Od76WfM4Rx`g(mC6a;16QN%t98**0bFN-wW6N%7f~HKw7&fF(>GIc-<9Sb2N&pKn=XI$=8}~Pi4piEJCPf_H5)eZ1@6$NY3=gLaw2B{kerY`@*eQf00H~~<pKZzYe7JMvBYQl0ssI200dcD""")
+        if (table := _tables.get(TOKEN_TYPE, None)) is None:
+            table = _tables[TOKEN_TYPE] = _table(TOKEN_TYPE)
+        self.table: LexerTable = table
         self.matcher: MatchProvider = match_provider
         for t in self.table:
             if t[0] != self.table.eof_symbol:
@@ -82,28 +145,42 @@ class Lexer:
         self.matcher.initialize()
 
     def __call__(self, input_str: str) -> [Token]:
-        tokens = []
+        return list(self.tokenize(input_str))
+
+    def tokenize(self, source, chunk_size: int = CHUNK_SIZE) -> Iterator[Token]:
+        '''
+        yields the tokens lazily reading the source in chunks, a token spanning two chunks is matched when the next
+        one arrives, source can be a str, a text or binary file object or an mmap
+        '''
+        chunks = _chunks(source, chunk_size)
+        buffer = ""
+        final = False
         line = column = 1
         pos = 0
-        input_len = len(input_str)
-        while pos < input_len:
-            current_char = input_str[pos]
-            if current_char == self.table.line_breaker:
-                line += 1
-                column = 0
-            if current_char == self.table.spacer:
-                column += 1
-            name, match, skip = self.matcher.match(input_str, pos)
-            if not match:
-                raise ValueError(f"Unexpected char '{current_char}' at line: {line} column: {column}")
-            current_token = Token(name, match, skip, line, column)
-            match_len = len(match)
-            pos += match_len
-            column += match_len
-            if not skip:
-                tokens.append(current_token)
-
-        eof_token = Token(self.table.eof_symbol, self.table.eof_symbol, "", line, column)
-        tokens.append(eof_token)
-
-        return tokens
+        while True:
+            if pos < len(buffer):
+                res = self.matcher.match_partial(buffer, pos, final)
+                if res is not None:
+                    current_char = buffer[pos]
+                    if current_char == self.table.line_breaker:
+                        line += 1
+                        column = 0
+                    if current_char == self.table.spacer:
+                        column += 1
+                    name, match, skip = res
+                    if not match:
+                        raise ValueError(f"Unexpected char '{current_char}' at line: {line} column: {column}")
+                    match_len = len(match)
+                    if not skip:
+                        yield Token(name, match, skip, line, column)
+                    pos += match_len
+                    column += match_len
+                    continue
+            elif final:
+                break
+            chunk = next(chunks, None)
+            final = chunk is None
+            buffer = buffer[pos:] + chunk if not final else buffer[pos:]
+            pos = 0
+
+        yield Token(self.table.eof_symbol, self.table.eof_symbol, "", line, column)
@@ -1,37 +1,50 @@
-import base64
-import io
-import lzma
-import pickle
 from collections import namedtuple
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable
 
 
 class TOKEN_TYPE(Enum):
     pass
 
 
+def _literal(value) -> str:
+    '''
+    python source of a table value, the members of the tokens enum are written as attributes of TOKEN_TYPE
+    '''
+    if isinstance(value, Enum):
+        return f"TOKEN_TYPE.{value.name}"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(map(_literal, value)) + "]"
+    if isinstance(value, tuple):
+        items = ", ".join(map(_literal, value))
+        if hasattr(value, "_fields"):  # namedtuple
+            return f"{type(value).__name__}({items})"
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
 class Serializable:
-    class Finder(pickle.Unpickler):
-        def find_class(self, __module_name: str, __global_name: str):
-            return super().find_class(__name__, __global_name)
-
-    def get_serial_str(self) -> str:
-        compressor = lzma.LZMACompressor()
-        serial = pickle.dumps(self, fix_imports=True)
-        serial = compressor.compress(serial)
-        serial += compressor.flush()
-        serial = base64.b85encode(serial).decode("ascii")
-        return serial
+    '''
+    tables are written in the generated modules as python literals, compiled with the module and built once per
+    process for each tokens enum without decoding or unpickling
+    '''
 
-    @staticmethod
-    def deserialize(serial):
-        decompressor = lzma.LZMADecompressor()
-        serial = base64.b85decode(serial)
-        serial = decompressor.decompress(serial)
-        pickler = Serializable.Finder(io.BytesIO(serial))
-        table = pickler.load()
+    def _state(self) -> dict:
+        return vars(self)
+
+    def _restore(self, state: dict):
+        self.__dict__.update(state)
+
+    def get_literal(self) -> str:
+        return f"{type(self).__name__}.from_literal({_literal(self._state())})"
+
+    @classmethod
+    def from_literal(cls, state: dict):
+        table = cls.__new__(cls)
+        table._restore(state)
         return table
 
 
@@ -44,8 +57,19 @@ class LRtable(Serializable):
     def __init__(self):
         self.initial_symbol = None
         self.initial_state = None
-        self._action: Dict[(Any, str), (LRtable.Action, Any)] = dict()
-        self._goto: Dict[(Any, str), Any] = dict()
+        self._action: Dict[(Any, str), (LRtable.Action, Any)] | None = dict()
+        self._goto: Dict[(Any, str), Any] | None = dict()
+        self.productions: List[ReduceInfo] = []  # reduce actions hold indexes of this list
+        # packed tables, see pack
+        self.terminals: Dict[Any, int] = dict()
+        self.non_terminals: Dict[Any, int] = dict()
+        self.lhs: List[int] = []
+        self.rhs_len: List[int] = []
+        self.action_base: List[int] = []
+        self.action_check: List[int] = []
+        self.action_value: List[int] = []
+        self.goto_base: List[int] = []
+        self.goto_value: List[int] = []
 
     def action(self, key: (Any, str), new_value=None):
         if new_value is None:
@@ -59,9 +83,71 @@ class LRtable(Serializable):
             return self._goto[key]
         self._goto[key] = value
 
+    def pack(self):
+        '''
+        numbers the states (the initial one is 0), terminals and non terminals and row compresses both tables into
+        comb vectors, the entry of symbol k in state s is value[base[s] + k] when check[base[s] + k] == s
+        actions are encoded as ints, shift to s is s + 1, reduce of production p is -p - 1 and accept is 0
+        '''
+        states = {self.initial_state: 0}
+        for (state, symbol), (action, content) in self._action.items():
+            states.setdefault(state, len(states))
+            self.terminals.setdefault(symbol, len(self.terminals))
+            if action == LRtable.Action.SHIFT:
+                states.setdefault(content, len(states))
+        for (state, symbol), target in self._goto.items():
+            states.setdefault(state, len(states))
+            states.setdefault(target, len(states))
+            self.non_terminals.setdefault(symbol, len(self.non_terminals))
+        self.lhs = [self.non_terminals.setdefault(prod.prod_left, len(self.non_terminals)) for prod in self.productions]
+        self.rhs_len = [len(prod.prod_right) for prod in self.productions]
+
+        actions = [dict() for _ in states]
+        for (state, symbol), (action, content) in self._action.items():
+            if action == LRtable.Action.SHIFT:
+                code = states[content] + 1
+            elif action == LRtable.Action.REDUCE:
+                code = -content - 1
+            else:
+                code = 0
+            actions[states[state]][self.terminals[symbol]] = code
+        gotos = [dict() for _ in states]
+        for (state, symbol), target in self._goto.items():
+            gotos[states[state]][self.non_terminals[symbol]] = states[target]
+
+        self.action_base, self.action_check, self.action_value = self._comb(actions, len(self.terminals))
+        self.goto_base, _, self.goto_value = self._comb(gotos, len(self.non_terminals))  # gotos are never missing
+        self.initial_state = 0
+        self._action = self._goto = None
+
+    @staticmethod
+    def _comb(rows: List[Dict[int, int]], width: int) -> tuple[List[int], List[int], List[int]]:
+        '''
+        first fit of the rows, densest first, into one vector, padded so base + k is always a valid index
+        '''
+        base = [0] * len(rows)
+        check: List[int] = []
+        value: List[int] = []
+        free = 0  # every position before is taken
+        for row_id in sorted(range(len(rows)), key=lambda r: -len(rows[r])):
+            row = rows[row_id]
+            while free < len(check) and check[free] != -1:
+                free += 1
+            offset = free - min(row, default=0)
+            while any(offset + k < 0 or offset + k < len(check) and check[offset + k] != -1 for k in row):
+                offset += 1
+            base[row_id] = offset
+            if len(check) < offset + width:
+                check.extend([-1] * (offset + width - len(check)))
+                value.extend([0] * (offset + width - len(value)))
+            for k, code in row.items():
+                check[offset + k] = row_id
+                value[offset + k] = code
+        return base, check, value
+
     def expect(self, state):
-        act = map(lambda x: x[1], filter(lambda x: x[0] == state, self._action.keys()))
-        return set(act)
+        base = self.action_base[state]
+        return {symbol for symbol, k in self.terminals.items() if self.action_check[base + k] == state}
 
 
 ReduceInfo = namedtuple("ReduceInfo", ["prod_left", "prod_right", "attribute"])
@@ -97,72 +183,158 @@ class ParserSymbol:
         graph.unflatten().view(tempfile.mktemp(".gv"))
 
 
+def _table(TOKEN_TYPE) -> LRtable:  # the literal refers to the tokens enum by this name
+    return LRtable.from_literal({'initial_symbol': 'Regex', 'initial_state': 0, '_action': None, '_goto': None, 'productions': [ReduceInfo('ReservedSymbol', ['alt'], None), ReduceInfo('ReservedSymbol', ['star'], None), ReduceInfo('ReservedSymbol', ['plus'], None), ReduceInfo('ReservedSymbol', ['minus'], None), ReduceInfo('ReservedSymbol', ['ask'], None), ReduceInfo('ReservedSymbol', ['acc'], None), ReduceInfo('ReservedSymbol', ['esc'], None), ReduceInfo('ReservedSymbol', ['dot'], None), ReduceInfo('ReservedSymbol', ['o_par'], None), ReduceInfo('ReservedSymbol', ['c_par'], None), ReduceInfo('ReservedSymbol', ['o_bra'], None), ReduceInfo('ReservedSymbol', ['c_bra'], None), ReduceInfo('ReservedSymbol', ['gt'], None), ReduceInfo('ReservedSymbol', ['lt'], None), ReduceInfo('Regex', ['Regex', 'alt', 'ConcatenationRx'], ('Alternation', (0, 2))), ReduceInfo('Regex', ['ConcatenationRx'], None), ReduceInfo('ConcatenationRx', ['ConcatenationRx', 'ClosureRx'], ('Concatenation', (0, 1))), ReduceInfo('ConcatenationRx', ['ClosureRx'], None), ReduceInfo('ClosureRx', ['AtomRx', 'star'], ('KleeneStar', (0,))), ReduceInfo('ClosureRx', ['AtomRx', 'plus'], ('KleenePlus', (0,))), ReduceInfo('ClosureRx', ['AtomRx', 'ask'], ('Maybe', (0,))), ReduceInfo('ClosureRx', ['AtomRx'], None), ReduceInfo('AtomRx', ['GroupRx'], None), ReduceInfo('AtomRx', ['PositiveSetRx'], None), ReduceInfo('AtomRx', ['NegativeSetRx'], None), ReduceInfo('AtomRx', ['EscapedOrShorthandRx'], None), ReduceInfo('AtomRx', ['CharRx'], None), ReduceInfo('GroupRx', ['o_par', 'Regex', 'c_par'], ('Group', (1,))), ReduceInfo('GroupRx', ['o_par', 'ask', 'p', 'lt', 'NameRx', 'gt', 'Regex', 'c_par'], ('NamedGroup', (4, 6))), ReduceInfo('NameRx', ['char', 'NameRx'], ('MultiCharName', (0, 1))), ReduceInfo('NameRx', ['char'], ('SingleCharName', (0,))), ReduceInfo('PositiveSetRx', ['o_bra', 'SetItemsRx', 'c_bra'], ('PositiveSet', (1,))), ReduceInfo('NegativeSetRx', ['o_bra', 'acc', 'SetItemsRx', 'c_bra'], ('NegativeSet', (2,))), ReduceInfo('SetItemsRx', ['SetItemsRx', 'SetItemRx'], ('MixedRange', (0, 1))), ReduceInfo('SetItemsRx', ['SetItemRx'], ('MixedRange', (0, 0))), ReduceInfo('SetItemRx', ['char', 'minus', 'char'], ('Range', (0, 2))), ReduceInfo('SetItemRx', ['EscapedOrShorthandRx'], None), ReduceInfo('SetItemRx', ['char'], None), ReduceInfo('EscapedOrShorthandRx', ['esc', 'char'], ('EscapedOrShorthand', (0, 1))), ReduceInfo('EscapedOrShorthandRx', ['esc', 'ReservedSymbol'], ('EscapedOrShorthand', (0, 1))), ReduceInfo('EscapedOrShorthandRx', ['dot'], ('EscapedOrShorthand', (0, 0))), ReduceInfo('CharRx', ['char'], ('Char', (0,))), ReduceInfo('CharRx', ['p'], ('Char', (0,))), ReduceInfo("Regex'", ['Regex'], None)], 'terminals': {'o_par': 0, 'o_bra': 1, 'esc': 2, 'dot': 3, 'char': 4, 'p': 5, 'alt': 6, '$': 7, 'star': 8, 'plus': 9, 'ask': 10, 'minus': 11, 'acc': 12, 'c_par': 13, 'c_bra': 14, 'gt': 15, 'lt': 16}, 'non_terminals': {'Regex': 0, 'ConcatenationRx': 1, 'ClosureRx': 2, 'AtomRx': 3, 'GroupRx': 4, 'PositiveSetRx': 5, 'NegativeSetRx': 6, 'EscapedOrShorthandRx': 7, 'CharRx': 8, 'ReservedSymbol': 9, 'SetItemsRx': 10, 'SetItemRx': 11, 'NameRx': 12, "Regex'": 13}, 'lhs': [9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 0, 0, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 12, 12, 5, 6, 10, 10, 11, 11, 11, 7, 7, 7, 8, 8, 13], 'rhs_len': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 2, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 3, 8, 2, 1, 3, 4, 2, 1, 3, 1, 1, 2, 2, 1, 1, 1, 1], 'action_base': [831, 923, 943, 0, 51, 62, 73, 320, 845, 776, 784, 84, 792, 800, 808, 95, 106, 117, 128, 139, 150, 161, 172, 183, 194, 205, 216, 227, 238, 249, 260, 271, 282, 293, 304, 907, 938, 17, 954, 934, 0, 957, 34, 315, 329, 343, 816, 357, 960, 368, 963, 3, 968, 976, 981, 984, 989, 997, 1002, 1005, 1010, 1018, 1023, 1026, 1031, 1039, 1044, 1047, 937, 859, 379, 6, 824, 838, 390, 852, 866, 880, 404, 418, 432, 446, 460, 474, 488, 502, 516, 530, 544, 558, 572, 586, 600, 614, 628, 642, 656, 670, 910, 19, 894, 1052, 684, 1060, 1065, 1068, 35, 902, 695, 1073, 709, 983, 723, 25, 916, 1074, 1081, 737, 318, 321, 873, 325, 326, 887, 1004, 751, 1025, 762], 'action_check': [3, 3, 3, 3, 3, 40, 3, 51, 3, 3, 3, 3, 3, 3, 3, 3, 3, 37, 37, 37, 37, 37, 71, 37, 99, 37, 37, 37, 37, 37, 37, 37, 37, 37, 42, 42, 42, 42, 42, 106, 42, 113, 42, 42, 42, 42, 42, 42, 42, 42, 42, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 43, 43, 43, 43, 43, 43, 43, 118, 43, 43, 43, 7, 7, 43, 44, 44, 44, 44, 44, 44, 44, 119, 44, 44, 44, 121, 122, 44, 45, 45, 45, 45, 45, 45, 45, -1, 45, 45, 45, -1, -1, 45, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 74, 74, 74, 74, 74, 74, 74, -1, 74, 74, 74, -1, -1, 74, 78, 78, 78, 78, 78, 78, 78, -1, 78, 78, 78, -1, -1, 78, 79, 79, 79, 79, 79, 79, 79, -1, 79, 79, 79, -1, -1, 79, 80, 80, 80, 80, 80, 80, 80, -1, 80, 80, 80, -1, -1, 80, 81, 81, 81, 81, 81, 81, 81, -1, 81, 81, 81, -1, -1, 81, 82, 82, 82, 82, 82, 82, 82, -1, 82, 82, 82, -1, -1, 82, 83, 83, 83, 83, 83, 83, 83, -1, 83, 83, 83, -1, -1, 83, 84, 84, 84, 84, 84, 84, 84, -1, 84, 84, 84, -1, -1, 84, 85, 85, 85, 85, 85, 85, 85, -1, 85, 85, 85, -1, -1, 85, 86, 86, 86, 86, 86, 86, 86, -1, 86, 86, 86, -1, -1, 86, 87, 87, 87, 87, 87, 87, 87, -1, 87, 87, 87, -1, -1, 87, 88, 88, 88, 88, 88, 88, 88, -1, 88, 88, 88, -1, -1, 88, 89, 89, 89, 89, 89, 89, 89, -1, 89, 89, 89, -1, -1, 89, 90, 90, 90, 90, 90, 90, 90, -1, 90, 90, 90, -1, -1, 90, 91, 91, 91, 91, 91, 91, 91, -1, 91, 91, 91, -1, -1, 91, 92, 92, 92, 92, 92, 92, 92, -1, 92, 92, 92, -1, -1, 92, 93, 93, 93, 93, 93, 93, 93, -1, 93, 93, 93, -1, -1, 93, 94, 94, 94, 94, 94, 94, 94, -1, 94, 94, 94, -1, -1, 94, 95, 95, 95, 95, 95, 95, 95, -1, 95, 95, 95, -1, -1, 95, 96, 96, 96, 96, 96, 96, 96, -1, 96, 96, 96, -1, -1, 96, 97, 97, 97, 97, 97, 97, 97, -1, 97, 97, 97, -1, -1, 97, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 108, 108, 108, 108, 108, 108, 108, -1, 108, 108, 108, -1, -1, 108, 110, 110, 110, 110, 110, 110, 110, -1, 110, 110, 110, -1, -1, 110, 112, 112, 112, 112, 112, 112, 112, -1, 112, 112, 112, -1, -1, 112, 117, 117, 117, 117, 117, 117, 117, -1, 117, 117, 117, -1, -1, 117, 125, 125, 125, 125, 125, 125, 125, 125, 125, 125, 125, 127, 127, 127, 127, 127, 127, 127, -1, 127, 127, 127, -1, -1, 127, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 12, 12, 12, 12, 12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 46, 46, 46, 46, 46, 46, 46, 46, 72, 72, 72, 72, 72, 72, 72, 0, 0, 0, 0, 0, 0, 72, 73, 73, 73, 73, 73, 73, 73, 8, 8, 8, 8, 8, 8, 73, 75, 75, 75, 75, 75, 75, 75, 69, 69, 69, 69, 69, 69, 75, 76, 76, 76, 76, 76, 76, 76, 120, 120, 120, 120, 120, 120, 76, 77, 77, 77, 77, 77, 77, 77, 123, 123, 123, 123, 123, 123, 77, 100, 100, 100, 100, 100, 100, 100, 100, 107, 107, 107, 107, 107, 107, 107, 35, 35, 35, 98, 98, 98, 107, 114, 114, 114, 114, 114, 114, 114, 1, 1, 1, 1, 1, 1, 114, -1, -1, -1, 1, 39, 39, 39, 39, 39, 39, 36, 36, 36, 68, 39, 2, 2, 2, -1, 36, 68, -1, 36, -1, -1, 2, 38, 38, 38, 41, 41, 41, 48, 48, 48, 50, 50, 50, 38, 41, 52, 52, 52, -1, 48, -1, -1, 50, 53, 53, 53, -1, 52, 54, 54, 54, 55, 55, 55, 111, 53, 56, 56, 56, -1, 54, 111, -1, 55, 57, 57, 57, -1, 56, 58, 58, 58, 59, 59, 59, 124, 57, 60, 60, 60, -1, 58, 124, -1, 59, 61, 61, 61, -1, 60, 62, 62, 62, 63, 63, 63, 126, 61, 64, 64, 64, -1, 62, 126, -1, 63, 65, 65, 65, -1, 64, 66, 66, 66, 67, 67, 67, -1, 65, 101, 101, 101, -1, 66, -1, -1, 67, 103, 103, 103, -1, 101, 104, 104, 104, 105, 105, 105, -1, 103, 109, 109, 109, 115, 104, -1, -1, 105, 116, 116, 116, -1, 109, -1, 115, -1, -1, -1, -1, -1, 116, -1, -1], 'action_value': [29, 31, 27, 28, 35, 72, 21, 105, 22, 23, 25, 24, 26, 30, 32, 33, 34, 62, 64, 60, 61, 68, 107, 54, 114, 55, 56, 58, 57, 59, 63, 65, 66, 67, 92, 94, 90, 91, 98, 116, 84, 119, 85, 86, 88, 87, 89, 93, 95, 96, 97, -41, -41, -41, -41, -41, -41, -41, -41, -41, -41, -41, -42, -42, -42, -42, -42, -42, -42, -42, -42, -42, -42, -43, -43, -43, -43, -43, -43, -43, -43, -43, -43, -43, -22, -22, -22, -22, -22, -22, -22, -22, 13, 14, 15, -23, -23, -23, -23, -23, -23, -23, -23, -23, -23, -23, -24, -24, -24, -24, -24, -24, -24, -24, -24, -24, -24, -25, -25, -25, -25, -25, -25, -25, -25, -25, -25, -25, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -27, -27, -27, -27, -27, -27, -27, -27, -27, -27, -27, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -2, -2, -2, -2, -2, -2, -2, -2, -2, -2, -2, -3, -3, -3, -3, -3, -3, -3, -3, -3, -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -6, -6, -6, -6, -6, -6, -6, -6, -6, -6, -6, -7, -7, -7, -7, -7, -7, -7, -7, -7, -7, -7, -8, -8, -8, -8, -8, -8, -8, -8, -8, -8, -8, -9, -9, -9, -9, -9, -9, -9, -9, -9, -9, -9, -10, -10, -10, -10, -10, -10, -10, -10, -10, -10, -10, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -11, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -12, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -13, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -14, -39, -39, -39, -39, -39, -39, -39, -39, -39, -39, -39, -41, -41, -41, -41, -41, -41, -41, 116, -41, -41, -41, 9, 0, -41, -42, -42, -42, -42, -42, -42, -42, 121, -42, -42, -42, -30, 124, -42, -43, -43, -43, -43, -43, -43, -43, 0, -43, -43, -43, 0, 0, -43, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -28, -28, -28, -28, -28, -28, -28, -28, -28, -28, -28, -22, -22, -22, -22, -22, -22, -22, 0, 76, 77, 78, 0, 0, -22, -23, -23, -23, -23, -23, -23, -23, 0, -23, -23, -23, 0, 0, -23, -24, -24, -24, -24, -24, -24, -24, 0, -24, -24, -24, 0, 0, -24, -25, -25, -25, -25, -25, -25, -25, 0, -25, -25, -25, 0, 0, -25, -26, -26, -26, -26, -26, -26, -26, 0, -26, -26, -26, 0, 0, -26, -27, -27, -27, -27, -27, -27, -27, 0, -27, -27, -27, 0, 0, -27, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, 0, 0, -1, -2, -2, -2, -2, -2, -2, -2, 0, -2, -2, -2, 0, 0, -2, -3, -3, -3, -3, -3, -3, -3, 0, -3, -3, -3, 0, 0, -3, -4, -4, -4, -4, -4, -4, -4, 0, -4, -4, -4, 0, 0, -4, -5, -5, -5, -5, -5, -5, -5, 0, -5, -5, -5, 0, 0, -5, -6, -6, -6, -6, -6, -6, -6, 0, -6, -6, -6, 0, 0, -6, -7, -7, -7, -7, -7, -7, -7, 0, -7, -7, -7, 0, 0, -7, -8, -8, -8, -8, -8, -8, -8, 0, -8, -8, -8, 0, 0, -8, -9, -9, -9, -9, -9, -9, -9, 0, -9, -9, -9, 0, 0, -9, -10, -10, -10, -10, -10, -10, -10, 0, -10, -10, -10, 0, 0, -10, -11, -11, -11, -11, -11, -11, -11, 0, -11, -11, -11, 0, 0, -11, -12, -12, -12, -12, -12, -12, -12, 0, -12, -12, -12, 0, 0, -12, -13, -13, -13, -13, -13, -13, -13, 0, -13, -13, -13, 0, 0, -13, -14, -14, -14, -14, -14, -14, -14, 0, -14, -14, -14, 0, 0, -14, -39, -39, -39, -39, -39, -39, -39, 0, -39, -39, -39, 0, 0, -39, -33, -33, -33, -33, -33, -33, -33, -33, -33, -33, -33, -40, -40, -40, -40, -40, -40, -40, 0, -40, -40, -40, 0, 0, -40, -32, -32, -32, -32, -32, -32, -32, 0, -32, -32, -32, 0, 0, -32, -28, -28, -28, -28, -28, -28, -28, 0, -28, -28, -28, 0, 0, -28, -33, -33, -33, -33, -33, -33, -33, 0, -33, -33, -33, 0, 0, -33, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, -29, 0, -29, -29, -29, 0, 0, -29, 2, 3, 4, 5, 6, 7, -16, -16, -18, -18, -18, -18, -18, -18, -18, -18, -19, -19, -19, -19, -19, -19, -19, -19, -20, -20, -20, -20, -20, -20, -20, -20, -21, -21, -21, -21, -21, -21, -21, -21, -17, -17, -17, -17, -17, -17, -17, -17, 40, 42, 43, 44, 45, 46, -16, 2, 3, 4, 5, 6, 7, -16, -18, -18, -18, -18, -18, -18, -18, 2, 3, 4, 5, 6, 7, -18, -19, -19, -19, -19, -19, -19, -19, 40, 42, 43, 44, 45, 46, -19, -20, -20, -20, -20, -20, -20, -20, 40, 42, 43, 44, 45, 46, -20, -21, -21, -21, -21, -21, -21, -21, 40, 42, 43, 44, 45, 46, -21, 2, 3, 4, 5, 6, 7, -15, -15, -17, -17, -17, -17, -17, -17, -17, 38, 39, 37, 38, 39, 37, -17, 40, 42, 43, 44, 45, 46, -15, 40, 42, 43, 44, 45, 46, -15, 0, 0, 0, 41, 40, 42, 43, 44, 45, 46, -38, -38, -38, 70, 100, 38, 39, 37, 0, 52, 71, 0, -38, 0, 0, 36, -41, -41, -41, 38, 39, 37, 38, 39, 37, -35, -35, -35, -41, 99, -37, -37, -37, 0, 50, 0, 0, -35, -1, -1, -1, 0, -37, -2, -2, -2, -3, -3, -3, 70, -1, -4, -4, -4, 0, -2, 113, 0, -3, -5, -5, -5, 0, -4, -6, -6, -6, -7, -7, -7, 70, -5, -8, -8, -8, 0, -6, 126, 0, -7, -9, -9, -9, 0, -8, -10, -10, -10, -11, -11, -11, 70, -9, -12, -12, -12, 0, -10, 128, 0, -11, -13, -13, -13, 0, -12, -14, -14, -14, -39, -39, -39, 0, -13, 38, 39, 37, 0, -14, 0, 0, -39, -34, -34, -34, 0, 103, -36, -36, -36, -40, -40, -40, 0, -34, 38, 39, 37, 116, -36, 0, 0, -40, 38, 39, 37, 0, 111, 0, -31, 0, 0, 0, 0, 0, 118, 0, 0], 'goto_base': [0, 9, 82, 81, 115, 115, 115, 115, 44, 59, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 84, 115, 88, 115, 18, 115, 89, 102, 115, 115, 115, 115, 115, 96, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 52, 115, 115, 66, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 91, 115, 73, 97, 115, 115, 115, 115, 100, 115, 115, 98, 115, 115, 115, 115, 80, 101, 99, 115, 102, 115, 27, 115, 115, 36, 115, 115, 115, 115], 'goto_value': [7, 9, 10, 11, 15, 16, 17, 18, 19, 68, 72, 73, 74, 78, 79, 80, 81, 82, 111, 72, 73, 74, 78, 79, 80, 81, 82, 124, 72, 73, 74, 78, 79, 80, 81, 82, 126, 72, 73, 74, 78, 79, 80, 81, 82, 100, 10, 11, 15, 16, 17, 18, 19, 114, 73, 74, 78, 79, 80, 81, 82, 46, 11, 15, 16, 17, 18, 19, 107, 74, 78, 79, 80, 81, 82, 46, 11, 15, 16, 17, 18, 19, 107, 74, 78, 79, 80, 81, 82, 52, 47, 52, 48, 50, 101, 50, 52, 105, 52, 109, 50, 116, 50, 52, 52, 52, 52, 103, 103, 103, 103, 108, 119, 121, 122, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]})
+
+
+_tables: Dict[Any, LRtable] = dict()  # by tokens enum, shared by the parsers of the process
+
+
 class Parser:
     def __init__(self, ast_types, tokens_type=None):
         if tokens_type:
             globals()["TOKEN_TYPE"] = tokens_type
         self.attributes_info = ast_types
-        self.table: LRtable = LRtable.deserialize("""{Wp48S^xk9=GL@E0stWa761SMbT8$j;C9vwe_a4T0S<b$LFOY6;li?xBVj951Cv$7#Xwol-75cUaA1~Ip#M4Jz#<n5x~6yksWV#T<Ono*lf)Ut0h=p+#@LGKM9#mg-DN0U*&xeckx*56FWpPi4ZaM>5ZfhXmYKKd3mbd)D)(coy=uP$nY!;jc-$y8V?Z_9y@Xn!IM#M(&PbXAeOfSe+ikgazje;bg{GD7ZX)f+`I7jF3K&b1bK?kw9?Me5qnZhh-525p*TQAAgEnL#4&CE^OkkQhMDZFO1#}%*Q9>#k=wQfsBYQ+U3A4HOkTHDp(!SzH)17qV-<u84O|mDfI`<6$7~<<7Es1Tp8M4>^XR>xSzi;nEbADkM0n|Y<ii9xicA<w0wzKIXGfoDGO5^h6FwPlGxydIVV4=mpBdc<(^W*aqcA8|PZG)x^{1~Icdo8`eoVP(W(Uf_v#3MM+RSjBT|4c$VcCGYmiTfs9#INOaZY|DeR@hk5Aj*!e@CAcrxpcHjkxm(YhWUz0L)h}ZJZ80Cxx|mH$}U+neAW8K*@6Wke4s&$=FpnCg-3GY4N#?AJ|VH$MaI4K)x`A>xG$7GNmD=y+&L`(&<6cCex!r=ta4NvI8&mXhCPJ9#R6%kUma1c!7sG}QBTVMZcL39uW$AUwi4ZVoOJDhVmo4FaEyEnkr~deDC}&ji(^<K@*>S$-B$i6B94fDO_K$i3AMr_ePH}HyA)G=o=he-kf5~z*kgmsUg3djI_=WWRsR}h-}pVPX&cDPu4qC!n~f>jRA7|j|Fbgc*T@4pg@uYMDWVxBWXbB<Oh5~Y=Lj)7{pYS<G(}?Y{(00ewD-kkn}~r)-Q(kru)-sslns$cK=u<IHL@!iy4n%r(u2C*lhT-$YgdEjcjJ!<OHut4`HmIVJ@2^T?Z8J&ybGxgC{Ja&Tc{SXMQBi?05M<nuFnXP-`vy=$DmJ(p^row#wt%uP(&ofb9ZuJZXAa~SS(^ZZNq;&8F$VEYeheRKWiFra-aIDN+EyO?sZsc)^qw2@pKAG?(t(J`X~t;uC3JAEkEB)P_!v@eDZ~u!hZ*{8%!mhNXc>#@Y3_g^yt;y0;l%_;^rO$;jRQaRR4INbsA+DM6aC;DlDy*s<$<KD>7NsKYhP7%q`H7Bm2iuyU#$Lz}(+#PNv4+kqRh4JEbDz<a#MEM-&((jMTIdDMG+6-+L(nH34I*=P1J3A>*4C;*(Kgg(*0HfHbanslE-NP#K>F{B2rXZNafI73Tm8CxC_?YPt^>F$@(6>_=RBC#Vv6V4%9~4^b$oLc;kOJ_sqTg6cFNSZj*Es4|jE(tQ703Hy9>t07?8DsQEy{(*j^C{o{>I`bj`K45aU_`G|`^?d;9&saNc1_9ssVY#p?pP(e%Bxa6U>46q!<B6(Dq(zE+fvudS$@<Fz(<{aNS^jtvK%U~jIn^oD8?~-(XWV%)8^Y5{!D2I8<G(Ae(xMh2-qVNxtPM&7{7GAQq7OX?c6*46+Sh{Ek8SQR0FwV^j%~lLO&{2W^z1ulpjXZ~Yq5Zj4=c*g)SIOv{PFsp>B6rt+Un#yXRE5_Z{*crRzAscC2^jE3H`ZHDuO_5!IbI~^5^9!Os`N@d@i+cb)O~(0<<#%amc)SB`(@bh+o@zZP(Hen8=0jExm-S(J@mn>9h9VE5aQtx-dj6A_<G{!SJY^YP?fB4l<9veaAojuRDd^{Yc1d4m1@*wq2mVQmq0$A@2<J<q>Nw85prUgf<8?%FlBV5J2kX=yXRvo!rtYzdly-B3_~<UT|UQm}^W#Z`4lN`)9W!#M}Fg6?itZHGcWMCxeW;YEe1X*lK?kd~_c?wvEAZs5TfycVI4p*d<to$ZJpYToqR5u$Dr`h?@hFGg;zSZD|zZVB1(#kKSN|O<<XDK6QWIC&^Xus<JZ%HwqyO9KuO^sRnW#U$^c1mUSqgxwfYrNF-LFx$}(S+tXa}gsNyK8D<0Wp|JE0W*Wxv2(&ZaBnEg7uy0>7SyxUH`8So-XFq<yj>QA7<q)j?aXfhIMVZ$I*HO|DNk5d>7q1sbOUKUKZOVjs9JGr8cQbhpmWRtMTi?hWe7PEuBuH#{i?(baIQ0qVa2NwaI~PB%B=1{o2W;<v;O;%MUf|2<i&^uexE<@ncTGB1#nPdHh4MSaCoVGRR5YoRci{m;^`X}Fp0a@Z@x<Ju>7&EjKz=v414O-UB-s2F`mX8KQt55SZffL21l7FWImRD;eFwqG4NCA<0(bZA=+C$SHr!fTeF+voz+t4xNU~nODFON!c1_DU+ie|+KW|AgkSLc1qX2~hN%nuxA_G_l;4M<N>ipRPR@kZLDBk~yHH}KLR8|?}=_{a4Gql2HJD6}16s!%TRO|5e$p(}cA;P*z|M$7pWcCj10#-^T6WdC{oMiMsAG<(svV?}?97A`LdtF1s&J6rGHV8oG6@#H+W$GOVx_;1vyPQSnu2BI^9o}`n_y^8a7kt2MY$>6rrve<fcm+q!K+<0r^Zzg5Y^-`3Aqk2!v$iblb-HgSYDl&;5eDO1cr39<B=UsXCzemwYlV0Jdz}4aUe{lVt9L!O1yT7a&8;)gZI&)rP5;u?v-Liu?D+0TtsqWUz^!TtZcdH4V6hK9u;q78`_in?Dd*SYaL<?oIx{*v?gi=Zhb@~n-LI;M?X9nQ&mx5nAj?q<QC>Qr(dwG_QWVkYXuP=EWP$v`*NQ8#y927>{xdK>QPUU)noM0#|22CxTit&)dvC;IfCMnHxTiN*z_%-v1O(tNe%!Hkk!6O07%EjwGL_)8ly+d$e971_JtX;q)wBIO(QztWh5?C}*4^zjjjf@gVo(P>@#FY4kmMrdAPly7fJdtl;LL$$lD|`kFz-h=vUXu+>q!1^WjO-J%2OCit5WAZXe`G#R9Y<=!tPfS4)bnu?xS!vQcy}eG{bZvvQw;Gnd25ZUO$t#a|wS|%U=xxd?S}**mfqC5g<M_DhGa1dh*QVdE*P<qL5o0HL7<S$gheul9QU<Y!9m-!80RL(;{9VTk{u4q2+nkJ8qnVE_z{iAq2pk{~Qx}_{Msm`9p#H;4D5!{EQLFGR>^ix<M<_KP8`mDXeHWmDcwqOv)w@OEy{!Kd$}<8HHQMpF}1`jY(CAF}Dva$q|V)Oa`5y$HpGaEfDJt(ox+~nL)F6LXb-BWcdCjam`sg+vz4CU1Zx&*M(&zZ5zuvW&hRi#;1IJurEE>+eSK0q3<f0>oEEuk<#*Mt7mX+>1fdyjgklTbLzL`@5F1Q_C_k6Y|NaY-agX+DE>K!938hw*kzASuoW%A!h*?9n_nxJq1Yj-F0dNS7o#9}uA_3kaJT)T7qvDCDLZn|vYdx<8b;YdrB0Fpxdap1fmCl*9$FUt-r{EytZfuIG9i>-rmx}FwpSRghkZC$)CS99pe<z$7?Ja~pW1)lxzLLg6rjmqZw(78DrboG6#4p=E41?uQ3p<zv*rkJE@scQQV77mKq<Cll1==PgF#-N#H|V;)i`GUgoTiMla84X{C#h!O+<50mQ7Ctmmv}urhp-(FdC0LC%g0i_1;wkFQM7fc9IOi6D>+CLuL7jThZv!;(!pEZcop$K(Dkav#b6`6S=<2$wp1*wDcjHL>%FExExw&ggXIfVIjS_b=ZNw`>YRC(J}BMPx-Lp^?sX{Zf&5cQfR7T@zpZQXBMH7HY;9}2*qALLNovX-Of9Sz<{L*)+-3>vm0AET{x$~4go#ph{~24DKiJte&)-d$l}m1F?M=E$wL9b)gzJNH1oCo<U1IeIa@Z})k%XSf0nLei5}xRIGyV@<WU<e<I&MSh2k<k@4Ngv>kT(4yXBqqRN0A@@89z>5X_tzwuxqczM9Bnj@gOy4k_Pr4Jh%av8n09M2UFetx}r}*F)+g+4?|L008(xpqEfOv<gkV7P53!m4L`3)TbKVY5mnv`!X|vKQkb8MU7N?$k>?6ZanrBG=!8pJ=-`aEq$JxkBUux$>D|ler}Pyc?bp~TN);SK@+V+@XS>pU!&hb#Ns(<b}B=fp_Xocd+1VA$2*6WT*-^TU;EnG8um*VRJ25SrZi#S1cgc@&x^{WCB8Lw?u-jtAmJ9zMU|uFyaSA;MEsx5EoqjBNB{r;+CEru8+M4Q00EmB*X;oSJT#`-vBYQl0ssI200dcD""")
+        self.reductions: tuple = _reductions(ast_types)
+        if (table := _tables.get(TOKEN_TYPE, None)) is None:
+            table = _tables[TOKEN_TYPE] = _table(TOKEN_TYPE)
+        self.table: LRtable = table
 
-    def __call__(self, tokens: List[Any],view=False):
-        state_stack = [self.table.initial_state]
-        symbol_stack = []
-        cursor = 0
+    def __call__(self, tokens: Iterable[Any],view=False):
+        '''
+        parses keeping a stack of states and one of values (tokens and ast nodes), with view the parse tree is built
+        too and shown
+        '''
+        table = self.table
+        terminals, productions, lhs, rhs_len = table.terminals, table.productions, table.lhs, table.rhs_len
+        action_base, action_check, action_value = table.action_base, table.action_check, table.action_value
+        goto_base, goto_value = table.goto_base, table.goto_value
+        reductions = self.reductions
+        tokens = iter(tokens)  # pulled one at a time so a streaming lexer never holds the whole program
+        state = table.initial_state
+        state_stack = [state]
+        value_stack = []
+        tree_stack: List[ParserSymbol] | None = [] if view else None
+        curr_tok = next(tokens)
+        terminal = terminals.get(curr_tok.name, None)
         while True:
-            curr_tok = tokens[cursor]
-            curr_state = state_stack[-1]
-            action, content = self.table.action((curr_state, curr_tok))
-            match action:
-                case self.table.Action.SHIFT:
-                    state_stack.append(content)
-                    new_sym = ParserSymbol(curr_tok.name, curr_tok)
-                    symbol_stack.append(new_sym)
-                    cursor += 1
-                case self.table.Action.REDUCE:
-                    content: ReduceInfo
-                    popped_syms = []
-                    for symbol in list(reversed(content.prod_right)):
-                        popped_symbol = symbol_stack.pop()
-                        state_stack.pop()
-                        curr_state = state_stack[-1]
-                        assert symbol == popped_symbol  # this is useless because stack is always viable prefix but..
-                        popped_syms.append(popped_symbol)
-                    popped_syms = list(reversed(popped_syms))
-                    instance = _attribute_apply(content.attribute, popped_syms, self.attributes_info)
-                    new_sym = ParserSymbol(content.prod_left, instance, popped_syms)
-                    symbol_stack.append(new_sym)
-                    goto = self.table.goto((curr_state, content.prod_left))
-                    state_stack.append(goto)
-                case self.table.Action.ACCEPT:
-                    last_symbol = symbol_stack.pop()
-                    assert last_symbol == self.table.initial_symbol  # just for fun :(
-                    if view:
-                        last_symbol.view()
-                    return last_symbol.content
-                case _:
-                    expected = self.table.expect(curr_state)
-                    raise ValueError(f"Invalid Syntax Unexpected Token {curr_tok}, Expected: {expected}")
-
-
-def _attribute_apply(attribute, popped_syms, info):
+            if terminal is None or action_check[(entry := action_base[state] + terminal)] != state:
+                expected = table.expect(state)
+                raise ValueError(f"Invalid Syntax Unexpected Token {curr_tok}, Expected: {expected}")
+            code = action_value[entry]
+            if code > 0:  # shift
+                state = code - 1
+                state_stack.append(state)
+                value_stack.append(curr_tok)
+                if view:
+                    tree_stack.append(ParserSymbol(curr_tok.name, curr_tok))
+                curr_tok = next(tokens)
+                terminal = terminals.get(curr_tok.name, None)
+            elif code < 0:  # reduce
+                prod = -code - 1
+                if size := rhs_len[prod]:
+                    values = value_stack[-size:]
+                    del value_stack[-size:]
+                    del state_stack[-size:]
+                else:
+                    values = []
+                instance = reductions[prod](values)
+                value_stack.append(instance)
+                if view:
+                    children = tree_stack[len(tree_stack) - size:]
+                    del tree_stack[len(tree_stack) - size:]
+                    tree_stack.append(ParserSymbol(productions[prod].prod_left, instance, children))
+                state = goto_value[goto_base[state_stack[-1]] + lhs[prod]]
+                state_stack.append(state)
+            else:  # accept
+                if view:
+                    tree_stack[-1].view()
+                return value_stack[-1]
+
+
+def _attribute_apply(attribute, values, info):
     ast_types = info
     if attribute:
         if len(attribute) == 1:
             if isinstance(attribute[0], int):
                 project_index = attribute[0]
-                instance = popped_syms[project_index].content  # project up
+                instance = values[project_index]  # project up
             elif isinstance(attribute[0], str):
                 prod_class = attribute[0]
-                arg = popped_syms[0].content if len(popped_syms) else None
+                arg = values[0] if values else None
                 instance = getattr(ast_types, prod_class)(arg)
             else:
                 raise Exception("Attribute Not Supported")
         elif len(attribute) == 2:
             prod_class, args_map = attribute
-            args = list(map(lambda i: popped_syms[i].content, args_map))
+            args = [values[i] for i in args_map]
             instance = getattr(ast_types, prod_class)(*args)
         else:
             raise Exception("Attribute Not Supported")
     else:
-        instance = popped_syms[0].content if len(popped_syms) else None  # project up
+        instance = values[0] if values else None  # project up
     return instance
+
+
+def _reductions(ast_types) -> tuple:  # by production index, called with the popped values
+    _Alternation = ast_types.Alternation
+    _Concatenation = ast_types.Concatenation
+    _KleeneStar = ast_types.KleeneStar
+    _KleenePlus = ast_types.KleenePlus
+    _Maybe = ast_types.Maybe
+    _Group = ast_types.Group
+    _NamedGroup = ast_types.NamedGroup
+    _MultiCharName = ast_types.MultiCharName
+    _SingleCharName = ast_types.SingleCharName
+    _PositiveSet = ast_types.PositiveSet
+    _NegativeSet = ast_types.NegativeSet
+    _MixedRange = ast_types.MixedRange
+    _Range = ast_types.Range
+    _EscapedOrShorthand = ast_types.EscapedOrShorthand
+    _Char = ast_types.Char
+    return (
+        lambda values: values[0],  # ReservedSymbol -> alt
+        lambda values: values[0],  # ReservedSymbol -> star
+        lambda values: values[0],  # ReservedSymbol -> plus
+        lambda values: values[0],  # ReservedSymbol -> minus
+        lambda values: values[0],  # ReservedSymbol -> ask
+        lambda values: values[0],  # ReservedSymbol -> acc
+        lambda values: values[0],  # ReservedSymbol -> esc
+        lambda values: values[0],  # ReservedSymbol -> dot
+        lambda values: values[0],  # ReservedSymbol -> o_par
+        lambda values: values[0],  # ReservedSymbol -> c_par
+        lambda values: values[0],  # ReservedSymbol -> o_bra
+        lambda values: values[0],  # ReservedSymbol -> c_bra
+        lambda values: values[0],  # ReservedSymbol -> gt
+        lambda values: values[0],  # ReservedSymbol -> lt
+        lambda values: _Alternation(values[0], values[2]),  # Regex -> Regex alt ConcatenationRx
+        lambda values: values[0],  # Regex -> ConcatenationRx
+        lambda values: _Concatenation(values[0], values[1]),  # ConcatenationRx -> ConcatenationRx ClosureRx
+        lambda values: values[0],  # ConcatenationRx -> ClosureRx
+        lambda values: _KleeneStar(values[0]),  # ClosureRx -> AtomRx star
+        lambda values: _KleenePlus(values[0]),  # ClosureRx -> AtomRx plus
+        lambda values: _Maybe(values[0]),  # ClosureRx -> AtomRx ask
+        lambda values: values[0],  # ClosureRx -> AtomRx
+        lambda values: values[0],  # AtomRx -> GroupRx
+        lambda values: values[0],  # AtomRx -> PositiveSetRx
+        lambda values: values[0],  # AtomRx -> NegativeSetRx
+        lambda values: values[0],  # AtomRx -> EscapedOrShorthandRx
+        lambda values: values[0],  # AtomRx -> CharRx
+        lambda values: _Group(values[1]),  # GroupRx -> o_par Regex c_par
+        lambda values: _NamedGroup(values[4], values[6]),  # GroupRx -> o_par ask p lt NameRx gt Regex c_par
+        lambda values: _MultiCharName(values[0], values[1]),  # NameRx -> char NameRx
+        lambda values: _SingleCharName(values[0]),  # NameRx -> char
+        lambda values: _PositiveSet(values[1]),  # PositiveSetRx -> o_bra SetItemsRx c_bra
+        lambda values: _NegativeSet(values[2]),  # NegativeSetRx -> o_bra acc SetItemsRx c_bra
+        lambda values: _MixedRange(values[0], values[1]),  # SetItemsRx -> SetItemsRx SetItemRx
+        lambda values: _MixedRange(values[0], values[0]),  # SetItemsRx -> SetItemRx
+        lambda values: _Range(values[0], values[2]),  # SetItemRx -> char minus char
+        lambda values: values[0],  # SetItemRx -> EscapedOrShorthandRx
+        lambda values: values[0],  # SetItemRx -> char
+        lambda values: _EscapedOrShorthand(values[0], values[1]),  # EscapedOrShorthandRx -> esc char
+        lambda values: _EscapedOrShorthand(values[0], values[1]),  # EscapedOrShorthandRx -> esc ReservedSymbol
+        lambda values: _EscapedOrShorthand(values[0], values[0]),  # EscapedOrShorthandRx -> dot
+        lambda values: _Char(values[0]),  # CharRx -> char
+        lambda values: _Char(values[0]),  # CharRx -> p
+        lambda values: values[0],  # Regex' -> Regex
+    )
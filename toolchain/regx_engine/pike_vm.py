@@ -0,0 +1,86 @@
+from typing import Dict, List, Tuple
+
+# opcodes, CHAR consumes a char of its set, SPLIT forks preferring its first target, SAVE records the position
+CHAR, SPLIT, JMP, SAVE, MATCH = range(5)
+
+
+class Program:
+    '''
+    pike vm instructions of a regex, used to extract the capture groups of a span the dfa already matched
+    groups are numbered from 1 by their opening parenthesis, group k is saved in the slots 2k and 2k + 1
+    '''
+
+    def __init__(self):
+        self.code: List[list] = []
+        self.groups = 0
+        self.names: Dict[str, int] = dict()
+
+    def __len__(self):
+        return len(self.code)
+
+    def emit(self, op, *args) -> int:
+        self.code.append([op, *args])
+        return len(self.code) - 1
+
+    def patch(self, pc: int, arg: int, target: int):
+        self.code[pc][arg] = target
+
+    def new_group(self, name: str = None) -> int:
+        self.groups += 1
+        if name is not None:
+            if name in self.names:
+                raise Exception(f"Redefinition of group {name}")
+            self.names[name] = self.groups
+        return self.groups
+
+    def captures(self, input_str: str, start: int, end: int) -> Tuple[int, ...] | None:
+        '''
+        slots of the parse of input_str[start:end] the pike vm prefers (greedy, first alternative first), the last
+        slot holds the group closed last, -1 marks what did not take part, None if the span does not match
+        '''
+        code = self.code
+        marks = [-1] * len(code)
+        size = 2 * (self.groups + 1)
+        slots = (start, end) + (-1,) * (size - 2) + (-1,)
+        threads = self._follow([], 0, slots, start, marks)
+        for pos in range(start, end):
+            char = input_str[pos]
+            following = []
+            for pc, slots in threads:
+                op = code[pc]
+                if op[0] == CHAR and char in op[1]:
+                    self._follow(following, pc + 1, slots, pos + 1, marks)
+            if not following:
+                return None
+            threads = following
+        for pc, slots in threads:  # in priority order
+            if code[pc][0] == MATCH:
+                return slots
+        return None
+
+    def _follow(self, threads: list, pc: int, slots: tuple, pos: int, marks: List[int]) -> list:
+        '''
+        adds the threads reached from pc without consuming, each pc once per position keeping the preferred one
+        '''
+        code = self.code
+        stack = [(pc, slots)]
+        while stack:
+            pc, slots = stack.pop()
+            if marks[pc] == pos:
+                continue
+            marks[pc] = pos
+            op = code[pc]
+            if op[0] == JMP:
+                stack.append((op[1], slots))
+            elif op[0] == SPLIT:  # the preferred target is popped first
+                stack.append((op[2], slots))
+                stack.append((op[1], slots))
+            elif op[0] == SAVE:
+                slot = op[1]
+                slots = slots[:slot] + (pos,) + slots[slot + 1:]
+                if slot & 1:
+                    slots = slots[:-1] + (slot // 2,)
+                stack.append((pc + 1, slots))
+            else:
+                threads.append((pc, slots))
+        return threads
@@ -1,9 +1,21 @@
-from typing import Dict
+import hashlib
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import chain, repeat
+from typing import Dict, Iterable, Iterator, Tuple, Any, List, Callable, FrozenSet
 
-from toolchain.automaton import Automaton
+from toolchain import disk_cache
+from toolchain.automaton import Automaton, State, SymbolRange, IndexedAutomaton
 from . import ast_regex as ast
 from .lexer import Lexer, MatchProvider
 from .parser import Parser
+from .pike_vm import Program, MATCH
+
+# part of the on disk cache keys, bump it whenever the compiled tables change
+ENGINE_VERSION = 3
 
 
 class DummyComplementMatcher(MatchProvider):
@@ -25,49 +37,708 @@ class DummyComplementMatcher(MatchProvider):
 
 
 class RegxMatch:
-    def __init__(self):
-        self._groups = dict()
-        self.lastgroup = None
-        self.match: str = ""
+    '''
+    match of a pattern, groups are numbered from 1 by their opening parenthesis and the named ones are reached by
+    name too, a group that did not take part is None, the groups are extracted the first time one is asked
+    '''
+
+    def __init__(self, program: Program, string: str, start: int, end: int):
+        self.program: Program = program
+        self.string: str = string
+        self._span = (start, end)
+        self._slots: Tuple[int, ...] | None = None
+
+    @property
+    def match(self) -> str:
+        return self.string[self._span[0]:self._span[1]]
+
+    @property
+    def slots(self) -> Tuple[int, ...]:
+        if self._slots is None:
+            start, end = self._span
+            if not self.program.groups:
+                self._slots = (start, end, -1)
+            elif (slots := self.program.captures(self.string, start, end)) is None:
+                raise Exception(f"The groups of {self.match} could not be extracted")
+            else:
+                self._slots = slots
+        return self._slots
+
+    def _index(self, group: int | str) -> int:
+        res = self.program.names.get(group, None) if isinstance(group, str) else group
+        if res is None or not 0 <= res <= self.program.groups:
+            raise IndexError(f"No such group {group}")
+        return res
+
+    def span(self, group: int | str = 0) -> Tuple[int, int]:
+        group = self._index(group)
+        if group == 0:
+            return self._span
+        slots = self.slots
+        return slots[2 * group], slots[2 * group + 1]
+
+    def start(self, group: int | str = 0) -> int:
+        return self.span(group)[0]
+
+    def end(self, group: int | str = 0) -> int:
+        return self.span(group)[1]
+
+    def group(self, group: int | str = 0) -> str | None:
+        start, end = self.span(group)
+        return self.string[start:end] if start >= 0 else None
 
     def __getitem__(self, item):
-        return self._groups.get(item, None)
+        return self.group(item)
+
+    def groups(self) -> tuple:
+        res = tuple(self.group(i) for i in range(1, self.program.groups + 1))
+        return res
+
+    def groupdict(self) -> dict:
+        res = {name: self.group(i) for name, i in self.program.names.items()}
+        return res
+
+    @property
+    def lastindex(self) -> int | None:
+        res = self.slots[-1]
+        return res if res > 0 else None
 
-    def __setitem__(self, key, value):
-        self._groups[key] = value
-        self.lastgroup = key
+    @property
+    def lastgroup(self) -> str | None:
+        lastindex = self.lastindex
+        res = next((name for name, i in self.program.names.items() if i == lastindex), None)
+        return res
 
     def __repr__(self):
-        res = f"0:{self.match} grp:{self._groups.items()}"
+        res = f"0:{self.match} span:{self._span} grp:{self.groupdict().items()}"
         return res
 
 
-class RegxPattern:
-    def __init__(self, compiled):
-        self.compiled: Automaton = compiled
+class DFATable:
+    '''
+    flat form of a dfa, states are numbered densely from the initial one (0) and chars are mapped to equivalence
+    classes (chars with the same transitions everywhere), class 0 holds every char without transitions
+    rows are addressed by offset (s * width) so the transition of the row at offset o with class c is
+    table[o + c], it holds the offset of the next row or -1 for the dead state
+    chars up to LATIN are classified with a dict, the wider ones searching the sorted ranges
+    '''
+    LATIN = 256
+
+    def __init__(self, dfa: Automaton, accept: Callable[[State], Any] = lambda st: True):
+        states = [dfa.initial_state]
+        index = {dfa.initial_state: 0}
+        for st in states:  # bfs numbering, grows while iterating
+            for dst in st.transitions.values():
+                if dst not in index:
+                    index[dst] = len(states)
+                    states.append(dst)
+        symbols, expanded = Automaton.expand_transitions(states)
+        signatures: Dict[Tuple, List[Any]] = dict()
+        for symbol in symbols:
+            signature = tuple(index[dst] if (dst := expanded[st].get(symbol, None)) is not None else -1
+                              for st in states)
+            signatures.setdefault(signature, []).append(symbol)
+        self.classes: Dict[str, int] = {chr(code): 0 for code in range(self.LATIN)}
+        self.starts = array("i")
+        self.ends = array("i")
+        self.range_classes = array("i")
+        self.width = len(signatures) + 1
+        self.table = array("i", repeat(-1, len(states) * self.width))
+        symbol_class = dict()
+        for cls, (signature, class_symbols) in enumerate(signatures.items(), 1):
+            for symbol in class_symbols:
+                symbol_class[symbol] = cls
+                if isinstance(symbol, SymbolRange):
+                    for code in range(symbol.first, min(symbol.last + 1, self.LATIN)):
+                        self.classes[chr(code)] = cls
+                else:
+                    self.classes[symbol] = cls
+            for src, dst in enumerate(signature):
+                self.table[src * self.width + cls] = dst * self.width if dst >= 0 else -1
+        for symbol in symbols:  # pieces come sorted
+            if isinstance(symbol, SymbolRange) and symbol.last >= self.LATIN:
+                self.starts.append(symbol.first)
+                self.ends.append(symbol.last)
+                self.range_classes.append(symbol_class[symbol])
+        # what accepts each row, indexed by offset so the matcher never divides
+        self.accepts: List[Any] = [None] * len(self.table)
+        for i, st in enumerate(states):
+            if st.final:
+                self.accepts[i * self.width] = accept(st)
+
+    def __len__(self):
+        return len(self.table) // self.width
+
+    def wide_class(self, char: str) -> int:
+        code = ord(char)
+        i = bisect_right(self.starts, code) - 1
+        return self.range_classes[i] if i >= 0 and code <= self.ends[i] else 0
+
+    def longest(self, input_str: str, pos=0) -> Tuple[int, Any]:
+        '''
+        end of the longest accepted prefix starting in pos and what its state accepts, -1 if nothing was accepted
+        '''
+        end, accept, _ = self.scan(input_str, pos)
+        return end, accept
+
+    def scan(self, input_str: str, pos=0) -> Tuple[int, Any, bool]:
+        '''
+        longest plus whether the walk was still alive at the end of the input, a longer match may need more input
+        '''
+        table, classes, accepts = self.table, self.classes, self.accepts
+        state = 0
+        last_end, last_accept = (pos, accepts[0]) if accepts[0] is not None else (-1, None)
+        input_len = len(input_str)
+        while pos < input_len:
+            if (cls := classes.get(input_str[pos], None)) is None:
+                cls = self.wide_class(input_str[pos])
+            state = table[state + cls]
+            if state < 0:
+                break
+            pos += 1
+            if accepts[state] is not None:
+                last_end, last_accept = pos, accepts[state]
+        return last_end, last_accept, state >= 0
+
+    def backward(self, input_str: str, pos=0) -> bytearray:
+        '''
+        walks the input from its end back to pos, res[i] is 1 when the state reached reading input_str[i:] backwards
+        accepts, the walk stops in the dead state
+        '''
+        table, classes, accepts = self.table, self.classes, self.accepts
+        input_len = len(input_str)
+        res = bytearray(input_len + 1)
+        res[input_len] = accepts[0] is not None
+        state = 0
+        for i in range(input_len - 1, pos - 1, -1):
+            if (cls := classes.get(input_str[i], None)) is None:
+                cls = self.wide_class(input_str[i])
+            state = table[state + cls]
+            if state < 0:
+                break
+            if accepts[state] is not None:
+                res[i] = 1
+        return res
 
-    def match(self, input_str: str, pos=0) -> str:
-        curr_state = self.compiled.initial_state
-        match = ""
-        while pos < len(input_str):
+    def munch(self, input_str: str, pos: int, failed: set) -> int:
+        '''
+        end of the longest accepted prefix for successive walks over the same input, failed keeps the (state, pos)
+        pairs from which nothing more was accepted so later walks stop there (Reps), linear over all the walks
+        '''
+        table, classes, accepts = self.table, self.classes, self.accepts
+        input_len = len(input_str)
+        stride = input_len + 1
+        state = 0
+        last_end = pos if accepts[0] is not None else -1
+        trail = []
+        while pos < input_len:
+            if (key := state * stride + pos) in failed:
+                break
+            trail.append(key)
+            if (cls := classes.get(input_str[pos], None)) is None:
+                cls = self.wide_class(input_str[pos])
+            state = table[state + cls]
+            if state < 0:
+                break
+            pos += 1
+            if accepts[state] is not None:
+                last_end = pos
+                trail.clear()
+        failed.update(trail)
+        return last_end
+
+    def accepting(self, input_str: str, pos=0) -> Iterator[Tuple[int, Any]]:
+        '''
+        every position from pos where the walk is in an accepting state and what it accepts, until the dead state
+        '''
+        table, classes, accepts = self.table, self.classes, self.accepts
+        if accepts[0] is not None:
+            yield pos, accepts[0]
+        state = 0
+        input_len = len(input_str)
+        while pos < input_len:
+            if (cls := classes.get(input_str[pos], None)) is None:
+                cls = self.wide_class(input_str[pos])
+            state = table[state + cls]
+            if state < 0:
+                return
+            pos += 1
+            if (accept := accepts[state]) is not None:
+                yield pos, accept
+
+
+class LazyDFA:
+    '''
+    dfa built while matching, it simulates the nfa and keeps the subsets reached and their transitions in a cache
+    of at most cache_size states that is flushed when full, compiling only costs indexing the nfa
+    '''
+    CACHE_SIZE = 1024
+
+    def __init__(self, nfa: Automaton, accept: Callable[[State], Any] = lambda st: True, cache_size=CACHE_SIZE):
+        if cache_size < 2:
+            raise ValueError("The cache must hold at least two states")
+        self.nfa = IndexedAutomaton(nfa)
+        self.accept: Callable[[State], Any] = accept
+        self.cache_size = cache_size
+        self.flushes = 0
+        self._flush()
+
+    def _flush(self):
+        self.ids: Dict[FrozenSet[int], int] = dict()
+        self.subsets: List[FrozenSet[int]] = []
+        self.transitions: List[Dict[str, int]] = []
+        self.accepts: List[Any] = []
+        self._add(self.nfa.closure([self.nfa.initial]))  # initial is always 0
+
+    def _add(self, subset: FrozenSet[int]) -> int:
+        res = len(self.subsets)
+        self.ids[subset] = res
+        self.subsets.append(subset)
+        self.transitions.append(dict())
+        self.accepts.append(self.accept(self.nfa.merged_state(subset)) if self.nfa.accepting(subset) else None)
+        return res
+
+    def __len__(self):
+        return len(self.subsets)
+
+    def _advance(self, state: int, char: str) -> int:
+        subset = self.nfa.step(self.subsets[state], char)
+        if not subset:
+            res = -1
+        elif (res := self.ids.get(subset, None)) is None:
+            if len(self.subsets) >= self.cache_size:
+                self.flushes += 1
+                self._flush()
+                res = self._add(subset) if subset != self.subsets[0] else 0
+                return res  # the source state was flushed, nothing to remember
+            res = self._add(subset)
+        self.transitions[state][char] = res
+        return res
+
+    def longest(self, input_str: str, pos=0) -> Tuple[int, Any]:
+        '''
+        end of the longest accepted prefix starting in pos and what its state accepts, -1 if nothing was accepted
+        '''
+        end, accept, _ = self.scan(input_str, pos)
+        return end, accept
+
+    def scan(self, input_str: str, pos=0) -> Tuple[int, Any, bool]:
+        '''
+        longest plus whether the walk was still alive at the end of the input, a longer match may need more input
+        '''
+        state = 0
+        accepts = self.accepts
+        last_end, last_accept = (pos, accepts[0]) if accepts[0] is not None else (-1, None)
+        input_len = len(input_str)
+        while pos < input_len:
             char = input_str[pos]
-            if char not in curr_state.transitions:
+            if (nxt := self.transitions[state].get(char, None)) is None:
+                nxt = self._advance(state, char)
+                accepts = self.accepts  # a flush replaces the cache
+            state = nxt
+            if state < 0:
                 break
-            curr_state = curr_state[char]
-            match += char
             pos += 1
-        return match if curr_state.final else None
+            if accepts[state] is not None:
+                last_end, last_accept = pos, accepts[state]
+        return last_end, last_accept, state >= 0
+
+    def backward(self, input_str: str, pos=0) -> bytearray:
+        '''
+        walks the input from its end back to pos, res[i] is 1 when the state reached reading input_str[i:] backwards
+        accepts, the walk stops in the dead state
+        '''
+        input_len = len(input_str)
+        res = bytearray(input_len + 1)
+        res[input_len] = self.accepts[0] is not None
+        state = 0
+        for i in range(input_len - 1, pos - 1, -1):
+            char = input_str[i]
+            if (nxt := self.transitions[state].get(char, None)) is None:
+                nxt = self._advance(state, char)
+            state = nxt
+            if state < 0:
+                break
+            if self.accepts[state] is not None:
+                res[i] = 1
+        return res
+
+    def munch(self, input_str: str, pos: int, failed: set) -> int:
+        '''
+        end of the longest accepted prefix for successive walks over the same input, failed keeps the (state, pos)
+        pairs from which nothing more was accepted so later walks stop there (Reps), linear over all the walks
+        '''
+        input_len = len(input_str)
+        stride = input_len + 1
+        state = 0
+        accepts = self.accepts
+        last_end = pos if accepts[0] is not None else -1
+        trail = []
+        flushes = self.flushes
+        while pos < input_len:
+            if (key := state * stride + pos) in failed:
+                break
+            trail.append(key)
+            char = input_str[pos]
+            if (nxt := self.transitions[state].get(char, None)) is None:
+                nxt = self._advance(state, char)
+                accepts = self.accepts
+                if self.flushes != flushes:  # the states were renumbered, what was remembered is meaningless
+                    flushes = self.flushes
+                    failed.clear()
+                    trail.clear()
+            state = nxt
+            if state < 0:
+                break
+            pos += 1
+            if accepts[state] is not None:
+                last_end = pos
+                trail.clear()
+        failed.update(trail)
+        return last_end
+
+    def accepting(self, input_str: str, pos=0) -> Iterator[Tuple[int, Any]]:
+        '''
+        every position from pos where the walk is in an accepting state and what it accepts, until the dead state
+        '''
+        if self.accepts[0] is not None:
+            yield pos, self.accepts[0]
+        state = 0
+        input_len = len(input_str)
+        while pos < input_len:
+            char = input_str[pos]
+            if (nxt := self.transitions[state].get(char, None)) is None:
+                nxt = self._advance(state, char)
+            state = nxt
+            if state < 0:
+                return
+            pos += 1
+            if (accept := self.accepts[state]) is not None:
+                yield pos, accept
+
+
+class TaggedDFA:
+    '''
+    unanchored dfa that also tracks where the matches start, built while matching like LazyDFA, a walk of the nfa
+    starts in every position and its states are the nfa states reached grouped by the start of the earliest walk
+    reaching them, ordered from the earliest, every group keeps that start in a register and the transitions tell
+    from which register each one is copied (a tagged dfa, Laurikari), so the leftmost start of every match is known
+    in the same pass, at the cost of copying a register per live start
+    '''
+    CACHE_SIZE = LazyDFA.CACHE_SIZE
+
+    def __init__(self, nfa: Automaton, cache_size=CACHE_SIZE):
+        if cache_size < 2:
+            raise ValueError("The cache must hold at least two states")
+        self.nfa = IndexedAutomaton(nfa)
+        self.tags: List[Tuple[int, ...]] = [RegxSet.matched(st) if st.final else () for st in self.nfa.states]
+        self.initial: Tuple[FrozenSet[int], ...] = (self.nfa.closure([self.nfa.initial]),)
+        self.cache_size = cache_size
+        self.flushes = 0
+        self._flush()
+
+    def _flush(self):
+        self.ids: Dict[Tuple[FrozenSet[int], ...], int] = dict()
+        self.subsets: List[Tuple[FrozenSet[int], ...]] = []
+        # next state and the register each of its groups is copied from, -1 starts there
+        self.transitions: List[Dict[str, Tuple[int, Tuple[int, ...]]]] = []
+        self.accepts: List[Tuple[Tuple[int, int], ...]] = []
+        self._add(self.initial)  # initial is always 0
+
+    def _add(self, groups: Tuple[FrozenSet[int], ...]) -> int:
+        res = len(self.subsets)
+        self.ids[groups] = res
+        self.subsets.append(groups)
+        self.transitions.append(dict())
+        first = dict()  # the earliest walk accepting each pattern
+        for register, group in enumerate(groups):
+            for i in group:
+                for pattern_id in self.tags[i]:
+                    first.setdefault(pattern_id, register)
+        self.accepts.append(tuple(sorted(first.items())))
+        return res
+
+    def __len__(self):
+        return len(self.subsets)
+
+    def _advance(self, state: int, char: str) -> Tuple[int, Tuple[int, ...]]:
+        groups = []
+        sources = []
+        seen = frozenset()
+        for register, group in enumerate(self.subsets[state]):
+            if reached := self.nfa.step(group, char) - seen:  # an earlier walk got to the rest first
+                seen |= reached
+                groups.append(reached)
+                sources.append(register)
+        if started := self.initial[0] - seen:
+            groups.append(started)
+            sources.append(-1)
+        groups = tuple(groups)
+        sources = tuple(sources)
+        if (res := self.ids.get(groups, None)) is None:
+            if len(self.subsets) >= self.cache_size:
+                self.flushes += 1
+                self._flush()
+                res = self._add(groups) if groups != self.initial else 0
+                return res, sources  # the source state was flushed, nothing to remember
+            res = self._add(groups)
+        self.transitions[state][char] = (res, sources)
+        return res, sources
+
+    def scan(self, input_str: str, pos=0) -> Iterator[Tuple[int, int, int]]:
+        '''
+        (pattern id, start, end) of every end of a match in input_str[pos:] with the leftmost start matching until it,
+        by end and then by id
+        '''
+        for pattern_id, _ in self.accepts[0]:
+            yield pattern_id, pos, pos
+        transitions, accepts = self.transitions, self.accepts
+        registers = [pos]
+        state = 0
+        input_len = len(input_str)
+        while pos < input_len:
+            char = input_str[pos]
+            pos += 1
+            if (move := transitions[state].get(char, None)) is None:
+                move = self._advance(state, char)
+                transitions, accepts = self.transitions, self.accepts  # a flush replaces the cache
+            state, sources = move
+            registers = [registers[i] if i >= 0 else pos for i in sources]
+            if accepts[state]:
+                for pattern_id, register in accepts[state]:
+                    yield pattern_id, registers[register], pos
+
+
+class RegxPattern:
+    '''
+    the dfa finds where the matches end, the reverse one (unanchored and run from the end of the input) marks where
+    they start so searching takes the leftmost start and the longest match from it, all in linear time
+    the groups are filled by the pike vm of the program over the matched span only
+    '''
+
+    def __init__(self, table: DFATable | LazyDFA, reverse: DFATable | LazyDFA, program: Program):
+        self.table: DFATable | LazyDFA = table
+        self.reverse: DFATable | LazyDFA = reverse
+        self.program: Program = program
+
+    def match(self, input_str: str, pos=0) -> str | None:
+        '''
+        longest prefix accepted starting in pos, None if there is none
+        '''
+        end, _ = self.table.longest(input_str, pos)
+        return input_str[pos:end] if end >= 0 else None
+
+    def fullmatch(self, input_str: str, pos=0) -> RegxMatch | None:
+        end, _ = self.table.longest(input_str, pos)
+        return RegxMatch(self.program, input_str, pos, end) if end == len(input_str) else None
+
+    def search(self, input_str: str, pos=0) -> RegxMatch | None:
+        '''
+        leftmost longest match starting from pos
+        '''
+        if (start := self.reverse.backward(input_str, pos).find(1, pos)) < 0:
+            return None
+        end, _ = self.table.longest(input_str, start)
+        return RegxMatch(self.program, input_str, start, end)
+
+    def finditer(self, input_str: str, pos=0) -> Iterator[RegxMatch]:
+        '''
+        leftmost longest matches that do not overlap, after an empty match the next one starts a char later
+        '''
+        starts = self.reverse.backward(input_str, pos)
+        failed = set()
+        while (start := starts.find(1, pos)) >= 0:
+            end = self.table.munch(input_str, start, failed)
+            yield RegxMatch(self.program, input_str, start, end)
+            pos = end if end > start else end + 1
+
+    def findall(self, input_str: str, pos=0) -> List[str]:
+        res = [m.match for m in self.finditer(input_str, pos)]
+        return res
+
+
+class RegxTokenizer:
+    '''
+    union of several token patterns in one dfa, the final states are tagged with the (priority, name) of the tokens
+    they accept, match takes the longest prefix and on ties the token with lower priority
+    '''
+
+    def __init__(self, table: DFATable | LazyDFA):
+        self.table: DFATable | LazyDFA = table
+
+    @staticmethod
+    def winner(state: State):
+        tags = [tag for tag in state.content if isinstance(tag, tuple)]
+        return min(tags)[1]
+
+    def match(self, input_str: str, pos=0) -> Tuple[Any, str | None]:
+        end, name = self.table.longest(input_str, pos)
+        return (name, input_str[pos:end]) if end >= 0 else (None, None)
+
+    def scan(self, input_str: str, pos=0) -> Tuple[Any, str | None, bool]:
+        '''
+        match plus whether the token could go on after the end of the input
+        '''
+        end, name, alive = self.table.scan(input_str, pos)
+        return (name, input_str[pos:end], alive) if end >= 0 else (None, None, alive)
+
+
+class RegxSet:
+    '''
+    many patterns scanned at once, one unanchored dfa of all of them with the final states tagged with the ids of the
+    patterns they accept finds in a single pass every end of a match of any of them, the pass costs the same for any
+    number of patterns, scan finds the starts too in a single pass of the tagged dfa of the same union, it pays a
+    copy of the registers on the chars that move them, bounded by the states of the nfa
+    '''
+
+    def __init__(self, table: DFATable | LazyDFA, starts: TaggedDFA, size: int):
+        self.table: DFATable | LazyDFA = table
+        self.starts: TaggedDFA = starts
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def matched(state: State) -> Tuple[int, ...]:
+        res = tuple(sorted(tag for tag in state.content if isinstance(tag, int)))
+        return res
+
+    def ends(self, input_str: str, pos=0) -> Iterator[Tuple[int, int]]:
+        '''
+        (pattern id, end) of every match of the patterns in input_str[pos:], by end and then by id
+        '''
+        for end, ids in self.table.accepting(input_str, pos):
+            for pattern_id in ids:
+                yield pattern_id, end
+
+    def scan(self, input_str: str, pos=0) -> Iterator[Tuple[int, int, int]]:
+        '''
+        (pattern id, start, end) of every end of a match in input_str[pos:] with the leftmost start matching until it
+        '''
+        return self.starts.scan(input_str, pos)
 
 
 class RegxEngine:
-    def __init__(self):
+    '''
+    compiled patterns are kept in a lru cache, with a cache_dir (or the REGX_CACHE_DIR environment variable) the
+    compiled tables are also pickled there keyed by the pattern and ENGINE_VERSION so other processes reuse them
+    '''
+    CACHE_SIZE = 256
+
+    def __init__(self, cache_dir=None):
         self.tokeizer = Lexer(DummyComplementMatcher())
         self.parser = Parser(ast)
+        self.cache: OrderedDict = OrderedDict()
+        self.cache_dir: str | None = cache_dir if cache_dir is not None else os.environ.get("REGX_CACHE_DIR", None)
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    def _disk_path(self, key) -> str:
+        digest = hashlib.sha256(repr((ENGINE_VERSION, key)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"regx-{digest}.pickle")
+
+    def _cached(self, key, build: Callable[[], Any], persistent: bool):
+        if (res := self.cache.get(key, None)) is not None:
+            self.cache.move_to_end(key)
+            return res
+        persistent = persistent and self.cache_dir is not None
+        if not persistent or (res := disk_cache.load(self._disk_path(key))) is None:
+            res = build()
+            if persistent:
+                disk_cache.store(self._disk_path(key), res)
+        self.cache[key] = res
+        if len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return res
 
-    def compile(self, regex_str) -> RegxPattern:
+    def _ast(self, regex_str) -> ast.Atom:
         tokens = self.tokeizer(regex_str)
         reg_ast = self.parser(tokens)
+        return reg_ast
+
+    def _nfa(self, regex_str) -> Automaton:
+        nfa = self._ast(regex_str).eval()
+        return nfa
+
+    def compile(self, regex_str, minimize=True, lazy=False, cache_size=LazyDFA.CACHE_SIZE) -> RegxPattern:
+        '''
+        lazy builds the dfa states while matching keeping at most cache_size of them, for patterns with huge dfas
+        '''
+        key = ("pattern", regex_str, minimize, lazy, cache_size if lazy else None)
+        res = self._cached(key, lambda: self._compile(regex_str, minimize, lazy, cache_size), not lazy)
+        return res
+
+    def _compile(self, regex_str, minimize, lazy, cache_size) -> RegxPattern:
+        reg_ast = self._ast(regex_str)
         nfa = reg_ast.eval()
+        program = Program()
+        reg_ast.emit(program)
+        program.emit(MATCH)
+        reverse = nfa.reverse()
+        any_char = SymbolRange(0, sys.maxunicode)
+        reverse.initial_state[any_char] = reverse.initial_state  # unanchored, matches may end anywhere
+        if lazy:
+            return RegxPattern(LazyDFA(nfa, cache_size=cache_size), LazyDFA(reverse, cache_size=cache_size), program)
+        dfa = nfa.minimize() if minimize else nfa.get_dfa()
+        reverse_dfa = reverse.minimize() if minimize else reverse.get_dfa()
+        res = RegxPattern(DFATable(dfa), DFATable(reverse_dfa), program)
+        return res
+
+    def compile_tokens(self, tokens: Iterable[Tuple[Any, str]], minimize=True, lazy=False,
+                       cache_size=LazyDFA.CACHE_SIZE) -> RegxTokenizer:
+        '''
+        compiles (name, regex) pairs in one tokenizer, the earlier a token comes the higher its priority
+        '''
+        tokens = tuple(tokens)
+        key = ("tokens", tokens, minimize, lazy, cache_size if lazy else None)
+        res = self._cached(key, lambda: self._compile_tokens(tokens, minimize, lazy, cache_size), not lazy)
+        return res
+
+    def _compile_tokens(self, tokens, minimize, lazy, cache_size) -> RegxTokenizer:
+        nfas = []
+        for priority, (name, regex_str) in enumerate(tokens):
+            nfa = self._nfa(regex_str)
+            for st in nfa.final_states:
+                st.content = {(priority, name)}
+            nfas.append(nfa)
+        nfa = Automaton.union(nfas)
+        if lazy:
+            return RegxTokenizer(LazyDFA(nfa, RegxTokenizer.winner, cache_size))
+        dfa = nfa.get_dfa()
+        if minimize:
+            for st in dfa.final_states:  # only the winner matters, states accepting the same token can be merged
+                st.content = {min(tag for tag in st.content if isinstance(tag, tuple))}
+            dfa = dfa.minimize()
+        res = RegxTokenizer(DFATable(dfa, RegxTokenizer.winner))
+        return res
+
+    def compile_set(self, patterns: Iterable[str], minimize=True, lazy=False, cache_size=LazyDFA.CACHE_SIZE) -> RegxSet:
+        '''
+        compiles the patterns to be scanned in one pass, they are reported by their index
+        '''
+        patterns = tuple(patterns)
+        key = ("set", patterns, minimize, lazy, cache_size if lazy else None)
+        res = self._cached(key, lambda: self._compile_set(patterns, minimize, lazy, cache_size), not lazy)
+        return res
+
+    def _compile_set(self, patterns, minimize, lazy, cache_size) -> RegxSet:
+        nfas = []
+        for pattern_id, regex_str in enumerate(patterns):
+            nfa = self._nfa(regex_str)
+            for st in nfa.final_states:
+                st.content = {pattern_id}
+            nfas.append(nfa)
+        nfa = Automaton.union(nfas)
+        starts = TaggedDFA(nfa, cache_size)  # indexed before the loop, its walks start anywhere by themselves
+        nfa.initial_state[SymbolRange(0, sys.maxunicode)] = nfa.initial_state  # unanchored, matches start anywhere
+        if lazy:
+            return RegxSet(LazyDFA(nfa, RegxSet.matched, cache_size), starts, len(patterns))
         dfa = nfa.get_dfa()
-        res = RegxPattern(dfa)
+        if minimize:
+            for st in dfa.states:  # only the ids matter, states accepting the same patterns can be merged
+                st.content = frozenset(RegxSet.matched(st)) if st.final else None
+            dfa = dfa.minimize()
+        res = RegxSet(DFATable(dfa, RegxSet.matched), starts, len(patterns))
         return res